@@ -0,0 +1,154 @@
+"""HamContestAnalysis storage catalog CLI definition."""
+from logging import getLogger
+from typing import List
+from typing import Optional
+
+from pandas import concat
+from pandas import read_parquet
+from typer import Option
+from typer import Typer
+from typer import echo
+
+from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.config.storage import ParquetProfileSettings
+from hamcontestanalysis.data.catalog import get_catalog
+from hamcontestanalysis.data.migrations import PROCESSING_VERSION
+from hamcontestanalysis.data.migrations import upgrade_all
+from hamcontestanalysis.data.parquet import benchmark_profiles
+
+
+app = Typer(name="catalog", add_completion=False)
+logger = getLogger(__name__)
+
+
+@app.command()
+def sync() -> None:
+    """Register in the catalog the partitions stored before it existed."""
+    settings = get_settings()
+    added = get_catalog().sync(prefix=settings.storage.prefix)
+    echo(f"{added} partitions added to the catalog")
+
+
+@app.command(name="list")
+def list_partitions(
+    kind: Optional[str] = Option(
+        None, "--kind", help="Kind of partition, e.g. contest, rbn or rbn_date."
+    ),
+    contest: Optional[str] = Option(None, "--contest", help="Name of the contest."),
+    mode: Optional[str] = Option(None, "--mode", help="Mode of the contest."),
+    year: Optional[int] = Option(None, "--year", help="Year of the contest."),
+) -> None:
+    """List the partitions stored locally."""
+    partitions = get_catalog().list_partitions(
+        kind=kind, contest=contest, mode=mode, year=year
+    )
+    columns = ["kind", "contest", "mode", "year", "callsign", "date", "rows", "bytes"]
+    echo(partitions.loc[:, columns].to_string(index=False))
+
+
+@app.command()
+def logs(
+    contest: Optional[str] = Option(None, "--contest", help="Name of the contest."),
+    mode: Optional[str] = Option(None, "--mode", help="Mode of the contest."),
+    year: Optional[int] = Option(None, "--year", help="Year of the contest."),
+    category_operator: Optional[str] = Option(
+        None, "--category_operator", help="e.g. SINGLE-OP or MULTI-OP."
+    ),
+    category_band: Optional[str] = Option(
+        None, "--category_band", help="e.g. ALL or 20M."
+    ),
+    category_power: Optional[str] = Option(
+        None, "--category_power", help="e.g. HIGH, LOW or QRP."
+    ),
+    continent: Optional[str] = Option(
+        None, "--continent", help="Continent of the station, e.g. EU."
+    ),
+) -> None:
+    """List the stored logs by the categories in their header."""
+    metadata = get_catalog().list_log_metadata(
+        contest=contest,
+        mode=mode,
+        year=year,
+        category_operator=category_operator,
+        category_band=category_band,
+        category_power=category_power,
+        continent=continent,
+    )
+    columns = [
+        "contest",
+        "mode",
+        "year",
+        "callsign",
+        "category_operator",
+        "category_band",
+        "category_power",
+        "category_assisted",
+        "continent",
+        "claimed_score",
+    ]
+    echo(metadata.loc[:, columns].to_string(index=False))
+
+
+@app.command()
+def migrate(
+    workers: int = Option(4, "--workers", help="Number of logs upgraded in parallel."),
+) -> None:
+    """Upgrade the stored logs processed by an older version, from local data."""
+    upgraded = upgrade_all(workers=workers)
+    echo(f"{upgraded} logs upgraded to processing version {PROCESSING_VERSION}")
+
+
+@app.command()
+def benchmark(
+    kinds: List[str] = Option(
+        ["contest", "rbn_date"], "--kinds", help="Kinds of partition to sample."
+    ),
+    samples: int = Option(5, "--samples", help="Partitions sampled of each kind."),
+    repeat: int = Option(3, "--repeat", help="Runs of each write and read."),
+) -> None:
+    """Compare the size, write and read time of the Parquet profiles on local data.
+
+    Each kind of partition is benchmarked with every profile in the storage
+    settings, and with the default layout of pandas as baseline.
+    """
+    profiles = {
+        "default": ParquetProfileSettings(),
+        **get_settings().storage.parquet_profiles,
+    }
+    results = []
+    for kind in kinds:
+        partitions = get_catalog().list_partitions(kind=kind)
+        if partitions.empty:
+            logger.warning(f"No {kind} partitions stored, run catalog sync first")
+            continue
+        paths = partitions["path"].sample(
+            n=min(samples, len(partitions)), random_state=0
+        )
+        data = concat([read_parquet(p) for p in paths], ignore_index=True)
+        logger.info(f"Benchmark {kind}: {len(paths)} partitions, {len(data)} rows")
+        results.append(
+            benchmark_profiles(data=data, profiles=profiles, repeat=repeat).assign(
+                kind=kind, rows=len(data)
+            )
+        )
+    if results:
+        columns = ["kind", "rows", "profile", "compression", "bytes"]
+        echo(
+            concat(results)
+            .loc[:, columns + ["write_s", "read_s"]]
+            .to_string(index=False, float_format="{:.4f}".format)
+        )
+
+
+@app.command()
+def validate(
+    checksums: bool = Option(
+        False, "--checksums", help="Also verify the checksum of each file."
+    ),
+) -> None:
+    """Check that the files of the catalogued partitions are unchanged."""
+    invalid = get_catalog().validate(checksums=checksums)
+    if invalid.empty:
+        echo("All partitions are valid")
+        return
+    echo(invalid.loc[:, ["path", "problem"]].to_string(index=False))
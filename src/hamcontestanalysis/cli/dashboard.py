@@ -4,8 +4,7 @@ from logging import getLogger
 from typer import Option
 from typer import Typer
 
-from hamcontestanalysis.modules.dashboard.contest_analysis import main as _main_contest
-from hamcontestanalysis.modules.dashboard.snr_analysis import main as _main_snr
+from hamcontestanalysis.modules.dashboard.startup import get_startup_timer
 
 
 app = Typer(name="dashboard", add_completion=False)
@@ -27,7 +26,11 @@ def contest_analysis(
         port,
     )
 
-    _main_contest(debug=debug, host=host, port=port)
+    # Imported here, so that each dashboard only imports its own modules
+    with get_startup_timer().phase("imports"):
+        from hamcontestanalysis.modules.dashboard.contest_analysis import main
+
+    main(debug=debug, host=host, port=port)
 
 
 @app.command()
@@ -45,4 +48,6 @@ def snr_analysis(
         port,
     )
 
-    _main_snr(debug=debug, host=host, port=port)
+    from hamcontestanalysis.modules.dashboard.snr_analysis import main
+
+    main(debug=debug, host=host, port=port)
@@ -1,10 +1,13 @@
 """HamContestAnalysis Download CLI definition."""
+from datetime import datetime
 from logging import getLogger
 from typing import List
 
 from typer import Option
 from typer import Typer
 
+from hamcontestanalysis.modules.download.main import calibrate_rbn_data
+from hamcontestanalysis.modules.download.main import download_rbn_dates
 from hamcontestanalysis.modules.download.main import main as _main
 
 
@@ -56,3 +59,79 @@ def main(
     )
 
     _main(contest=contest, years=years, callsigns=callsigns, mode=mode, force=force)
+
+
+@app.command()
+def rbn_calibration(
+    contest: str = Option(..., "--contest", help="Name of the contest, e.g. cqww."),
+    years: List[int] = Option(
+        ...,
+        "--years",
+        help=(
+            "Years to be considered. Can be specified multiple times for multiple "
+            "years."
+        ),
+    ),
+    mode: str = Option("cw", "--mode", help="mode of the contest. Defaults to cw."),
+    force: bool = Option(
+        False,
+        "--force",
+        help=("Recompute the calibration even if it exists locally."),
+    ),
+) -> None:
+    """Compute the RBN skimmer SNR calibration of downloaded contest editions."""
+    logger.info(
+        "Starting RBN calibration with the following commands: "
+        "Contest = %s | Years = %s | Mode = %s",
+        contest,
+        years,
+        mode,
+    )
+
+    calibrate_rbn_data(contest=contest, years=years, mode=mode, force=force)
+
+
+@app.command()
+def rbn(
+    start_date: datetime = Option(
+        ..., "--start_date", formats=["%Y-%m-%d"], help="First day, e.g. 2023-06-10."
+    ),
+    end_date: datetime = Option(
+        ...,
+        "--end_date",
+        formats=["%Y-%m-%d"],
+        help="Last day (included), e.g. 2023-06-11.",
+    ),
+    modes: List[str] = Option(
+        ["cw"],
+        "--modes",
+        help=(
+            "Transmission modes of the spots, e.g. cw, rtty, ft8. Can be specified "
+            "multiple times for multiple modes. Defaults to cw."
+        ),
+    ),
+    workers: int = Option(
+        4, "--workers", help="Number of days downloaded in parallel. Defaults to 4."
+    ),
+    force: bool = Option(
+        False,
+        "--force",
+        help=("Force the download even if the days exist locally."),
+    ),
+) -> None:
+    """Download RBN spots for an arbitrary date range, outside of contests."""
+    logger.info(
+        "Starting RBN download with the following commands: "
+        "Start date = %s | End date = %s | Modes = %s",
+        start_date.date(),
+        end_date.date(),
+        modes,
+    )
+
+    download_rbn_dates(
+        start_date=start_date.date(),
+        end_date=end_date.date(),
+        modes=modes,
+        workers=workers,
+        force=force,
+    )
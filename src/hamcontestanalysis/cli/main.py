@@ -1,9 +1,11 @@
 """HamContestAnalysis Command Line Interface application definition."""
 from typer import Typer
 
+from hamcontestanalysis.cli.catalog import app as app_catalog
 from hamcontestanalysis.cli.dashboard import app as app_dashboard
 from hamcontestanalysis.cli.download import app as app_download
 from hamcontestanalysis.cli.plot import app as app_plot
+from hamcontestanalysis.cli.report import app as app_report
 from hamcontestanalysis.commons.logging import config_logging
 
 
@@ -11,4 +13,6 @@ app = Typer(name="hamcontestanalysis", add_completion=False)
 app.add_typer(app_download)
 app.add_typer(app_dashboard)
 app.add_typer(app_plot)
+app.add_typer(app_catalog)
+app.add_typer(app_report)
 app.callback()(config_logging)
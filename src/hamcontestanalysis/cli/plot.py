@@ -289,6 +289,11 @@ def band_conditions(
         "--continents",
         help=("Continents to plot"),
     ),
+    out_of_core: bool = Option(
+        False,
+        "--out_of_core",
+        help=("Stream the RBN data in batches instead of loading it in memory"),
+    ),
 ):
     """Band conditions from RBN plot."""
     years = [pair.split(",")[1] for pair in callsigns_years]
@@ -299,6 +304,7 @@ def band_conditions(
         time_bin_size=time_bin_size,
         reference=reference,
         continents=continents,
+        out_of_core=out_of_core,
     )
     plot.plot(save=True)
 
@@ -324,6 +330,11 @@ def cw_speed(
         "--time_bin_size",
         help=("Size of the time bins, default: 60"),
     ),
+    out_of_core: bool = Option(
+        False,
+        "--out_of_core",
+        help=("Stream the RBN data in batches instead of loading it in memory"),
+    ),
 ):
     """CW speed plot."""
     callsigns_years = [pair.split(",") for pair in callsigns_years]
@@ -332,6 +343,7 @@ def cw_speed(
         mode=mode,
         callsigns_years=callsigns_years,
         time_bin_size=time_bin_size,
+        out_of_core=out_of_core,
     )
     plot.plot(save=True)
 
@@ -362,6 +374,11 @@ def number_rbn_spots(
         "--rx_continents",
         help=("Continents to consider for RX"),
     ),
+    out_of_core: bool = Option(
+        False,
+        "--out_of_core",
+        help=("Stream the RBN data in batches instead of loading it in memory"),
+    ),
 ):
     """Number of RBN spots plot."""
     callsigns_years = [pair.split(",") for pair in callsigns_years]
@@ -371,6 +388,7 @@ def number_rbn_spots(
         callsigns_years=callsigns_years,
         time_bin_size=time_bin_size,
         rx_continents=rx_continents,
+        out_of_core=out_of_core,
     )
     plot.plot(save=True)
 
@@ -401,6 +419,16 @@ def snr(
         "--rx_continents",
         help=("Continents to consider for RX"),
     ),
+    calibrated: bool = Option(
+        False,
+        "--calibrated",
+        help=("Correct the SNR with the skimmer calibration of the contest"),
+    ),
+    out_of_core: bool = Option(
+        False,
+        "--out_of_core",
+        help=("Stream the RBN data in batches instead of loading it in memory"),
+    ),
 ):
     """Average SNR plot."""
     callsigns_years = [pair.split(",") for pair in callsigns_years]
@@ -410,6 +438,8 @@ def snr(
         callsigns_years=callsigns_years,
         time_bin_size=time_bin_size,
         rx_continents=rx_continents,
+        calibrated=calibrated,
+        out_of_core=out_of_core,
     )
     plot.plot(save=True)
 
@@ -450,6 +480,11 @@ def snr_band_continent(
         "--rx_continents",
         help=("Continents to consider for RX"),
     ),
+    calibrated: bool = Option(
+        False,
+        "--calibrated",
+        help=("Correct the SNR with the skimmer calibration of the contest"),
+    ),
 ):
     """Average SNR plot per band and continent."""
     plot = PlotSnrBandContinent(
@@ -460,5 +495,6 @@ def snr_band_continent(
         year=year,
         time_bin_size=time_bin_size,
         rx_continents=rx_continents,
+        calibrated=calibrated,
     )
     plot.plot(save=True)
@@ -0,0 +1,58 @@
+"""HamContestAnalysis Report CLI definition."""
+from logging import getLogger
+from typing import List
+from typing import Optional
+
+from typer import Option
+from typer import Typer
+
+from hamcontestanalysis.modules.report.main import main as _main
+
+
+app = Typer(name="report", add_completion=False)
+logger = getLogger(__name__)
+
+
+@app.command()
+def html(
+    contest: str = Option(..., "--contest", help="Name of the contest, e.g. cqww."),
+    mode: str = Option(
+        ...,
+        "--mode",
+        help="Mode of the contest. Only available options: cw, " "ssb, rrty, mixed.",
+    ),
+    callsigns_years: List[str] = Option(
+        ...,
+        "--callsigns_years",
+        help=(
+            "Callsign,year to be considered. Can be specified multiple times for "
+            "multiple callsigns and year pairs."
+        ),
+    ),
+    output: str = Option("report", "--output", help="Folder of the report."),
+    workers: Optional[int] = Option(
+        None,
+        "--workers",
+        help="Processes building the figures. Defaults to the number of CPUs.",
+    ),
+    rbn: bool = Option(
+        True, "--rbn/--no-rbn", help="Include the RBN plots. Defaults to True."
+    ),
+) -> None:
+    """Static HTML report with all the plots and summary tables of a set of logs."""
+    logger.info(
+        "Starting report with the following commands: "
+        "Contest = %s | Mode = %s | Callsigns and years: %s | Output = %s",
+        contest,
+        mode,
+        callsigns_years,
+        output,
+    )
+    _main(
+        contest=contest,
+        mode=mode,
+        callsigns_years=[pair.split(",") for pair in callsigns_years],
+        output=output,
+        workers=workers,
+        rbn=rbn,
+    )
@@ -0,0 +1,96 @@
+"""Parsing of the Cabrillo log header."""
+from typing import Any
+from typing import Dict
+from typing import Mapping
+from typing import Optional
+
+
+# Cabrillo header tags kept as metadata of each log, and the field they are stored in
+HEADER_FIELDS = {
+    "CALLSIGN": "callsign",
+    "CATEGORY-OPERATOR": "category_operator",
+    "CATEGORY-POWER": "category_power",
+    "CATEGORY-BAND": "category_band",
+    "CATEGORY-ASSISTED": "category_assisted",
+    "CATEGORY-MODE": "category_mode",
+    "CATEGORY-STATION": "category_station",
+    "CATEGORY-TRANSMITTER": "category_transmitter",
+    "CATEGORY-OVERLAY": "category_overlay",
+    "CLAIMED-SCORE": "claimed_score",
+    "CLUB": "club",
+    "LOCATION": "location",
+    "GRID-LOCATOR": "grid_locator",
+    "OPERATORS": "operators",
+    "CREATED-BY": "created_by",
+}
+
+# Tokens of the Cabrillo v2 `CATEGORY` tag, e.g. "SINGLE-OP ALL HIGH"
+CATEGORY_V2_TOKENS = {
+    "category_operator": ["SINGLE-OP", "MULTI-OP", "CHECKLOG"],
+    "category_power": ["HIGH", "LOW", "QRP"],
+    "category_band": [
+        "ALL",
+        "160M",
+        "80M",
+        "40M",
+        "20M",
+        "15M",
+        "10M",
+    ],
+}
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    """Parse an integer such as a claimed score, which may have separators."""
+    if value is None:
+        return None
+    digits = value.replace(",", "").replace(".", "").strip()
+    return int(digits) if digits.isdigit() else None
+
+
+def _parse_category_v2(value: str) -> Dict[str, Any]:
+    """Parse the Cabrillo v2 `CATEGORY` tag into the v3 category fields."""
+    tokens = value.upper().split()
+    fields = {
+        field: next((t for t in tokens if t in options), None)
+        for field, options in CATEGORY_V2_TOKENS.items()
+    }
+    if any(t.startswith("MULTI") for t in tokens):
+        fields["category_operator"] = "MULTI-OP"
+        fields["category_transmitter"] = next(
+            (t for t in tokens if t.startswith("MULTI")), None
+        )
+    fields["category_assisted"] = "ASSISTED" in tokens or None
+    return fields
+
+
+def parse_cabrillo_header(header: Mapping[str, str]) -> Dict[str, Any]:
+    """Parse the tags of a Cabrillo header into typed metadata fields.
+
+    Categories are upper-cased, `category_assisted` is a boolean and `claimed_score`
+    an integer. Cabrillo v2 logs, which have a single `CATEGORY` tag, are mapped to the
+    same fields. Missing tags are set to None.
+
+    Args:
+        header (Mapping[str, str]): Tags of the Cabrillo header and their values
+
+    Returns:
+        Dict[str, Any]: Metadata fields of the log
+    """
+    tags = {k.strip().upper(): v.strip() for k, v in header.items() if v is not None}
+    metadata = {field: tags.get(tag) or None for tag, field in HEADER_FIELDS.items()}
+
+    if "CATEGORY" in tags:
+        for field, value in _parse_category_v2(tags["CATEGORY"]).items():
+            if metadata.get(field) is None:
+                metadata[field] = value
+
+    for field in [f for f in metadata if f.startswith("category_")]:
+        if isinstance(metadata[field], str):
+            metadata[field] = metadata[field].upper()
+    if isinstance(metadata["category_assisted"], str):
+        metadata["category_assisted"] = metadata["category_assisted"] == "ASSISTED"
+    if metadata["callsign"] is not None:
+        metadata["callsign"] = metadata["callsign"].upper()
+    metadata["claimed_score"] = _parse_int(metadata["claimed_score"])
+    return metadata
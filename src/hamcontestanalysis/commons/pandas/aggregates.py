@@ -0,0 +1,128 @@
+"""Per-minute aggregates of the contest logs, and their rollups.
+
+Most contest plots and tables count or sum the QSOs of each log by time bin, band or
+continent. The QSOs of each log are aggregated once, when the log is processed, into
+one row per contest minute, band and continent. Any coarser time bin, and any other
+grouping of those keys, is then a rollup of these rows, whose number is bounded by
+the length of the contest instead of by the number of QSOs.
+
+The aggregates have the columns:
+
+- keys: contest, mycall, year, minute, band, band_id and continent, where minute is
+  the minute of the contest, counted from the same start as the `hour` of the QSOs
+- qsos: number of QSOs
+- sums: flags and points of the QSOs, with their own names, e.g. is_valid or
+  qso_points, which are summed by rollups
+- means: `sum_{column}` and `count_{column}`, so that means remain exact after
+  rollups, e.g. of diff_contest_score
+- lasts: value of the cumulative columns at the last QSO, e.g. cum_contest_score,
+  with the position of that QSO in the log
+"""
+from typing import List
+from typing import Optional
+
+import numpy as np
+from pandas import DataFrame
+
+
+LOG_KEYS = ["contest", "mycall", "year"]
+MINUTE_KEYS = ["minute", "band", "band_id", "continent"]
+SUM_COLUMNS = ["is_valid", "qso_points", "n_mult", "is_mult", "is_zone", "is_dxcc"]
+MEAN_COLUMNS = [
+    "cum_points_per_qso",
+    "diff_contest_score",
+    "mult_worth_points",
+    "mult_worth_qsos",
+]
+LAST_COLUMNS = ["cum_valid_qsos", "cum_qso_points", "cum_mult", "cum_contest_score"]
+
+
+def contest_minute(hour: np.ndarray) -> np.ndarray:
+    """Minute of the contest of each QSO, from its hour of the contest.
+
+    Args:
+        hour (np.ndarray): Hours since the start of the contest
+
+    Returns:
+        np.ndarray: Whole minutes since the start of the contest, rounded to the
+            second first so that the float hours do not fall in the previous minute
+    """
+    return (np.round(np.asarray(hour, dtype=np.float64) * 3600) // 60).astype(np.int64)
+
+
+def minute_aggregates(data: DataFrame) -> DataFrame:
+    """Aggregate the QSOs of processed logs by contest minute, band and continent.
+
+    Only the columns present in the data are aggregated, so that logs of every
+    contest, and partial loads, can be aggregated.
+
+    Args:
+        data (DataFrame): Processed logs, with at least mycall, year and hour
+
+    Returns:
+        DataFrame: Aggregates, with one row per log, minute, band and continent
+    """
+    keys = [c for c in LOG_KEYS + MINUTE_KEYS if c in data.columns or c == "minute"]
+    sums = [c for c in SUM_COLUMNS if c in data.columns]
+    means = [c for c in MEAN_COLUMNS if c in data.columns]
+    lasts = [c for c in LAST_COLUMNS if c in data.columns]
+    grouped = (
+        data.loc[:, [c for c in keys if c != "minute"] + sums + means + lasts]
+        .assign(
+            minute=contest_minute(data["hour"]),
+            position=np.arange(len(data)),
+        )
+        .groupby(keys, as_index=False, sort=True, observed=True, dropna=False)
+    )
+    return grouped.agg(
+        qsos=("position", "size"),
+        **{c: (c, "sum") for c in sums},
+        **{f"sum_{c}": (c, "sum") for c in means},
+        **{f"count_{c}": (c, "count") for c in means},
+        **{c: (c, "last") for c in lasts},
+        position=("position", "max"),
+    )
+
+
+def rollup(
+    aggregates: DataFrame, by: List[str], time_bin_size: Optional[int] = None
+) -> DataFrame:
+    """Roll the aggregates up to coarser keys and time bins.
+
+    Args:
+        aggregates (DataFrame): Aggregates, from `minute_aggregates` or a rollup
+        by (List[str]): Keys to keep, e.g. callsign_year or band
+        time_bin_size (Optional[int]): Time bin size in minutes. The minute column
+            is then the first minute of each bin. Defaults to None to aggregate all
+            minutes together.
+
+    Returns:
+        DataFrame: Rollup, with the sums and lasts under their own names, and the
+            means of the mean columns
+    """
+    keys = list(by)
+    if time_bin_size is not None:
+        aggregates = aggregates.assign(
+            minute=lambda x: x["minute"] // time_bin_size * time_bin_size
+        )
+        keys.append("minute")
+    sums = ["qsos"] + [c for c in SUM_COLUMNS if c in aggregates.columns]
+    means = [c for c in MEAN_COLUMNS if f"sum_{c}" in aggregates.columns]
+    lasts = [c for c in LAST_COLUMNS if c in aggregates.columns]
+    rolled = (
+        aggregates.sort_values("position", kind="stable")
+        .groupby(keys, as_index=False, sort=True, observed=True, dropna=False)
+        .agg(
+            **{c: (c, "sum") for c in sums},
+            **{f"sum_{c}": (f"sum_{c}", "sum") for c in means},
+            **{f"count_{c}": (f"count_{c}", "sum") for c in means},
+            **{c: (c, "last") for c in lasts},
+            position=("position", "max"),
+        )
+    )
+    return rolled.assign(
+        **{
+            c: rolled[f"sum_{c}"] / rolled[f"count_{c}"].where(rolled[f"count_{c}"] > 0)
+            for c in means
+        }
+    ).drop(columns=[f"{p}_{c}" for c in means for p in ["sum", "count"]])
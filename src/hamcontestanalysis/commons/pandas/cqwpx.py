@@ -10,7 +10,6 @@ from hamcontestanalysis.commons import get_call_info
 
 
 logger = getLogger(__name__)
-call_info = get_call_info()
 
 
 def compute_contest_score(data: DataFrame) -> DataFrame:
@@ -37,7 +36,9 @@ def compute_contest_score(data: DataFrame) -> DataFrame:
         .assign(
             is_valid=lambda x: x["datetime"] == x["datetime_first_occurrence"],
             mycontinent=lambda _data: (
-                _data.apply(lambda x: call_info.get_continent(x["mycall"]), axis=1)
+                _data.apply(
+                    lambda x: get_call_info().get_continent(x["mycall"]), axis=1
+                )
             ),
             potential_qso_points=lambda x: where(
                 x["mycontinent"] != x["continent"],
@@ -0,0 +1,160 @@
+"""Downsampling of time series for plotting.
+
+Long time series, e.g. one point per minute of a contest for dozens of logs, are
+too many points for the browser to render. They are downsampled before building the
+figure, keeping their visual shape:
+
+- lttb: Largest-Triangle-Three-Buckets keeps, in each bucket of points, the one
+  forming the largest triangle with its neighbours. Suited to lines.
+- minmax: keeps the minimum and maximum of each bin of the x axis, i.e. of each
+  pixel column. Suited to scatter plots, as no extreme value is lost.
+
+The budget of points is shared by all the series of a plot, so that the size of
+the figure is bounded whatever the number of logs compared.
+"""
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+from pandas import DataFrame
+from pandas import Series
+from pandas import concat
+from pandas import to_datetime
+from pandas.api.types import is_datetime64_any_dtype
+
+
+# Fewest points kept of each series
+MIN_POINTS_PER_SERIES = 16
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    Args:
+        x (np.ndarray): Sorted numeric x values
+        y (np.ndarray): y values
+        n_out (int): Number of points to keep, at least 3
+
+    Returns:
+        np.ndarray: Sorted indices of the points kept, always including the first and
+            the last one
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = x.astype(np.float64)
+    y = np.nan_to_num(y.astype(np.float64))
+    # Buckets of the points between the first and the last one
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket, or the last point
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_start = end if i + 2 < len(edges) else n - 1
+        x_next = x[next_start:next_end].mean()
+        y_next = y[next_start:next_end].mean()
+        areas = np.abs(
+            (x[previous] - x_next) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (y_next - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        indices[i + 1] = previous
+    return indices
+
+
+def minmax_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the minimum and maximum of each bin of the x axis.
+
+    Args:
+        x (np.ndarray): Sorted numeric x values
+        y (np.ndarray): y values
+        n_out (int): Number of points to keep, two per bin
+
+    Returns:
+        np.ndarray: Sorted indices of the points kept
+    """
+    n = len(x)
+    n_bins = n_out // 2
+    if n_out >= n or n_bins < 1:
+        return np.arange(n)
+    x = x.astype(np.float64)
+    y = np.nan_to_num(y.astype(np.float64))
+    edges = np.linspace(x[0], x[-1], n_bins + 1)[1:-1]
+    bins = np.searchsorted(edges, x, side="right")
+    # Sort by bin then by y, and keep the first and last point of each bin
+    order = np.lexsort((y, bins))
+    sorted_bins = bins[order]
+    first = np.flatnonzero(np.r_[True, sorted_bins[1:] != sorted_bins[:-1]])
+    last = np.r_[first[1:] - 1, n - 1]
+    return np.unique(np.concatenate([order[first], order[last]]))
+
+
+def _numeric(values: Any) -> np.ndarray:
+    """Numeric view of x values, e.g. nanoseconds of datetimes."""
+    if is_datetime64_any_dtype(values):
+        return values.to_numpy().astype("datetime64[ns]").astype(np.int64)
+    return values.to_numpy(dtype=np.float64)
+
+
+def downsample(
+    data: DataFrame,
+    x: str,
+    y: str,
+    max_points: int,
+    by: Optional[Union[str, List[str]]] = None,
+    x_range: Optional[Sequence[Any]] = None,
+    method: str = "lttb",
+) -> DataFrame:
+    """Downsample the time series of a data frame.
+
+    Args:
+        data (DataFrame): Data, with one row per point
+        x (str): Column of the x axis
+        y (str): Column of the y axis
+        max_points (int): Points kept in total, shared by all the series
+        by (Optional[Union[str, List[str]]]): Columns identifying each series.
+            Defaults to None for a single series.
+        x_range (Optional[Sequence[Any]]): Visible range of the x axis. Points out
+            of it are dropped, except the closest one on each side, so that the
+            budget is spent on the visible window. Defaults to None for all points.
+        method (str): Downsampling method, lttb or minmax. Defaults to lttb.
+
+    Returns:
+        DataFrame: Points kept, sorted by series and x
+    """
+    functions = {"lttb": lttb_indices, "minmax": minmax_indices}
+    if method not in functions:
+        raise ValueError(f"Downsampling method must be one of {list(functions)}")
+    keys = [by] if isinstance(by, str) else list(by or [])
+    groups = (
+        [g for _, g in data.groupby(keys, sort=False, observed=True)]
+        if keys
+        else [data]
+    )
+    budget = max(max_points // max(len(groups), 1), MIN_POINTS_PER_SERIES)
+
+    sampled = []
+    for group in groups:
+        group = group.sort_values(x, kind="stable")
+        values = _numeric(group[x])
+        if x_range is not None:
+            low, high = x_range
+            if is_datetime64_any_dtype(group[x]):
+                low, high = to_datetime(low), to_datetime(high)
+            low, high = _numeric(Series([low, high]))
+            start = max(int(np.searchsorted(values, low, side="left")) - 1, 0)
+            end = int(np.searchsorted(values, high, side="right")) + 1
+            group, values = group.iloc[start:end], values[start:end]
+        indices = functions[method](
+            values, group[y].to_numpy(dtype=np.float64, na_value=np.nan), budget
+        )
+        sampled.append(group.iloc[indices])
+    if not sampled:
+        return data
+    return concat(sampled)
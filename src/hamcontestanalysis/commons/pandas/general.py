@@ -1,10 +1,12 @@
 """General contest processing."""
 
+from datetime import date
 from datetime import timedelta
 from logging import getLogger
 from re import findall
 from typing import Any
 from typing import Dict
+from typing import Optional
 
 import numpy as np
 from pandas import DataFrame
@@ -23,7 +25,6 @@ from hamcontestanalysis.utils import BANDMAP
 
 
 logger = getLogger(__name__)
-call_info = get_call_info()
 
 
 def compute_band(data: DataFrame) -> DataFrame:
@@ -63,12 +64,12 @@ def add_dxcc_info(data: DataFrame) -> DataFrame:
     """
     logger.info("Add DXCC info")
     mylocator = latlong_to_locator(
-        **call_info.get_lat_long(data["mycall"].to_numpy()[0])
+        **get_call_info().get_lat_long(data["mycall"].to_numpy()[0])
     )
 
     def _get_all_dxcc_info_handle_exceptions(x: DataFrame) -> Dict[str, Any]:
         try:
-            return call_info.get_all(x["call"])
+            return get_call_info().get_all(x["call"])
         except KeyError:
             return {
                 "country": None,
@@ -87,7 +88,7 @@ def add_dxcc_info(data: DataFrame) -> DataFrame:
         .dropna(subset=["country"])
         .assign(
             locator=lambda _data: _data.apply(
-                lambda x: latlong_to_locator(**call_info.get_lat_long(x["call"])),
+                lambda x: latlong_to_locator(**get_call_info().get_lat_long(x["call"])),
                 axis=1,
             ),
             distance=lambda _data: _data.apply(
@@ -118,7 +119,7 @@ def add_dxcc_info(data: DataFrame) -> DataFrame:
     return data
 
 
-def hour_of_contest(data: DataFrame) -> DataFrame:
+def hour_of_contest(data: DataFrame, start: Optional[date] = None) -> DataFrame:
     """Retrieve our of contest.
 
     It always assumes that Saturday 00 is the first hour, and Sunday 23:59 is the
@@ -126,16 +127,19 @@ def hour_of_contest(data: DataFrame) -> DataFrame:
 
     Args:
         data (DataFrame): Data frame containing the log
+        start (Optional[date]): Saturday of the contest. Defaults to None to take
+            the Saturday of the week of the first row.
 
     Returns:
         DataFrame: Data frame with the hour of the contest added
     """
-    datetime_min = data["datetime"].min().date()
-    start_utc = (
-        datetime_min - timedelta(days=datetime_min.weekday()) + timedelta(days=5)
-    )
+    if start is None:
+        datetime_min = data["datetime"].min().date()
+        start = (
+            datetime_min - timedelta(days=datetime_min.weekday()) + timedelta(days=5)
+        )
     data = data.assign(
-        hour=(lambda x: (x["datetime"] - to_datetime(start_utc)) / Timedelta("1 hour"))
+        hour=(lambda x: (x["datetime"] - to_datetime(start)) / Timedelta("1 hour"))
     )
     return data
 
@@ -0,0 +1,78 @@
+"""Reverse beacon network processing."""
+
+from logging import getLogger
+
+from pandas import DataFrame
+from pandas import Grouper
+
+
+logger = getLogger(__name__)
+
+
+def compute_skimmer_calibration(
+    data: DataFrame,
+    time_bin_size: int = 10,
+    min_skimmers: int = 3,
+    min_spots: int = 10,
+) -> DataFrame:
+    """Compute the SNR offset of each skimmer and band with respect to consensus.
+
+    Spots are first averaged per skimmer, DX, band and time bin. The consensus for a
+    given DX, band and time bin is the median SNR over all skimmers that spotted it,
+    and only bins spotted by at least `min_skimmers` skimmers are considered. The
+    offset of a skimmer in a band is the median of its deviations from consensus.
+
+    Args:
+        data (DataFrame): RBN data set for a contest edition
+        time_bin_size (int): Size of the time bin in minutes. Defaults to 10.
+        min_skimmers (int): Minimum number of skimmers spotting the same DX in the
+            same band and time bin to build a consensus. Defaults to 3.
+        min_spots (int): Minimum number of consensus comparisons for a skimmer and
+            band to be kept in the table. Defaults to 10.
+
+    Returns:
+        DataFrame: Calibration table with columns callsign, band, offset and n_spots
+    """
+    logger.info("Compute skimmer SNR calibration")
+    keys = [Grouper(key="datetime", freq=f"{time_bin_size}Min"), "dx", "band"]
+    grp = (
+        data.dropna(subset=["db"])
+        .groupby(keys + ["callsign"], as_index=False)
+        .agg(db=("db", "mean"))
+    )
+    grp = grp.assign(
+        n_skimmers=lambda x: x.groupby(["datetime", "dx", "band"])["db"].transform(
+            "count"
+        ),
+        consensus=lambda x: x.groupby(["datetime", "dx", "band"])["db"].transform(
+            "median"
+        ),
+    ).query(f"n_skimmers >= {min_skimmers}")
+    return (
+        grp.assign(deviation=lambda x: x["db"] - x["consensus"])
+        .groupby(["callsign", "band"], as_index=False)
+        .agg(offset=("deviation", "median"), n_spots=("deviation", "count"))
+        .query(f"n_spots >= {min_spots}")
+        .reset_index(drop=True)
+    )
+
+
+def apply_skimmer_calibration(data: DataFrame, calibration: DataFrame) -> DataFrame:
+    """Correct the SNR of each spot with the offset of the skimmer that reported it.
+
+    Spots from skimmers without calibration in that band are kept uncorrected.
+
+    Args:
+        data (DataFrame): RBN data set
+        calibration (DataFrame): Calibration table, as returned by
+            `compute_skimmer_calibration`, optionally with a year column
+
+    Returns:
+        DataFrame: RBN data set with the db column corrected
+    """
+    keys = [k for k in ["callsign", "band", "year"] if k in calibration.columns]
+    return (
+        data.merge(calibration[keys + ["offset"]], how="left", on=keys)
+        .assign(db=lambda x: x["db"] - x["offset"].fillna(0.0))
+        .drop(columns=["offset"])
+    )
@@ -0,0 +1,140 @@
+"""Rolling QSO rates of the contest logs.
+
+The rate of a log at each QSO is the number of QSOs, or the sum of a column such as
+is_valid, in the window of the last minutes ending at that QSO. With the QSOs of
+a log sorted by time, it is a difference of cumulative sums, between the QSO and
+the first QSO inside the window, found by binary search. Any number of windows is
+computed in one pass per log, and the best rate of a window length over the contest
+is the maximum of its rolling rates.
+"""
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+from pandas import DataFrame
+from pandas import Series
+from pandas.api.types import is_datetime64_any_dtype
+
+
+def rolling_sums(
+    times: np.ndarray, windows: Sequence[float], values: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Rolling sums over time windows ending at each element.
+
+    As the time-based rolling windows of pandas, the window of an element includes
+    the elements up to it whose time is less than the window length before it.
+
+    Args:
+        times (np.ndarray): Times of the elements, sorted
+        windows (Sequence[float]): Window lengths, in the unit of the times
+        values (Optional[np.ndarray]): Values summed. Defaults to None to count the
+            elements.
+
+    Returns:
+        np.ndarray: Rolling sums, with one row per window
+    """
+    cumulative = np.zeros(len(times) + 1)
+    cumulative[1:] = np.cumsum(
+        np.ones(len(times)) if values is None else np.nan_to_num(values)
+    )
+    starts = np.searchsorted(
+        times, times[None, :] - np.asarray(windows, dtype=times.dtype)[:, None], "right"
+    )
+    return cumulative[None, 1:] - cumulative[starts]
+
+
+def _times(time: Series) -> Tuple[np.ndarray, float]:
+    """Times as numbers, with the length of a minute in their unit."""
+    if is_datetime64_any_dtype(time):
+        return time.to_numpy(dtype="datetime64[ns]").view(np.int64), 60 * 10**9
+    return time.to_numpy(), 1
+
+
+def add_rolling_rates(
+    data: DataFrame,
+    windows: Sequence[int],
+    column: Optional[str] = None,
+    name: str = "rate_{window}",
+    by: Sequence[str] = ("mycall", "year"),
+    time: str = "datetime",
+) -> DataFrame:
+    """Add the rolling rates of each log over several windows.
+
+    The columns are only computed if missing, so that rates computed once, e.g. by
+    the dashboard, are used by every plot and table as is, without copying the data.
+
+    Args:
+        data (DataFrame): Processed logs, or their aggregates
+        windows (Sequence[int]): Window lengths in minutes
+        column (Optional[str]): Column summed. Defaults to None to count the QSOs.
+        name (str): Name of the column of each window. Defaults to rate_{window}.
+        by (Sequence[str]): Keys of each log. Defaults to mycall and year.
+        time (str): Time of the QSOs, a datetime, or a number of minutes as in the
+            aggregates. Defaults to datetime.
+
+    Returns:
+        DataFrame: Data with the rolling rates of each window
+    """
+    missing = [w for w in windows if name.format(window=w) not in data.columns]
+    if not missing:
+        return data
+    times, minute = _times(data[time])
+    values = None if column is None else data[column].to_numpy(dtype=float)
+    rates = np.empty((len(missing), len(data)))
+    for positions in (
+        data.groupby(list(by), sort=False, observed=True).indices.values()
+        if len(data)
+        else []
+    ):
+        positions = positions[np.argsort(times[positions], kind="stable")]
+        rates[:, positions] = rolling_sums(
+            times=times[positions],
+            windows=[w * minute for w in missing],
+            values=None if values is None else values[positions],
+        )
+    return data.assign(
+        **{name.format(window=w): rates[i] for i, w in enumerate(missing)}
+    )
+
+
+def peak_rates(
+    data: DataFrame,
+    windows: Sequence[int],
+    column: Optional[str] = None,
+    name: str = "peak_{window}",
+    by: Sequence[str] = ("mycall", "year"),
+    time: str = "datetime",
+) -> DataFrame:
+    """Best rate of each log over several window lengths.
+
+    Args:
+        data (DataFrame): Processed logs, or their aggregates
+        windows (Sequence[int]): Window lengths in minutes
+        column (Optional[str]): Column summed. Defaults to None to count the QSOs.
+        name (str): Name of the column of each window. Defaults to peak_{window}.
+        by (Sequence[str]): Keys of each log, or of the groups of QSOs of each log,
+            e.g. by band. Defaults to mycall and year.
+        time (str): Time of the QSOs, a datetime, or a number of minutes as in the
+            aggregates. Defaults to datetime.
+
+    Returns:
+        DataFrame: Keys and best rate of each window of each log
+    """
+    rolling: Dict[int, str] = {w: f"_rolling_{w}" for w in windows}
+    columns: List[str] = list(dict.fromkeys([*by, time, *([column] if column else [])]))
+    return (
+        data.loc[:, columns]
+        .pipe(
+            add_rolling_rates,
+            windows=windows,
+            column=column,
+            name="_rolling_{window}",
+            by=by,
+            time=time,
+        )
+        .groupby(list(by), as_index=False, observed=True)
+        .agg(**{name.format(window=w): (rolling[w], "max") for w in windows})
+    )
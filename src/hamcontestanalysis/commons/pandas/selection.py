@@ -0,0 +1,120 @@
+"""Selection of the QSOs or spots of several logs.
+
+The plots compare a few logs out of the data loaded for them, which may hold more.
+Instead of scanning the data once per log, the rows of each callsign and year are
+indexed in a single pass, and the rows of all the logs selected are taken at once,
+in the order of the selection. The index of a data set is kept while the data set
+is alive, so that the plots sharing it, e.g. in the dashboard, index it only once.
+
+Callsigns are compared as values, never interpolated in query strings, so that any
+callsign, e.g. with a / or a quote, is selected.
+"""
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict
+from typing import Iterable
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+from pandas import DataFrame
+
+
+class LogIndex:
+    """Positions of the rows of each log of a data set."""
+
+    def __init__(self, data: DataFrame, callsign: str = "mycall", year: str = "year"):
+        """Log index constructor.
+
+        Args:
+            data (DataFrame): QSOs or spots of several logs
+            callsign (str): Callsign column. Defaults to mycall.
+            year (str): Year column. Defaults to year.
+        """
+        self.positions: Dict[Tuple[str, int], np.ndarray] = (
+            {
+                (c, int(y)): p
+                for (c, y), p in data.groupby(
+                    [callsign, year], sort=False, observed=True
+                ).indices.items()
+            }
+            if len(data)
+            else {}
+        )
+
+    def take(
+        self, callsigns_years: Iterable[Tuple[str, Union[int, str]]]
+    ) -> np.ndarray:
+        """Positions of the rows of several logs.
+
+        Args:
+            callsigns_years (Iterable[Tuple[str, Union[int, str]]]): Callsign and year
+                of each log
+
+        Returns:
+            np.ndarray: Positions of the rows of the logs, log after log
+        """
+        empty = np.array([], dtype=np.intp)
+        return np.concatenate(
+            [empty]
+            + [self.positions.get((c, int(y)), empty) for c, y in callsigns_years]
+        )
+
+
+_INDEXES: "OrderedDict[Tuple[int, str, str], Tuple[weakref.ref, LogIndex]]" = (
+    OrderedDict()
+)
+_INDEXES_SIZE = 16
+_LOCK = threading.Lock()
+
+
+def get_log_index(
+    data: DataFrame, callsign: str = "mycall", year: str = "year"
+) -> LogIndex:
+    """Get the log index of a data set, built on first use.
+
+    Args:
+        data (DataFrame): QSOs or spots of several logs
+        callsign (str): Callsign column. Defaults to mycall.
+        year (str): Year column. Defaults to year.
+
+    Returns:
+        LogIndex: Index of the logs of the data set
+    """
+    key = (id(data), callsign, year)
+    with _LOCK:
+        reference, index = _INDEXES.get(key, (None, None))
+        if reference is not None and reference() is data:
+            _INDEXES.move_to_end(key)
+            return index
+    index = LogIndex(data=data, callsign=callsign, year=year)
+    with _LOCK:
+        _INDEXES[key] = (weakref.ref(data), index)
+        while len(_INDEXES) > _INDEXES_SIZE:
+            _INDEXES.popitem(last=False)
+    return index
+
+
+def select_logs(
+    data: DataFrame,
+    callsigns_years: Iterable[Tuple[str, Union[int, str]]],
+    callsign: str = "mycall",
+    year: str = "year",
+) -> DataFrame:
+    """Select the rows of several logs.
+
+    Args:
+        data (DataFrame): QSOs or spots of several logs
+        callsigns_years (Iterable[Tuple[str, Union[int, str]]]): Callsign and year
+            of each log
+        callsign (str): Callsign column. Defaults to mycall.
+        year (str): Year column. Defaults to year.
+
+    Returns:
+        DataFrame: Rows of the logs, log after log, with their original index
+    """
+    positions = get_log_index(data=data, callsign=callsign, year=year).take(
+        callsigns_years
+    )
+    return data.take(positions)
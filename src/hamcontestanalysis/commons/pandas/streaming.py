@@ -0,0 +1,107 @@
+"""Partial aggregations to process data sets in chunks."""
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from pandas import DataFrame
+from pandas import Grouper
+from pandas import concat
+
+
+AGGREGATIONS = ["count", "sum", "mean", "min", "max"]
+
+# Aggregation applied to combine the partial results of each aggregation
+COMBINE_AGGREGATIONS = {"count": "sum", "sum": "sum", "min": "min", "max": "max"}
+
+
+def _key_names(keys: List[Union[str, Grouper]]) -> List[str]:
+    return [k.key if isinstance(k, Grouper) else k for k in keys]
+
+
+def _partial_columns(
+    aggregations: Dict[str, Tuple[str, str]]
+) -> Dict[str, Tuple[str, str]]:
+    """Translate aggregations into combinable partial aggregations."""
+    partial = {}
+    for name, (column, function) in aggregations.items():
+        if function not in AGGREGATIONS:
+            raise ValueError(f"Aggregation {function} cannot be computed in chunks.")
+        if function == "mean":
+            partial[f"{name}__sum"] = (column, "sum")
+            partial[f"{name}__count"] = (column, "count")
+        else:
+            partial[name] = (column, function)
+    return partial
+
+
+def partial_aggregate(
+    data: DataFrame,
+    keys: List[Union[str, Grouper]],
+    aggregations: Dict[str, Tuple[str, str]],
+) -> DataFrame:
+    """Aggregate a chunk of data into partial results that can be combined later.
+
+    Means are kept as partial sums and counts, so that they can be combined exactly.
+
+    Args:
+        data (DataFrame): Chunk of data to aggregate
+        keys (List[Union[str, Grouper]]): Group by keys
+        aggregations (Dict[str, Tuple[str, str]]): Named aggregations, mapping output
+            column to (input column, function). Functions can be count, sum, mean,
+            min or max.
+
+    Returns:
+        DataFrame: Partial aggregation of the chunk
+    """
+    partial = _partial_columns(aggregations)
+    if data.empty:
+        return DataFrame(columns=_key_names(keys) + list(partial.keys()))
+    return data.groupby(keys, as_index=False).agg(**partial)
+
+
+def combine_partial_aggregates(
+    partials: Iterable[DataFrame],
+    keys: List[Union[str, Grouper]],
+    aggregations: Dict[str, Tuple[str, str]],
+) -> DataFrame:
+    """Combine the partial aggregations of several chunks into the final result.
+
+    Each partial aggregation is folded into a running result as it arrives, so that
+    memory is bounded by the number of groups and the size of a partial
+    aggregation, regardless of the number of chunks.
+
+    Args:
+        partials (Iterable[DataFrame]): Partial aggregations of each chunk
+        keys (List[Union[str, Grouper]]): Group by keys used in the partial
+            aggregation
+        aggregations (Dict[str, Tuple[str, str]]): Named aggregations used in the
+            partial aggregation
+
+    Returns:
+        DataFrame: Aggregated data
+    """
+    key_names = _key_names(keys)
+    partial = _partial_columns(aggregations)
+    combine: Dict[str, Any] = {
+        name: (name, COMBINE_AGGREGATIONS[function])
+        for name, (_, function) in partial.items()
+    }
+    data = None
+    for partial_data in partials:
+        if partial_data.empty:
+            continue
+        if data is not None:
+            partial_data = concat([data, partial_data], ignore_index=True)
+        data = partial_data.groupby(key_names, as_index=False).agg(**combine)
+    if data is None:
+        return DataFrame(columns=key_names + list(aggregations.keys()))
+
+    for name, (_, function) in aggregations.items():
+        if function == "mean":
+            data[name] = data[f"{name}__sum"] / data[f"{name}__count"]
+            data = data.drop(columns=[f"{name}__sum", f"{name}__count"])
+    return data.loc[:, key_names + list(aggregations.keys())]
@@ -1,4 +1,7 @@
 """Storage settings for HamContestAnalysis."""
+from typing import Dict
+from typing import List
+from typing import Optional
 
 from hamcontestanalysis.config.settings import BaseSettings
 
@@ -9,15 +12,35 @@ class StoragePathsSettings(BaseSettings):
     raw_data: str
     raw_metadata: str
     raw_rbn: str
+    raw_rbn_calibration: str
+    raw_rbn_date: str
+    catalog: str
     temporary: str
 
 
+class ParquetProfileSettings(BaseSettings):
+    """Parquet layout of the files written by a storage data sink."""
+
+    compression: str = "snappy"
+    compression_level: Optional[int] = None
+    row_group_size: Optional[int] = None
+    sort_by: List[str] = []
+    use_dictionary: Optional[List[str]] = None
+
+
 class StorageSettings(BaseSettings):
     """Storage Settings model."""
 
     partitions: str
     prefix: str
     partitions_rbn: str
+    partitions_rbn_date: str
+    hot_cache: bool = True
+    load_cache_mb: int = 1024
+    dashboard_cache_mb: int = 4096
+    figure_cache_mb: int = 256
+    dashboard_prewarm: int = 4
+    parquet_profiles: Dict[str, ParquetProfileSettings] = {}
 
     @property
     def paths(self):
@@ -34,6 +57,11 @@ class StorageSettings(BaseSettings):
             raw_data=(f"{self.prefix}/{self.partitions}/raw_data"),
             raw_metadata=(f"{self.prefix}/{self.partitions}/raw_metadata"),
             raw_rbn=(f"{self.prefix}/{self.partitions_rbn}/rbn"),
+            raw_rbn_calibration=(
+                f"{self.prefix}/{self.partitions_rbn}/rbn_calibration"
+            ),
+            raw_rbn_date=(f"{self.prefix}/rbn/{self.partitions_rbn_date}"),
+            catalog=f"{self.prefix}/catalog.sqlite",
             temporary=f"{self.prefix}/temporary",
         )
 
@@ -0,0 +1,247 @@
+"""Process-local cache of the data sets loaded from storage.
+
+Plots and tables load their inputs through the processed data sources, and many of
+them are usually created for the same logs. Loads are cached in memory, keyed by the
+paths and modification times of the files read, so that a file rewritten in storage
+is never served stale. Columns are cached as they are requested: a load asking for
+columns not read yet only reads those, and one asking for columns already read does
+not touch storage at all.
+
+The cache is bounded by a memory budget in the storage settings, evicting the least
+recently used data sets. Cached data sets are shared by every load that hits them,
+so they must be treated as read-only. Concurrent loads of the same data set wait for
+each other, so that each column is read only once.
+"""
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from functools import lru_cache
+from logging import getLogger
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from pandas import DataFrame
+from pandas import concat
+
+from hamcontestanalysis.config import get_settings
+
+
+logger = getLogger(__name__)
+
+
+def files_key(paths: Iterable[str]) -> Tuple[Tuple[str, int], ...]:
+    """Cache key of a set of files, made of their paths and modification times.
+
+    Args:
+        paths (Iterable[str]): Paths of the files
+
+    Returns:
+        Tuple[Tuple[str, int], ...]: Path and modification time of each file
+    """
+    return tuple((p, os.stat(p).st_mtime_ns) for p in paths)
+
+
+@dataclass
+class _Entry:
+    """Data set cached, with the columns requested so far."""
+
+    data: DataFrame
+    complete: bool
+    requested: Set[str] = field(default_factory=set)
+    extra: List[str] = field(default_factory=list)
+    nbytes: int = 0
+
+
+class LoadCache:
+    """LRU cache of data sets loaded from storage, bounded by a memory budget."""
+
+    def __init__(self, max_bytes: int):
+        """Load cache constructor.
+
+        Args:
+            max_bytes (int): Memory budget of the cached data sets. Data sets larger
+                than the budget are not cached, and 0 disables the cache.
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self._loads: Dict[Hashable, Tuple[threading.Lock, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the cached data sets."""
+        return self._nbytes
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        load: Callable[[Optional[List[str]]], DataFrame],
+        columns: Optional[List[str]] = None,
+    ) -> DataFrame:
+        """Get a data set from the cache, loading what is missing.
+
+        Args:
+            key (Hashable): Key of the data set, e.g. from `files_key`
+            load (Callable[[Optional[List[str]]], DataFrame]): Function loading the
+                given columns of the data set, or all of them if None. It may return
+                extra columns not requested, such as partition keys.
+            columns (Optional[List[str]]): Columns to get. Defaults to None to get
+                all columns.
+
+        Returns:
+            DataFrame: Data set with the columns that `load` would return. It shares
+                its data with the cache, and must not be modified in place.
+        """
+        entry, missing = self._lookup(key=key, columns=columns)
+        if missing == []:
+            with self._lock:
+                self.hits += 1
+        else:
+            with self._loading(key):
+                # A concurrent load of the same data set may have just stored it
+                entry, missing = self._lookup(key=key, columns=columns)
+                with self._lock:
+                    if missing == []:
+                        self.hits += 1
+                    else:
+                        self.misses += 1
+                entry = self._load(
+                    key=key, load=load, columns=columns, entry=entry, missing=missing
+                )
+
+        if columns is None:
+            return entry.data.copy(deep=False)
+        selected = list(dict.fromkeys(columns + entry.extra))
+        return entry.data.loc[:, [c for c in selected if c in entry.data.columns]]
+
+    def _lookup(
+        self, key: Hashable, columns: Optional[List[str]]
+    ) -> Tuple[Optional[_Entry], Optional[List[str]]]:
+        """Cached entry of a data set and the columns missing from it.
+
+        The missing columns are None if the whole data set has to be loaded.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None
+            self._entries.move_to_end(key)
+            if entry.complete:
+                return entry, []
+            if columns is None:
+                return entry, None
+            return entry, [c for c in columns if c not in entry.requested]
+
+    @contextmanager
+    def _loading(self, key: Hashable) -> Iterator[None]:
+        """Hold the lock of the loads of a data set, shared while it is in use."""
+        with self._lock:
+            lock, users = self._loads.get(key, (threading.Lock(), 0))
+            self._loads[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, users = self._loads.pop(key)
+                if users > 1:
+                    self._loads[key] = (lock, users - 1)
+
+    def _load(
+        self,
+        key: Hashable,
+        load: Callable[[Optional[List[str]]], DataFrame],
+        columns: Optional[List[str]],
+        entry: Optional[_Entry],
+        missing: Optional[List[str]],
+    ) -> _Entry:
+        """Load what is missing of a data set and store it."""
+        if missing == []:
+            return entry
+        if missing is None:
+            data = load(columns)
+            entry = _Entry(
+                data=data,
+                complete=columns is None,
+                requested=set(columns or []),
+                extra=[c for c in data.columns if c not in (columns or [])],
+                nbytes=int(data.memory_usage(deep=True).sum()),
+            )
+        else:
+            loaded = load(missing)
+            new_columns = [c for c in loaded.columns if c not in entry.data.columns]
+            added = loaded.loc[:, new_columns]
+            entry = _Entry(
+                data=concat([entry.data, added], axis=1),
+                complete=False,
+                requested=entry.requested | set(missing),
+                extra=entry.extra,
+                nbytes=entry.nbytes
+                + int(added.memory_usage(index=False, deep=True).sum()),
+            )
+        self._store(key=key, entry=entry)
+        return entry
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        """Store a data set, evicting the least recently used ones if needed."""
+        if entry.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous.nbytes
+            self._entries[key] = entry
+            self._nbytes += entry.nbytes
+            while self._nbytes > self.max_bytes:
+                evicted, evicted_entry = self._entries.popitem(last=False)
+                self._nbytes -= evicted_entry.nbytes
+                self.evictions += 1
+                logger.debug(f"Evict {evicted} from the load cache")
+
+    def clear(self) -> None:
+        """Remove all data sets and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistics of the cache.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, evictions, number of entries and memory used
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+@lru_cache()
+def _get_load_cache(max_bytes: int) -> LoadCache:
+    return LoadCache(max_bytes=max_bytes)
+
+
+def get_load_cache() -> LoadCache:
+    """Get the load cache with the memory budget of the storage settings."""
+    return _get_load_cache(get_settings().storage.load_cache_mb * 1024**2)
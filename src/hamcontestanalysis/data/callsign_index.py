@@ -0,0 +1,200 @@
+"""Prefix index of the logs available for download.
+
+The public logs of a contest are tens of thousands of callsign and year pairs, too
+many to send to the browser as options. They are indexed by callsign instead, kept
+sorted so that the callsigns starting with a prefix are a contiguous range found by
+binary search, and only the top matches of what the user types are sent.
+"""
+import importlib
+import os
+import threading
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.data.catalog import get_catalog
+
+
+class CallsignIndex:
+    """Sorted index of the callsigns and years of the available logs."""
+
+    def __init__(self, options: DataFrame):
+        """Callsign index constructor.
+
+        Args:
+            options (DataFrame): Available logs, with callsign and year columns
+        """
+        options = (
+            options.loc[:, ["callsign", "year"]]
+            .assign(
+                key=lambda x: x["callsign"].str.upper(),
+                year=lambda x: x["year"].astype(int),
+            )
+            .drop_duplicates(["key", "year"])
+            .sort_values(["key", "year"], ascending=[True, False])
+        )
+        # Callsigns as in the list of logs, and upper case as search keys
+        self.callsigns = options["callsign"].to_numpy(dtype=str)
+        self.keys = options["key"].to_numpy(dtype=str)
+        self.years = options["year"].to_numpy()
+
+    @property
+    def available_years(self) -> List[int]:
+        """Years with available logs, most recent first."""
+        return sorted(set(self.years.tolist()), reverse=True)
+
+    def search(
+        self,
+        prefix: str,
+        years: Optional[List[int]] = None,
+        limit: int = 50,
+    ) -> List[Tuple[str, int]]:
+        """Logs whose callsign starts with a prefix.
+
+        Args:
+            prefix (str): Start of the callsign, case insensitive
+            years (Optional[List[int]]): Years to keep. Defaults to None for all.
+            limit (int): Most logs returned. Defaults to 50.
+
+        Returns:
+            List[Tuple[str, int]]: Callsign and year of the matching logs, the exact
+                match first and then by callsign and most recent year
+        """
+        prefix = prefix.strip().upper()
+        start = np.searchsorted(self.keys, prefix, side="left")
+        end = np.searchsorted(self.keys, prefix + "\uffff", side="left")
+        positions = np.arange(start, end)
+        if years:
+            positions = positions[np.isin(self.years[positions], years)]
+        exact = self.keys[positions] == prefix
+        positions = np.concatenate([positions[exact], positions[~exact]])[:limit]
+        return [(self.callsigns[p], int(self.years[p])) for p in positions]
+
+
+def search_logs(
+    contest: str,
+    mode: str,
+    prefix: str,
+    years: Optional[List[int]] = None,
+    category_operator: Optional[str] = None,
+    limit: int = 50,
+    index: Optional[CallsignIndex] = None,
+) -> List[Tuple[str, int]]:
+    """Search the available logs of a contest by callsign prefix.
+
+    Args:
+        contest (str): Name of the contest
+        mode (str): Mode of the contest
+        prefix (str): Start of the callsign, case insensitive
+        years (Optional[List[int]]): Years to keep. Defaults to None for all.
+        category_operator (Optional[str]): Operator category to keep, e.g.
+            SINGLE-OP. It is only known for the logs already stored. Defaults to
+            None for all.
+        limit (int): Most logs returned. Defaults to 50.
+        index (Optional[CallsignIndex]): Callsign index of the contest and mode.
+            Defaults to None to get it, building it if needed.
+
+    Returns:
+        List[Tuple[str, int]]: Callsign and year of the matching logs
+    """
+    if index is None:
+        index = get_callsign_index(contest=contest, mode=mode)
+    if category_operator is None:
+        return index.search(prefix=prefix, years=years, limit=limit)
+    metadata = get_catalog().list_log_metadata(
+        contest=contest, mode=mode, category_operator=category_operator.upper()
+    )
+    stored = set(
+        metadata.assign(
+            callsign=lambda x: x["callsign"].str.upper(),
+            year=lambda x: x["year"].astype(int),
+        )[["callsign", "year"]].itertuples(index=False, name=None)
+    )
+    matches = index.search(prefix=prefix, years=years, limit=len(index.callsigns))
+    return [(c, y) for c, y in matches if (c.upper(), y) in stored][:limit]
+
+
+# Callsign index of each contest and mode, with the modification time of the list
+# of available logs it was built from
+_INDEXES: Dict[Tuple[str, str], Tuple[int, CallsignIndex]] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def _build_callsign_index(contest: str, mode: str) -> CallsignIndex:
+    data_source_class = importlib.import_module(
+        f"hamcontestanalysis.data.{contest}.storage_source"
+    ).CabrilloDataSource
+    options = data_source_class.get_all_options()
+    return CallsignIndex(options=options[options["mode"] == mode])
+
+
+def options_path(contest: str) -> str:
+    """Path of the list of the logs available for download of a contest.
+
+    Args:
+        contest (str): Name of the contest
+
+    Returns:
+        str: Path of the list, which may not exist yet
+    """
+    return os.path.join(
+        get_settings().storage.prefix,
+        f"contest={contest.lower()}",
+        "available_callsigns.parquet",
+    )
+
+
+def _options_modified(contest: str) -> int:
+    """Modification time of the list of available logs, 0 if it does not exist."""
+    path = options_path(contest=contest)
+    return os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+
+
+def get_callsign_index(contest: str, mode: str) -> CallsignIndex:
+    """Get the callsign index of the available logs of a contest and mode.
+
+    The index is built once, and again when the list of available logs changes.
+
+    Args:
+        contest (str): Name of the contest
+        mode (str): Mode of the contest
+
+    Returns:
+        CallsignIndex: Callsign index
+    """
+    key = (contest.lower(), mode.lower())
+    modified = _options_modified(contest=contest)
+    with _INDEXES_LOCK:
+        built = _INDEXES.get(key)
+    if built is not None and built[0] == modified:
+        return built[1]
+    index = _build_callsign_index(contest=key[0], mode=key[1])
+    with _INDEXES_LOCK:
+        _INDEXES[key] = (modified, index)
+    return index
+
+
+def get_built_callsign_index(contest: str, mode: str) -> Optional[CallsignIndex]:
+    """Get the callsign index of a contest and mode only if it is already built.
+
+    Building an index may download the list of available logs, which is left to
+    the callers that can afford it, e.g. the prewarm of the dashboard.
+
+    Args:
+        contest (str): Name of the contest
+        mode (str): Mode of the contest
+
+    Returns:
+        Optional[CallsignIndex]: Callsign index, or None if it is not built or the
+            list of available logs has changed since
+    """
+    with _INDEXES_LOCK:
+        built = _INDEXES.get((contest.lower(), mode.lower()))
+    if built is None or built[0] != _options_modified(contest=contest):
+        return None
+    return built[1]
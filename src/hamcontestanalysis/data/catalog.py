@@ -0,0 +1,419 @@
+"""Catalog of the partitions stored locally.
+
+The catalog is a SQLite database next to the stored data, with one row per
+partition written by a storage data sink. It records the partition keys, the path,
+the number of rows and bytes, the schema fingerprint, the processing version and a
+checksum of the file, so that questions such as "which logs of CQ WW CW 2022 are
+local" are answered with a single indexed query instead of probing the filesystem.
+
+It also holds the metadata parsed from the header of each log, to query the archive
+by category, e.g. all single operator all band high power logs from Europe.
+"""
+import os
+import re
+import sqlite3
+from contextlib import closing
+from contextlib import contextmanager
+from datetime import datetime
+from datetime import timezone
+from functools import lru_cache
+from hashlib import sha256
+from logging import getLogger
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from pandas import DataFrame
+from pandas import isna
+from pandas import read_parquet
+from pandas import read_sql_query
+from pyarrow.parquet import read_schema
+
+from hamcontestanalysis.commons.cabrillo import HEADER_FIELDS
+from hamcontestanalysis.config import get_settings
+
+
+logger = getLogger(__name__)
+
+PARTITION_KEYS = ["contest", "mode", "year", "callsign", "date"]
+
+# Path template in the storage settings of each kind of partition
+PATHS_BY_KIND = {
+    "contest": "raw_data",
+    "metadata": "raw_metadata",
+    "rbn": "raw_rbn",
+    "rbn_calibration": "raw_rbn_calibration",
+    "rbn_date": "raw_rbn_date",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS partitions (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    contest TEXT,
+    mode TEXT,
+    year INTEGER,
+    callsign TEXT,
+    date TEXT,
+    rows INTEGER,
+    bytes INTEGER,
+    mtime REAL,
+    checksum TEXT,
+    schema_fingerprint TEXT,
+    processing_version INTEGER,
+    downloaded_at TEXT
+);
+CREATE INDEX IF NOT EXISTS partitions_keys
+    ON partitions (kind, contest, mode, year, callsign);
+CREATE INDEX IF NOT EXISTS partitions_dates ON partitions (kind, mode, date);
+CREATE TABLE IF NOT EXISTS log_metadata (
+    contest TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    callsign TEXT NOT NULL,
+    category_operator TEXT,
+    category_power TEXT,
+    category_band TEXT,
+    category_assisted INTEGER,
+    category_mode TEXT,
+    category_station TEXT,
+    category_transmitter TEXT,
+    category_overlay TEXT,
+    claimed_score INTEGER,
+    club TEXT,
+    location TEXT,
+    grid_locator TEXT,
+    operators TEXT,
+    created_by TEXT,
+    continent TEXT,
+    PRIMARY KEY (contest, mode, year, callsign)
+);
+CREATE INDEX IF NOT EXISTS log_metadata_category
+    ON log_metadata (contest, year, category_operator, category_band, category_power);
+"""
+
+# Metadata fields of each log, besides its partition keys
+LOG_METADATA_FIELDS = [f for f in HEADER_FIELDS.values() if f != "callsign"] + [
+    "continent"
+]
+
+# Columns the partitions and the log metadata can be filtered on
+PARTITION_FILTERS = ["kind"] + PARTITION_KEYS
+LOG_METADATA_FILTERS = ["contest", "mode", "year", "callsign"] + LOG_METADATA_FIELDS
+
+
+def _file_checksum(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 checksum of a file."""
+    digest = sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _schema_fingerprint(path: str) -> Optional[str]:
+    """Short hash of the Arrow schema of a Parquet file, without its metadata."""
+    if not path.endswith(".parquet"):
+        return None
+    schema = read_schema(path).remove_metadata()
+    return sha256(schema.to_string().encode()).hexdigest()[:16]
+
+
+class StorageCatalog:
+    """SQLite catalog of the locally stored partitions."""
+
+    def __init__(self, path: str):
+        """Storage catalog constructor.
+
+        Args:
+            path (str): Path of the SQLite database. It is created if missing.
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and rolling back on errors."""
+        with closing(sqlite3.connect(self.path, timeout=30)) as connection:
+            with connection:
+                yield connection
+
+    def register(
+        self,
+        kind: str,
+        path: str,
+        rows: Optional[int] = None,
+        processing_version: Optional[int] = None,
+        **keys: Any,
+    ) -> None:
+        """Register (or update) a partition that has been written to storage.
+
+        Args:
+            kind (str): Kind of partition, e.g. contest or rbn
+            path (str): Path of the file
+            rows (Optional[int]): Number of rows. Defaults to None.
+            processing_version (Optional[int]): Version of the processing that
+                produced the data. Defaults to None.
+            keys (Any): Partition keys, among contest, mode, year, callsign and date
+        """
+        unknown = set(keys) - set(PARTITION_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown partition keys: {sorted(unknown)}")
+        stat = os.stat(path)
+        record = {
+            "path": path,
+            "kind": kind,
+            **{k: keys.get(k) for k in PARTITION_KEYS},
+            "rows": rows,
+            "bytes": stat.st_size,
+            "mtime": stat.st_mtime,
+            "checksum": _file_checksum(path),
+            "schema_fingerprint": _schema_fingerprint(path),
+            "processing_version": processing_version,
+            "downloaded_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if record["year"] is not None:
+            record["year"] = int(record["year"])
+        with self._connect() as connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO partitions ({', '.join(record)}) "
+                f"VALUES ({', '.join('?' * len(record))})",
+                list(record.values()),
+            )
+
+    def unregister(self, paths: List[str]) -> None:
+        """Remove partitions from the catalog, with the metadata of their logs.
+
+        Args:
+            paths (List[str]): Paths of the partitions
+        """
+        with self._connect() as connection:
+            connection.executemany(
+                "DELETE FROM log_metadata WHERE (contest, mode, year, callsign) IN "
+                "(SELECT contest, mode, year, callsign FROM partitions "
+                "WHERE path = ? AND kind = 'metadata')",
+                [(p,) for p in paths],
+            )
+            connection.executemany(
+                "DELETE FROM partitions WHERE path = ?", [(p,) for p in paths]
+            )
+
+    def contains(self, path: str) -> bool:
+        """Whether a partition is registered in the catalog and its file exists.
+
+        Partitions whose file does not exist anymore are removed from the catalog.
+
+        Args:
+            path (str): Path of the partition file
+
+        Returns:
+            bool: partition is registered and stored
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT 1 FROM partitions WHERE path = ?", (path,)
+            ).fetchone()
+        if row is None:
+            return False
+        if not os.path.exists(path):
+            self.unregister(paths=[path])
+            return False
+        return True
+
+    def list_partitions(self, kind: Optional[str] = None, **keys: Any) -> DataFrame:
+        """List the registered partitions matching the given keys.
+
+        Args:
+            kind (Optional[str]): Kind of partition. Defaults to None for all kinds.
+            keys (Any): Partition keys to filter on, e.g. contest="cqww", year=2022
+
+        Returns:
+            DataFrame: One row per partition
+        """
+        filters: Dict[str, Any] = {"kind": kind, **keys}
+        filters = {k: v for k, v in filters.items() if v is not None}
+        unknown = set(filters) - set(PARTITION_FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown partition keys: {sorted(unknown)}")
+        where, params = _where(filters=filters, columns=PARTITION_FILTERS)
+        query = " ".join(["SELECT * FROM partitions WHERE", where, "ORDER BY path"])
+        with self._connect() as connection:
+            return read_sql_query(query, connection, params=params)
+
+    def register_log_metadata(self, path: str, **keys: Any) -> None:
+        """Register (or update) the header metadata of a log.
+
+        Args:
+            path (str): Path of the stored metadata of the log, with a single row
+            keys (Any): Partition keys of the log: contest, mode, year and callsign
+        """
+        metadata = read_parquet(path).iloc[0]
+        record = {
+            "contest": keys["contest"],
+            "mode": keys["mode"],
+            "year": int(keys["year"]),
+            "callsign": keys["callsign"],
+            **{f: _to_sql(metadata.get(f)) for f in LOG_METADATA_FIELDS},
+        }
+        with self._connect() as connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO log_metadata ({', '.join(record)}) "
+                f"VALUES ({', '.join('?' * len(record))})",
+                list(record.values()),
+            )
+
+    def list_log_metadata(self, **filters: Any) -> DataFrame:
+        """List the metadata of the stored logs matching the given fields.
+
+        Args:
+            filters (Any): Partition keys or metadata fields to filter on, e.g.
+                year=2022, category_operator="SINGLE-OP", continent="EU". None values
+                are ignored.
+
+        Returns:
+            DataFrame: One row per log
+        """
+        filters = {k: v for k, v in filters.items() if v is not None}
+        unknown = set(filters) - set(LOG_METADATA_FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown metadata fields: {sorted(unknown)}")
+        where, params = _where(
+            filters={k: _to_sql(v) for k, v in filters.items()},
+            columns=LOG_METADATA_FILTERS,
+        )
+        query = " ".join(
+            [
+                "SELECT * FROM log_metadata WHERE",
+                where,
+                "ORDER BY contest, mode, year, callsign",
+            ]
+        )
+        with self._connect() as connection:
+            data = read_sql_query(query, connection, params=params)
+        return data.astype({"category_assisted": "boolean"})
+
+    def validate(self, checksums: bool = False) -> DataFrame:
+        """Find registered partitions whose file is missing or has changed.
+
+        By default, only the size and modification time of each file are checked,
+        which takes a single stat call per partition.
+
+        Args:
+            checksums (bool): Also compare the checksum of each file. Defaults to
+                False.
+
+        Returns:
+            DataFrame: Invalid partitions, with a column `problem`
+        """
+        partitions = self.list_partitions()
+        problems = []
+        for row in partitions.itertuples(index=False):
+            try:
+                stat = os.stat(row.path)
+            except FileNotFoundError:
+                problems.append("missing")
+                continue
+            if stat.st_size != row.bytes or stat.st_mtime != row.mtime:
+                problems.append("modified")
+            elif checksums and _file_checksum(row.path) != row.checksum:
+                problems.append("checksum")
+            else:
+                problems.append(None)
+        return (
+            partitions.assign(problem=problems)
+            .dropna(subset=["problem"])
+            .reset_index(drop=True)
+        )
+
+    def sync(self, prefix: str) -> int:
+        """Register the partitions found in storage that are not in the catalog.
+
+        Partitions registered in the catalog whose file does not exist anymore are
+        removed.
+
+        Args:
+            prefix (str): Storage prefix to scan
+
+        Returns:
+            int: Number of partitions added
+        """
+        patterns = {kind: _path_pattern(kind) for kind in PATHS_BY_KIND}
+        registered = set(self.list_partitions()["path"])
+        added = 0
+        for root, _, files in os.walk(prefix):
+            if "data.parquet" not in files:
+                continue
+            path = os.path.join(root, "data.parquet")
+            if path in registered:
+                continue
+            for kind, pattern in patterns.items():
+                match = pattern.fullmatch(path)
+                if match is not None:
+                    keys = match.groupdict()
+                    self.register(kind=kind, path=path, **keys)
+                    if kind == "metadata":
+                        self.register_log_metadata(path=path, **keys)
+                    added += 1
+                    break
+        missing = self.validate().query("problem == 'missing'")["path"].tolist()
+        self.unregister(paths=missing)
+        logger.info(f"Catalog sync: {added} added, {len(missing)} removed")
+        return added
+
+
+def _where(filters: Dict[str, Any], columns: List[str]) -> Tuple[str, List[Any]]:
+    """WHERE clause of the filters on a fixed list of columns, with placeholders.
+
+    Only the given columns are written in the clause, never the keys of the
+    filters.
+    """
+    given = [c for c in columns if c in filters]
+    where = " AND ".join(f"{c} = ?" for c in given) or "1"
+    return where, [filters[c] for c in given]
+
+
+def _to_sql(value: Any) -> Any:
+    """Convert a metadata value to a type supported by SQLite."""
+    if isna(value):
+        return None
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def _path_pattern(kind: str) -> "re.Pattern[str]":
+    """Regular expression matching the file paths of a kind of partition."""
+    template = getattr(get_settings().storage.paths, PATHS_BY_KIND[kind])
+    pattern = re.escape(os.path.join(template, "data.parquet"))
+    return re.compile(re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>[^/]+)", pattern))
+
+
+def partition_keys(kind: str, path: str) -> Optional[Dict[str, str]]:
+    """Partition keys of a file path in storage.
+
+    Args:
+        kind (str): Kind of partition, e.g. contest or rbn
+        path (str): Path of the partition file
+
+    Returns:
+        Optional[Dict[str, str]]: Partition keys, or None if the path does not
+            match the storage layout of the given kind
+    """
+    match = _path_pattern(kind).fullmatch(path)
+    return None if match is None else match.groupdict()
+
+
+@lru_cache()
+def _get_catalog(path: str) -> StorageCatalog:
+    return StorageCatalog(path=path)
+
+
+def get_catalog() -> StorageCatalog:
+    """Get the catalog of the storage configured in the settings."""
+    return _get_catalog(get_settings().storage.paths.catalog)
@@ -0,0 +1,69 @@
+"""Arrow IPC hot cache of the stored data sets.
+
+Parquet is the storage format of record. Next to each Parquet file, an uncompressed
+Arrow IPC (Feather v2) copy can be kept, which is memory-mapped on read instead of
+being decompressed by every process loading it.
+"""
+from logging import getLogger
+from os import PathLike
+from os import path
+from typing import Any
+from typing import ClassVar
+from typing import Mapping
+from typing import Union
+
+from pandas import DataFrame
+from pandas import read_parquet
+
+from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.data.storage_sink import StorageDataSink
+
+
+logger = getLogger(__name__)
+
+
+class HotCacheDataSink(StorageDataSink):
+    """Arrow IPC hot cache storage data sink definition."""
+
+    file_format: ClassVar[str] = "feather"
+    storage_options: ClassVar[Mapping[str, Any]] = {"compression": "uncompressed"}
+    path: ClassVar[Union[str, PathLike]] = "data.feather"
+
+    def prepare_output(self, data: DataFrame) -> DataFrame:
+        """Prepare output to sink, since feather only stores a default index."""
+        return data.reset_index(drop=True)
+
+
+def hot_cache_enabled() -> bool:
+    """Whether the hot cache is enabled in the storage settings."""
+    return get_settings().storage.hot_cache
+
+
+def get_hot_cache_path(path_data: Union[str, PathLike]) -> str:
+    """Get the path of the hot cache of a Parquet file.
+
+    Args:
+        path_data (Union[str, PathLike]): Path of the Parquet file
+
+    Returns:
+        str: Path of the hot cache file, in the same folder
+    """
+    return path.join(path.dirname(path_data), HotCacheDataSink.path)
+
+
+def ensure_hot_cache(path_data: Union[str, PathLike]) -> str:
+    """Build the hot cache of a Parquet file if it is missing or stale.
+
+    Args:
+        path_data (Union[str, PathLike]): Path of the Parquet file
+
+    Returns:
+        str: Path of the hot cache file
+    """
+    path_cache = get_hot_cache_path(path_data)
+    if not path.exists(path_cache) or path.getmtime(path_cache) < path.getmtime(
+        path_data
+    ):
+        logger.info(f"Build hot cache {path_cache}")
+        HotCacheDataSink(prefix=path.dirname(path_data)).push(read_parquet(path_data))
+    return path_cache
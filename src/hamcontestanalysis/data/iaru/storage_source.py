@@ -51,12 +51,12 @@ class CabrilloDataSource(RawContestCabrilloDataSource):
             year (int): Year of the contest
             mode (str): Mode of the contest
         """
-        hash_q = (
-            self.get_all_options()
-            .query(f"(callsign=='{callsign}') & (year == {year})")
-            .loc[:, "q"]
-            .values[0]
-        )
+        options = self.get_all_options()
+        hash_q = options.loc[
+            (options["callsign"] == callsign)
+            & (options["year"].astype(int) == int(year)),
+            "q",
+        ].values[0]
         self.path = self.path.format(q=hash_q)
         super().__init__(callsign=callsign, year=year, mode=mode)
         # TODO: fix the main class as in this case the prefix is not really so.
@@ -0,0 +1,158 @@
+"""Migrations of the processed contest logs between processing versions.
+
+Each processed log stores the version of the processing that produced it in its
+Parquet metadata. When the processing changes, `PROCESSING_VERSION` is bumped and a
+migration from the previous version is registered. Stale logs are then upgraded in
+place from their stored columns when they are loaded, running only the stages that
+changed, so that no log needs to be downloaded again.
+"""
+import os
+from ast import literal_eval
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+from pandas import DataFrame
+from pandas import read_parquet
+from pyarrow.parquet import read_schema
+
+from hamcontestanalysis.commons.cabrillo import parse_cabrillo_header
+from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.data.catalog import get_catalog
+from hamcontestanalysis.data.catalog import partition_keys
+from hamcontestanalysis.data.raw_contest_sink import PROCESSING_VERSION_KEY
+from hamcontestanalysis.data.raw_contest_sink import RawCabrilloDataSink
+from hamcontestanalysis.data.raw_contest_sink import RawCabrilloMetaDataSink
+
+
+logger = getLogger(__name__)
+
+# Version of the processing applied to the downloaded logs. Bump it whenever the
+# stored features change, and register the migration from the previous version.
+# 2: the Cabrillo header is stored once per log, not in a meta_data column.
+PROCESSING_VERSION = 2
+
+# Version of the logs stored before the processing version was recorded
+LEGACY_PROCESSING_VERSION = 1
+
+Migration = Callable[[DataFrame, Dict[str, Any]], DataFrame]
+MIGRATIONS: Dict[int, Migration] = {}
+
+
+def register_migration(from_version: int) -> Callable[[Migration], Migration]:
+    """Register the migration of a log from a version to the next one.
+
+    The migration is a function taking the data of the log and its partition keys
+    (contest, mode, year and callsign), and returning the upgraded data.
+
+    Args:
+        from_version (int): Version the migration upgrades from
+
+    Returns:
+        Callable[[Migration], Migration]: Decorator registering the migration
+    """
+
+    def decorator(function: Migration) -> Migration:
+        if from_version in MIGRATIONS:
+            raise ValueError(f"Migration from version {from_version} already exists")
+        MIGRATIONS[from_version] = function
+        return function
+
+    return decorator
+
+
+def read_processing_version(path: str) -> int:
+    """Processing version of a stored log, read from the Parquet footer.
+
+    Args:
+        path (str): Path of the Parquet file of the log
+
+    Returns:
+        int: Processing version
+    """
+    metadata = read_schema(path).metadata or {}
+    return int(metadata.get(PROCESSING_VERSION_KEY, LEGACY_PROCESSING_VERSION))
+
+
+def migrate_data(
+    data: DataFrame, partition: Dict[str, Any], from_version: int
+) -> DataFrame:
+    """Upgrade the data of a log to the current processing version.
+
+    Args:
+        data (DataFrame): Data of the log
+        partition (Dict[str, Any]): Partition keys of the log
+        from_version (int): Processing version of the data
+
+    Returns:
+        DataFrame: Upgraded data
+    """
+    for version in range(from_version, PROCESSING_VERSION):
+        logger.info(f"Migrate {partition} from version {version} to {version + 1}")
+        data = MIGRATIONS[version](data, partition)
+    return data
+
+
+def upgrade_partition(path: str) -> bool:
+    """Upgrade in place a stored log, if it is stale.
+
+    Args:
+        path (str): Path of the Parquet file of the log
+
+    Returns:
+        bool: The log has been upgraded
+    """
+    version = read_processing_version(path)
+    if version >= PROCESSING_VERSION:
+        return False
+    keys = partition_keys(kind=RawCabrilloDataSink.catalog_kind, path=path)
+    if keys is None:
+        raise ValueError(f"{path} is not a contest log in storage")
+    partition = dict(keys, year=int(keys["year"]))
+    data = migrate_data(
+        data=read_parquet(path), partition=partition, from_version=version
+    )
+    RawCabrilloDataSink(
+        prefix=os.path.dirname(path),
+        partition=dict(partition, processing_version=PROCESSING_VERSION),
+    ).push(data)
+    return True
+
+
+def upgrade_all(workers: int = 4) -> int:
+    """Upgrade all the stale logs in storage.
+
+    Args:
+        workers (int): Number of logs upgraded in parallel. Defaults to 4.
+
+    Returns:
+        int: Number of logs upgraded
+    """
+    catalog = get_catalog()
+    catalog.sync(prefix=get_settings().storage.prefix)
+    partitions = catalog.list_partitions(kind=RawCabrilloDataSink.catalog_kind)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        upgraded = list(executor.map(upgrade_partition, partitions["path"]))
+    logger.info(f"{sum(upgraded)} of {len(upgraded)} logs upgraded")
+    return sum(upgraded)
+
+
+@register_migration(from_version=1)
+def _move_header_to_metadata(data: DataFrame, partition: Dict[str, Any]) -> DataFrame:
+    """Store the Cabrillo header of the meta_data column once, as log metadata.
+
+    The continent of the station is not known without the country files, and is
+    left empty.
+    """
+    if "meta_data" not in data.columns:
+        return data
+    header = literal_eval(data["meta_data"].iloc[0]) if len(data) > 0 else {}
+    metadata = parse_cabrillo_header(header=header)
+    metadata["callsign"] = metadata["callsign"] or partition["callsign"].upper()
+    RawCabrilloMetaDataSink(
+        prefix=get_settings().storage.paths.raw_metadata.format(**partition),
+        partition=partition,
+    ).push(DataFrame([metadata]))
+    return data.drop(columns=["meta_data"])
@@ -0,0 +1,144 @@
+"""Per-minute aggregates of the processed contest logs.
+
+Next to the Parquet file of each processed log, its aggregates by contest minute,
+band and continent are stored, see `hamcontestanalysis.commons.pandas.aggregates`.
+They are built when the log is processed, or from the stored log when they are
+missing or stale, and the plots counting QSOs by time bin read them instead of the
+QSOs.
+"""
+from logging import getLogger
+from os import PathLike
+from os import path
+from typing import Any
+from typing import ClassVar
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from pandas import DataFrame
+from pandas import read_parquet
+from pyarrow.dataset import dataset
+
+from hamcontestanalysis.commons.pandas.aggregates import minute_aggregates
+from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.data.cache import files_key
+from hamcontestanalysis.data.cache import get_load_cache
+from hamcontestanalysis.data.migrations import upgrade_partition
+from hamcontestanalysis.data.processed_contest_source import ProcessedContestDataset
+from hamcontestanalysis.data.processed_contest_source import unify_partition_schemas
+from hamcontestanalysis.data.storage_sink import StorageDataSink
+from hamcontestanalysis.data.storage_source import StorageDataSource
+
+
+logger = getLogger(__name__)
+
+
+class MinuteAggregatesDataSink(StorageDataSink):
+    """Per-minute aggregates storage data sink definition."""
+
+    file_format: ClassVar[str] = "parquet"
+    path: ClassVar[Union[str, PathLike]] = "minutes.parquet"
+    storage_profile: ClassVar[Optional[str]] = "minutes"
+
+
+def get_minute_aggregates_path(path_data: Union[str, PathLike]) -> str:
+    """Get the path of the per-minute aggregates of a processed log.
+
+    Args:
+        path_data (Union[str, PathLike]): Path of the Parquet file of the log
+
+    Returns:
+        str: Path of the aggregates, in the same folder
+    """
+    return path.join(path.dirname(path_data), MinuteAggregatesDataSink.path)
+
+
+def ensure_minute_aggregates(path_data: Union[str, PathLike]) -> str:
+    """Build the per-minute aggregates of a processed log if missing or stale.
+
+    Args:
+        path_data (Union[str, PathLike]): Path of the Parquet file of the log
+
+    Returns:
+        str: Path of the aggregates
+    """
+    path_aggregates = get_minute_aggregates_path(path_data)
+    if not path.exists(path_aggregates) or path.getmtime(
+        path_aggregates
+    ) < path.getmtime(path_data):
+        logger.info(f"Build minute aggregates {path_aggregates}")
+        MinuteAggregatesDataSink(prefix=path.dirname(path_data)).push(
+            minute_aggregates(read_parquet(path_data))
+        )
+    return path_aggregates
+
+
+class MinuteAggregatesDataset(StorageDataSource):
+    """Per-minute aggregates of several processed logs, read as a single dataset.
+
+    The partition keys `contest` and `year` are read from the paths, as for the
+    processed logs.
+    """
+
+    file_format: ClassVar[str] = "parquet"
+    storage_options: ClassVar[Mapping[str, Any]] = {}
+    path: ClassVar[Union[str, PathLike]] = MinuteAggregatesDataSink.path
+
+    def __init__(
+        self,
+        contest: str,
+        mode: str,
+        callsigns_years: List[Tuple[str, int]],
+    ):
+        """Per-minute aggregates dataset constructor.
+
+        Args:
+            contest: string with the name of the contest
+            mode: string with the mode of the contest
+            callsigns_years: list of (callsign, year) pairs of the logs to read
+        """
+        self.contest = contest
+        self.mode = mode
+        self.callsigns_years = callsigns_years
+        self.partition_base_dir = get_settings().storage.prefix
+        self.paths_data = ProcessedContestDataset(
+            contest=contest, mode=mode, callsigns_years=callsigns_years
+        ).paths_data
+
+    def load(self) -> DataFrame:
+        """Load data from storage.
+
+        Logs stored by an older processing version are upgraded in place first, and
+        their aggregates built if missing or stale. Loads are served from the
+        process load cache whenever possible.
+
+        Returns:
+            DataFrame with the aggregates of all logs, with year and contest columns.
+        """
+        paths = []
+        for path_data in self.paths_data:
+            upgrade_partition(path_data)
+            paths.append(ensure_minute_aggregates(path_data))
+        return get_load_cache().get_or_load(
+            key=(type(self).__name__, files_key(paths)),
+            load=lambda _: self._load(paths=paths),
+        )
+
+    def _load(self, paths: List[str]) -> DataFrame:
+        """Scan the aggregates from storage, bypassing the load cache."""
+        partitioning = ProcessedContestDataset.hive_partitioning
+        source = dict(
+            source=paths,
+            format=self.file_format,
+            partitioning=partitioning,
+            partition_base_dir=self.partition_base_dir,
+        )
+        data_schema = unify_partition_schemas(
+            [f.physical_schema for f in dataset(**source).get_fragments()]
+            + [partitioning.schema]
+        )
+        columns = [c for c in data_schema.names if c != "callsign"]
+        table = dataset(**source, schema=data_schema).to_table(columns=columns)
+        return table.to_pandas().astype({"year": "int"}, copy=False)
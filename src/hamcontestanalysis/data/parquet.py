@@ -0,0 +1,144 @@
+"""Parquet layout of the stored data sets.
+
+The storage data sinks write Parquet files with the profile configured for them in
+the storage settings: compression codec and level, row group size, sort order and
+dictionary encoded columns. Sorting by the columns used in filters, e.g. the
+datetime, lets readers skip whole row groups from their statistics.
+
+The sort is only a row group layout concern. It is stable, so that rows with the
+same sort keys, e.g. QSOs logged in the same minute, keep their order, and it is
+skipped when the data is already sorted, as logs in time order are.
+"""
+import os
+import tempfile
+from logging import getLogger
+from os import PathLike
+from time import perf_counter
+from typing import Any
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Union
+
+from pandas import DataFrame
+from pandas import MultiIndex
+from pandas import RangeIndex
+from pandas import read_parquet
+from pyarrow import Table
+from pyarrow.parquet import write_table
+
+from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.config.storage import ParquetProfileSettings
+
+
+logger = getLogger(__name__)
+
+
+def get_parquet_profile(name: Optional[str]) -> ParquetProfileSettings:
+    """Get a Parquet profile from the storage settings.
+
+    Args:
+        name (Optional[str]): Name of the profile
+
+    Returns:
+        ParquetProfileSettings: Profile, or the default one (snappy, a single row
+            group and unsorted) if it is not configured
+    """
+    return get_settings().storage.parquet_profiles.get(name, ParquetProfileSettings())
+
+
+def write_parquet(
+    data: DataFrame,
+    path: Union[str, PathLike],
+    profile: ParquetProfileSettings,
+    metadata: Optional[Mapping[bytes, str]] = None,
+    **kwargs: Any,
+) -> None:
+    """Write data to a Parquet file with the given layout.
+
+    Sort keys and dictionary encoded columns missing in the data are ignored. Rows
+    are stably sorted by the sort keys, unless they are already in order.
+
+    Args:
+        data (DataFrame): Data to write
+        path (Union[str, PathLike]): Path of the file
+        profile (ParquetProfileSettings): Layout of the file
+        metadata (Optional[Mapping[bytes, str]]): Extra key-value metadata of the
+            schema. Defaults to None.
+        kwargs (Any): Additional keyword arguments of `pyarrow.parquet.write_table`
+    """
+    sort_by = [c for c in profile.sort_by if c in data.columns]
+    if sort_by and not _is_sorted(data=data, columns=sort_by):
+        data = data.sort_values(
+            sort_by, kind="stable", ignore_index=isinstance(data.index, RangeIndex)
+        )
+    table = Table.from_pandas(data)
+    if metadata:
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), **metadata}
+        )
+    use_dictionary = (
+        True
+        if profile.use_dictionary is None
+        else [c for c in profile.use_dictionary if c in table.column_names]
+    )
+    write_table(
+        table,
+        path,
+        compression=profile.compression,
+        compression_level=profile.compression_level,
+        row_group_size=profile.row_group_size,
+        use_dictionary=use_dictionary,
+        **kwargs,
+    )
+
+
+def _is_sorted(data: DataFrame, columns: List[str]) -> bool:
+    """Whether the rows are in ascending order of the given columns."""
+    if len(columns) == 1:
+        return data[columns[0]].is_monotonic_increasing
+    return MultiIndex.from_frame(data[columns]).is_monotonic_increasing
+
+
+def benchmark_profiles(
+    data: DataFrame,
+    profiles: Mapping[str, ParquetProfileSettings],
+    repeat: int = 3,
+) -> DataFrame:
+    """Compare the file size, write and read time of the data with several profiles.
+
+    Times are the best of `repeat` runs, with the file in the page cache.
+
+    Args:
+        data (DataFrame): Data to write
+        profiles (Mapping[str, ParquetProfileSettings]): Profiles to compare
+        repeat (int): Number of runs of each write and read. Defaults to 3.
+
+    Returns:
+        DataFrame: One row per profile, with its size in bytes and its write and
+            read times in seconds
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        for name, profile in profiles.items():
+            path = os.path.join(folder, f"{name}.parquet")
+            write_times, read_times = [], []
+            for _ in range(repeat):
+                start = perf_counter()
+                write_parquet(data=data, path=path, profile=profile)
+                write_times.append(perf_counter() - start)
+            for _ in range(repeat):
+                start = perf_counter()
+                read_parquet(path)
+                read_times.append(perf_counter() - start)
+            results.append(
+                {
+                    "profile": name,
+                    "compression": profile.compression,
+                    "bytes": os.path.getsize(path),
+                    "write_s": min(write_times),
+                    "read_s": min(read_times),
+                }
+            )
+            logger.info(f"Benchmarked profile {name}")
+    return DataFrame(results)
@@ -3,15 +3,81 @@ from os import PathLike
 from os import path
 from typing import Any
 from typing import ClassVar
+from typing import Dict
+from typing import List
 from typing import Mapping
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from pandas import DataFrame
+from pyarrow import ArrowInvalid
+from pyarrow import DataType
+from pyarrow import Schema
+from pyarrow import float64
+from pyarrow import int32
+from pyarrow import int64
+from pyarrow import null
+from pyarrow import schema
+from pyarrow import string
+from pyarrow import types
+from pyarrow import unify_schemas
+from pyarrow.dataset import Expression
+from pyarrow.dataset import Partitioning
+from pyarrow.dataset import dataset
+from pyarrow.dataset import partitioning
+from pyarrow.fs import LocalFileSystem
 
 from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.data.cache import files_key
+from hamcontestanalysis.data.cache import get_load_cache
+from hamcontestanalysis.data.hot_cache import ensure_hot_cache
+from hamcontestanalysis.data.hot_cache import hot_cache_enabled
+from hamcontestanalysis.data.migrations import upgrade_partition
 from hamcontestanalysis.data.storage_source import StorageDataSource
 
 
+def _promote_types(data_types: List[DataType]) -> DataType:
+    """Common type of the types of a column in several files."""
+    distinct = list(dict.fromkeys(t for t in data_types if not types.is_null(t)))
+    if not distinct:
+        return null()
+    if len(distinct) == 1:
+        return distinct[0]
+    if all(types.is_integer(t) for t in distinct):
+        return int64()
+    if all(types.is_integer(t) or types.is_floating(t) for t in distinct):
+        return float64()
+    return string()
+
+
+def unify_partition_schemas(schemas: List[Schema]) -> Schema:
+    """Unify the schemas of several partitions of a dataset, without metadata.
+
+    Columns missing in some partitions are kept, to be read as nulls. Columns whose
+    type differs between partitions, e.g. written by different processing
+    versions, are promoted to a common type: int64 for integers, float64 for
+    numbers and string otherwise.
+
+    Args:
+        schemas (List[Schema]): Schemas of the partitions
+
+    Returns:
+        Schema: Unified schema
+    """
+    try:
+        return unify_schemas(schemas).remove_metadata()
+    except ArrowInvalid:
+        pass
+    field_types: Dict[str, List[DataType]] = {}
+    for partition_schema in schemas:
+        for partition_field in partition_schema:
+            field_types.setdefault(partition_field.name, []).append(
+                partition_field.type
+            )
+    return schema([(name, _promote_types(t)) for name, t in field_types.items()])
+
+
 class ProcessedContestDataSource(StorageDataSource):
     """Processed contest data source definition."""
 
@@ -54,16 +120,150 @@ class ProcessedContestDataSource(StorageDataSource):
             callsign=self.callsign, contest=self.contest, year=self.year, mode=self.mode
         )
 
-    def load(self) -> DataFrame:
+    def load(self, columns: Optional[List[str]] = None) -> DataFrame:
         """Load data from storage.
 
         This method reads the data from the given storage path according to the
-        specified file format and returns the read and processed dataframe.
+        specified file format and returns the read and processed dataframe. If the
+        hot cache is enabled, its memory-mapped copy is read instead. Logs stored by
+        an older processing version are upgraded in place first. Loads are served
+        from the process load cache whenever possible.
+
+        Args:
+            columns: list of columns to read. Defaults to None to read all columns.
 
         Returns:
             DataFrame loaded and processed.
         """
+        upgrade_partition(self.path_data)
+        return get_load_cache().get_or_load(
+            key=(type(self).__name__, files_key([self.path_data])),
+            load=self._load,
+            columns=columns,
+        )
+
+    def _load(self, columns: Optional[List[str]] = None) -> DataFrame:
+        """Read data from storage, bypassing the load cache."""
+        if hot_cache_enabled():
+            return self.read(
+                file_format="feather",
+                path=ensure_hot_cache(self.path_data),
+                columns=columns,
+            )
         _data = self.read(
-            file_format=self.file_format, path=self.path_data, **self.storage_options
+            file_format=self.file_format,
+            path=self.path_data,
+            columns=columns,
+            **self.storage_options,
         )
         return _data
+
+
+class ProcessedContestDataset(StorageDataSource):
+    """Processed contest data of several logs, read as a single dataset.
+
+    The logs are Hive partitions of the contest storage, and the partition keys
+    `contest`, `year` and `callsign` are read from the paths. The file column `mode`
+    is not a partition key, since it holds the mode of each QSO.
+    """
+
+    file_format: ClassVar[str] = "parquet"
+    storage_options: ClassVar[Mapping[str, Any]] = {}
+    path: ClassVar[Union[str, PathLike]] = "data.parquet"
+    hive_partitioning: ClassVar[Partitioning] = partitioning(
+        schema([("contest", string()), ("year", int32()), ("callsign", string())]),
+        flavor="hive",
+    )
+
+    def __init__(
+        self,
+        contest: str,
+        mode: str,
+        callsigns_years: List[Tuple[str, int]],
+    ):
+        """Processed contest dataset constructor.
+
+        Args:
+            contest: string with the name of the contest
+            mode: string with the mode of the contest
+            callsigns_years: list of (callsign, year) pairs of the logs to read
+        """
+        settings = get_settings()
+        self.contest = contest
+        self.mode = mode
+        self.callsigns_years = callsigns_years
+        self.partition_base_dir = settings.storage.prefix
+        self.paths_data = list(
+            dict.fromkeys(
+                ProcessedContestDataSource(
+                    callsign=callsign.lower(), contest=contest, year=year, mode=mode
+                ).path_data
+                for callsign, year in callsigns_years
+            )
+        )
+
+    def load(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Expression] = None,
+    ) -> DataFrame:
+        """Load data from storage.
+
+        All logs are read in a single multi-threaded scan. Their schemas are unified,
+        so that columns missing in some logs are filled with nulls, and columns
+        stored with different types are read with a common type. If the hot cache
+        is enabled, the memory-mapped copies of the logs are scanned instead. Logs
+        stored by an older processing version are upgraded in place first. Loads
+        without filters are served from the process load cache whenever possible.
+
+        Args:
+            columns: list of columns to read. Columns not stored in any of the logs
+                are ignored, and year and contest are always returned. Defaults to
+                None to read all columns.
+            filters: pyarrow expression to filter rows while scanning, e.g. on the
+                partition keys. Defaults to None.
+
+        Returns:
+            DataFrame with the QSOs of all logs, with year and contest columns.
+        """
+        for path_data in self.paths_data:
+            upgrade_partition(path_data)
+        if filters is not None:
+            return self._load(columns=columns, filters=filters)
+        return get_load_cache().get_or_load(
+            key=(type(self).__name__, files_key(self.paths_data)),
+            load=self._load,
+            columns=columns,
+        )
+
+    def _load(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Expression] = None,
+    ) -> DataFrame:
+        """Scan the logs from storage, bypassing the load cache."""
+        if hot_cache_enabled():
+            source = dict(
+                source=[ensure_hot_cache(p) for p in self.paths_data],
+                format="ipc",
+                filesystem=LocalFileSystem(use_mmap=True),
+            )
+        else:
+            source = dict(source=self.paths_data, format=self.file_format)
+        source.update(
+            partitioning=self.hive_partitioning,
+            partition_base_dir=self.partition_base_dir,
+        )
+        data_schema = unify_partition_schemas(
+            [f.physical_schema for f in dataset(**source).get_fragments()]
+            + [self.hive_partitioning.schema]
+        )
+        data = dataset(**source, schema=data_schema)
+        if columns is None:
+            columns = [c for c in data_schema.names if c != "callsign"]
+        else:
+            columns = [c for c in dict.fromkeys(columns) if c in data_schema.names] + [
+                c for c in ["contest", "year"] if c not in columns
+            ]
+        table = data.to_table(columns=columns, filter=filters)
+        return table.to_pandas().astype({"year": "int"}, copy=False)
@@ -1,14 +1,26 @@
 """Contest cabrillo data source module."""
+from datetime import date
 from os import PathLike
 from os import path
 from typing import Any
 from typing import ClassVar
+from typing import Iterator
+from typing import List
 from typing import Mapping
+from typing import Optional
 from typing import Union
 
 from pandas import DataFrame
+from pandas import concat
+from pandas import date_range
+from pyarrow.dataset import Expression
+from pyarrow.dataset import dataset
 
 from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.data.cache import files_key
+from hamcontestanalysis.data.cache import get_load_cache
+from hamcontestanalysis.data.hot_cache import ensure_hot_cache
+from hamcontestanalysis.data.hot_cache import hot_cache_enabled
 from hamcontestanalysis.data.storage_source import StorageDataSource
 
 
@@ -47,12 +59,145 @@ class ProcessedReverseBeaconDataSource(StorageDataSource):
         """Load data from storage.
 
         This method reads the data from the given storage path according to the
-        specified file format and returns the read and processed dataframe.
+        specified file format and returns the read and processed dataframe. If the
+        hot cache is enabled, its memory-mapped copy is read instead. Loads are
+        served from the process load cache whenever possible.
 
         Returns:
             DataFrame loaded and processed.
         """
+        return get_load_cache().get_or_load(
+            key=(type(self).__name__, files_key([self.path_data])),
+            load=lambda _: self._load(),
+        )
+
+    def _load(self) -> DataFrame:
+        """Read data from storage, bypassing the load cache."""
+        if hot_cache_enabled():
+            return self.read(
+                file_format="feather", path=ensure_hot_cache(self.path_data)
+            )
+        _data = self.read(
+            file_format=self.file_format, path=self.path_data, **self.storage_options
+        )
+        return _data
+
+    def iter_batches(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Expression] = None,
+        batch_size: int = 1_000_000,
+    ) -> Iterator[DataFrame]:
+        """Stream data from storage in batches of rows.
+
+        Only one batch is held in memory at a time, so that data sets larger than
+        memory can be processed.
+
+        Args:
+            columns: list of columns to read. Defaults to None to read all columns.
+            filters: pyarrow expression to filter rows while scanning. Defaults to
+                None.
+            batch_size: maximum number of rows per batch. Defaults to 1_000_000.
+
+        Yields:
+            DataFrame with each batch of rows.
+        """
+        scanner = dataset(self.path_data, format=self.file_format).scanner(
+            columns=columns, filter=filters, batch_size=batch_size
+        )
+        for batch in scanner.to_batches():
+            if batch.num_rows > 0:
+                yield batch.to_pandas()
+
+
+class ProcessedReverseBeaconCalibrationDataSource(StorageDataSource):
+    """Processed RBN skimmer calibration data source definition."""
+
+    file_format: ClassVar[str] = "parquet"
+    storage_options: ClassVar[Mapping[str, Any]] = {}
+    path: ClassVar[Union[str, PathLike]] = "data.parquet"
+
+    def __init__(
+        self,
+        contest: str,
+        year: int,
+        mode: str,
+    ):
+        """Processed RBN skimmer calibration data source constructor.
+
+        Args:
+            contest: string with the name of the contest
+            year: integer with the year of the contest
+            mode: string with the mode of the contest
+        """
+        settings = get_settings()
+        prefix_data = settings.storage.paths.raw_rbn_calibration
+
+        self.contest = contest
+        self.year = year
+        self.mode = mode
+        self.path_data = (
+            self.path if prefix_data is None else path.join(prefix_data, self.path)
+        ).format(contest=self.contest, year=self.year, mode=self.mode)
+
+    def load(self) -> DataFrame:
+        """Load data from storage.
+
+        Returns:
+            DataFrame with the calibration offsets per skimmer and band.
+        """
         _data = self.read(
             file_format=self.file_format, path=self.path_data, **self.storage_options
         )
         return _data
+
+
+class ProcessedReverseBeaconDateDataSource(StorageDataSource):
+    """Processed RBN data source for ad-hoc date ranges."""
+
+    file_format: ClassVar[str] = "parquet"
+    storage_options: ClassVar[Mapping[str, Any]] = {}
+    path: ClassVar[Union[str, PathLike]] = "data.parquet"
+
+    def __init__(
+        self,
+        start_date: date,
+        end_date: date,
+        mode: str,
+    ):
+        """Processed RBN date range data source constructor.
+
+        Args:
+            start_date: first day to load
+            end_date: last day to load (included)
+            mode: string with the transmission mode of the spots, e.g. cw
+        """
+        settings = get_settings()
+        prefix_data = settings.storage.paths.raw_rbn_date
+
+        self.start_date = start_date
+        self.end_date = end_date
+        self.mode = mode.lower()
+        self.paths_data = [
+            (
+                self.path if prefix_data is None else path.join(prefix_data, self.path)
+            ).format(mode=self.mode, date=rbn_date.strftime("%Y-%m-%d"))
+            for rbn_date in date_range(start_date, end_date, freq="D")
+        ]
+
+    def load(self) -> DataFrame:
+        """Load data from storage.
+
+        Days that have not been downloaded are skipped.
+
+        Returns:
+            DataFrame with the spots of the date range.
+        """
+        data = [
+            self.read(file_format=self.file_format, path=p, **self.storage_options)
+            for p in self.paths_data
+            if path.exists(p)
+        ]
+        if not data:
+            return DataFrame()
+        return concat(data, sort=False).reset_index(drop=True)
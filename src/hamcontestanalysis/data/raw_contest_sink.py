@@ -1,27 +1,63 @@
 """HamContestAnalysis CQWW contest storage data sink module."""
 from os import PathLike
 from typing import ClassVar
+from typing import Dict
+from typing import Optional
 from typing import Union
 
 from pandas import DataFrame
 
+from hamcontestanalysis.data.catalog import LOG_METADATA_FIELDS
+from hamcontestanalysis.data.catalog import get_catalog
 from hamcontestanalysis.data.storage_sink import StorageDataSink
 
 
+# Key of the Parquet schema metadata holding the processing version of a log
+PROCESSING_VERSION_KEY = b"hamcontestanalysis.processing_version"
+
+
 class RawCabrilloDataSink(StorageDataSink):
-    """Contest storage data sink definition."""
+    """Contest storage data sink definition.
+
+    If the partition keys include a `processing_version`, it is stamped in the schema
+    metadata of the Parquet file, so that stale logs can be detected and migrated.
+    """
 
     file_format: ClassVar[str] = "parquet"
     path: ClassVar[Union[str, PathLike]] = "data.parquet"
+    catalog_kind: ClassVar[Optional[str]] = "contest"
+    storage_profile: ClassVar[Optional[str]] = "contest"
+
+    def parquet_metadata(self) -> Dict[bytes, str]:
+        """Processing version of the log, if given in the partition keys."""
+        version = (self.partition or {}).get("processing_version")
+        return {} if version is None else {PROCESSING_VERSION_KEY: str(version)}
 
 
 class RawCabrilloMetaDataSink(StorageDataSink):
-    """Contest storage meta data sink definition."""
+    """Contest storage meta data sink definition.
+
+    It stores a single row with the metadata parsed from the header of a log, which
+    is also registered in the storage catalog to query logs by category.
+    """
 
     file_format: ClassVar[str] = "parquet"
     path: ClassVar[Union[str, PathLike]] = "data.parquet"
+    catalog_kind: ClassVar[Optional[str]] = "metadata"
+    storage_profile: ClassVar[Optional[str]] = "metadata"
 
     def prepare_output(self, data: DataFrame) -> DataFrame:
         """Prepare output to sink."""
-        _df = DataFrame(data.attrs, index=[1]).T.rename(columns={1: "value"})
-        return _df
+        return data.reindex(columns=["callsign"] + LOG_METADATA_FIELDS).astype(
+            {"claimed_score": "Int64", "category_assisted": "boolean"}
+        )
+
+    def push(self, data: DataFrame) -> None:
+        """Push the metadata of a log to storage and register it in the catalog.
+
+        Args:
+            data: pandas.DataFrame with the metadata of the log, in a single row.
+        """
+        super().push(data=data)
+        if self.partition is not None:
+            get_catalog().register_log_metadata(path=self.path, **self.partition)
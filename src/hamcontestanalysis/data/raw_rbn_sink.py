@@ -1,6 +1,7 @@
 """HamContestAnalysis CQWW contest storage data sink module."""
 from os import PathLike
 from typing import ClassVar
+from typing import Optional
 from typing import Union
 
 from hamcontestanalysis.data.storage_sink import StorageDataSink
@@ -11,3 +12,23 @@ class RawReverseBeaconDataSink(StorageDataSink):
 
     file_format: ClassVar[str] = "parquet"
     path: ClassVar[Union[str, PathLike]] = "data.parquet"
+    catalog_kind: ClassVar[Optional[str]] = "rbn"
+    storage_profile: ClassVar[Optional[str]] = "rbn"
+
+
+class RawReverseBeaconCalibrationDataSink(StorageDataSink):
+    """Reverse Beacon skimmer calibration storage data sink definition."""
+
+    file_format: ClassVar[str] = "parquet"
+    path: ClassVar[Union[str, PathLike]] = "data.parquet"
+    catalog_kind: ClassVar[Optional[str]] = "rbn_calibration"
+    storage_profile: ClassVar[Optional[str]] = "rbn_calibration"
+
+
+class RawReverseBeaconDateDataSink(StorageDataSink):
+    """Reverse Beacon date partitioned storage data sink definition."""
+
+    file_format: ClassVar[str] = "parquet"
+    path: ClassVar[Union[str, PathLike]] = "data.parquet"
+    catalog_kind: ClassVar[Optional[str]] = "rbn_date"
+    storage_profile: ClassVar[Optional[str]] = "rbn_date"
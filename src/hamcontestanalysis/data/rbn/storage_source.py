@@ -20,9 +20,6 @@ from hamcontestanalysis.config import get_settings
 from hamcontestanalysis.data.storage_source import StorageDataSource
 
 
-call_info = get_call_info()
-
-
 class ReverseBeaconRawDataSource(StorageDataSource):
     """Reverse beacon data source definition."""
 
@@ -39,6 +36,7 @@ class ReverseBeaconRawDataSource(StorageDataSource):
         "speed": "int",
         "de_cont": "str",
         "dx_cont": "str",
+        "tx_mode": "str",
     }
 
     def __init__(
@@ -47,6 +45,7 @@ class ReverseBeaconRawDataSource(StorageDataSource):
         mode: str,
         contest: Optional[str] = None,
         dates: Optional[List[date]] = None,
+        tx_modes: Optional[List[str]] = None,
     ):
         """Raw contest cabrillo data source constructor.
 
@@ -55,6 +54,8 @@ class ReverseBeaconRawDataSource(StorageDataSource):
             year: integer with the year of the contest
             mode: string with the mode of the contest
             dates: if contest is None, dates to consider for custom downloads
+            tx_modes: transmission modes of the spots to keep (case insensitive),
+                e.g. cw or rtty. Defaults to None to keep all spots.
         """
         super().__init__(prefix=self.prefix)
         _settings = get_settings()
@@ -68,6 +69,7 @@ class ReverseBeaconRawDataSource(StorageDataSource):
                 getattr(_settings.contest, contest).modes, self.mode
             ).get_dates(year)
         )
+        self.tx_modes = None if tx_modes is None else [m.upper() for m in tx_modes]
 
     def load(self) -> DataFrame:
         """Load data from storage.
@@ -80,29 +82,44 @@ class ReverseBeaconRawDataSource(StorageDataSource):
         """
         if self.mode.lower() == "ssb":
             return DataFrame()
-        data = []
-        for contest_date in self.dates:
-            contest_date_str = contest_date.strftime("%Y%m%d")
-            resp = urlopen(f"{self.path.format(date=contest_date_str)}")
-            myzip = ZipFile(BytesIO(resp.read()))
-            data.append(read_csv(myzip.open(f"{contest_date_str}.csv")))
+        data = [self._read_date(rbn_date=rbn_date) for rbn_date in self.dates]
         return self.process_result(data=concat(data).reset_index(drop=True))
 
+    def load_date(self, rbn_date: date) -> DataFrame:
+        """Load and process the spots of a single day.
+
+        Args:
+            rbn_date: day to download
+
+        Returns:
+            DataFrame loaded and processed.
+        """
+        return self.process_result(data=self._read_date(rbn_date=rbn_date))
+
+    def _read_date(self, rbn_date: date) -> DataFrame:
+        date_str = rbn_date.strftime("%Y%m%d")
+        resp = urlopen(f"{self.path.format(date=date_str)}")
+        myzip = ZipFile(BytesIO(resp.read()))
+        return read_csv(myzip.open(f"{date_str}.csv"))
+
     def process_result(self, data: DataFrame) -> DataFrame:
         """Processes Performance output loaded data."""
+        if self.tx_modes is not None:
+            data = data.loc[data["tx_mode"].str.upper().isin(self.tx_modes)].copy()
+
         # Fill missing continents
         for p in data.query("de_cont.isnull()")["de_pfx"].unique():
             try:
-                data.loc[(data["de_pfx"] == p), "de_cont"] = call_info.get_continent(
-                    f"{p}1AA"
-                )
+                data.loc[
+                    (data["de_pfx"] == p), "de_cont"
+                ] = get_call_info().get_continent(f"{p}1AA")
             except KeyError:
                 continue
         for p in data.query("dx_cont.isnull()")["dx_pfx"].unique():
             try:
-                data.loc[(data["dx_pfx"] == p), "dx_cont"] = call_info.get_continent(
-                    f"{p}1AA"
-                )
+                data.loc[
+                    (data["dx_pfx"] == p), "dx_cont"
+                ] = get_call_info().get_continent(f"{p}1AA")
             except KeyError:
                 continue
 
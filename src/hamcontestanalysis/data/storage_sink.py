@@ -5,14 +5,19 @@ from os import PathLike
 from typing import Any
 from typing import Callable
 from typing import ClassVar
+from typing import Dict
 from typing import List
 from typing import Mapping
 from typing import Optional
 from typing import Union
+from uuid import uuid4
 
 from pandas import DataFrame
 
+from hamcontestanalysis.data.catalog import get_catalog
 from hamcontestanalysis.data.data_sink import DataSink
+from hamcontestanalysis.data.parquet import get_parquet_profile
+from hamcontestanalysis.data.parquet import write_parquet
 
 
 class StorageDataSink(DataSink, ABC):
@@ -39,46 +44,86 @@ class StorageDataSink(DataSink, ABC):
 
     The save method can be provided with additional keyword arguments via the
     `storage_options` class/instance variable.
+
+    If the class variable `catalog_kind` is set and the sink is given the keys of the
+    partition it writes, the partition is registered in the storage catalog once it
+    has been written.
+
+    Parquet files are written with the layout of the profile named by the class
+    variable `storage_profile` in the storage settings, e.g. its compression codec,
+    row group size and sort order.
     """
 
     file_format: ClassVar[str]
     path: ClassVar[Union[str, PathLike]]
     prefix: Optional[str]
+    catalog_kind: ClassVar[Optional[str]] = None
+    storage_profile: ClassVar[Optional[str]] = None
     storage_options: ClassVar[Mapping[str, Any]] = {}
-    supported_file_formats: ClassVar[List[str]] = ["csv", "parquet", "pickle"]
+    supported_file_formats: ClassVar[List[str]] = [
+        "csv",
+        "feather",
+        "parquet",
+        "pickle",
+    ]
     save_method_by_file_format: ClassVar[Mapping[str, Callable[..., DataFrame]]] = {
         "csv": "to_csv",
+        "feather": "to_feather",
         "parquet": "to_parquet",
         "pickle": "to_pickle",
     }
 
-    def __init__(self, prefix: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        prefix: Optional[str] = None,
+        partition: Optional[Mapping[str, Any]] = None,
+    ) -> None:
         """Storage Data Sink constructor.
 
         Args:
             prefix: string with prefix to prepend the data sinks's path. Defaults to
                 None to avoid prepending.
+            partition: keys of the partition written, e.g. contest, mode and year,
+                and optionally its processing_version, to register it in the storage
+                catalog. Defaults to None to skip the registration.
         """
         self.path = self.path if prefix is None else os.path.join(prefix, self.path)
         self.prefix = prefix
+        self.partition = partition
 
     def push(self, data: DataFrame) -> None:
         """Push data to storage.
 
         This method pushes the given DataFrame to the given storage path according to
-        the specified file format.
+        the specified file format. Data is written to a temporary file first and then
+        moved to the final path, so that an interrupted push never leaves a partial
+        file behind. The temporary file name is unique to each push, so that
+        concurrent pushes to the same path never write to the same file.
 
         Args:
             data: pandas.DataFrame with data to sink to storage.
         """
         output_data = self.prepare_output(data=data)
         self._create_prefix_folder()
-        self.save(
-            data=output_data,
-            file_format=self.file_format,
-            path=self.path,
-            **self.storage_options,
-        )
+        temporary_path = f"{self.path}.{uuid4().hex}.tmp"
+        try:
+            self.save(
+                data=output_data,
+                file_format=self.file_format,
+                path=temporary_path,
+                **self.storage_options,
+            )
+            os.replace(temporary_path, self.path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+        if self.catalog_kind is not None and self.partition is not None:
+            get_catalog().register(
+                kind=self.catalog_kind,
+                path=self.path,
+                rows=len(output_data),
+                **self.partition,
+            )
 
     def prepare_output(self, data: DataFrame) -> DataFrame:
         """Prepare output to sink."""
@@ -97,7 +142,8 @@ class StorageDataSink(DataSink, ABC):
         in the `StorageDataSink.save_method_by_file_format` mapping, and saves the given
         data to the given storage path. Additional keyword arguments are passed down to
         the save method. If no save method is set for the given file format, a
-        NotImplementedError is raised.
+        NotImplementedError is raised. Parquet files are written with the layout of
+        the sink's storage profile.
 
         Args:
             data: pandas.DataFrame with data to sink to storage.
@@ -110,9 +156,22 @@ class StorageDataSink(DataSink, ABC):
             raise NotImplementedError(
                 f"Saving to format {self.file_format} not implemented."
             )
+        if file_format == "parquet":
+            write_parquet(
+                data=data,
+                path=path,
+                profile=get_parquet_profile(self.storage_profile),
+                metadata=self.parquet_metadata(),
+                **kwargs,
+            )
+            return
         save_method = getattr(data, self.save_method_by_file_format[file_format])
         save_method(path, **kwargs)
 
+    def parquet_metadata(self) -> Dict[bytes, str]:
+        """Extra key-value metadata stored in the schema of Parquet files."""
+        return {}
+
     def _create_prefix_folder(self):
         if not os.path.exists(self.prefix):
             os.makedirs(self.prefix)
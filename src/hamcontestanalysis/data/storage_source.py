@@ -14,10 +14,33 @@ from urllib.request import urlopen
 from pandas import DataFrame
 from pandas import read_csv
 from pandas import read_parquet
+from pyarrow.feather import read_table
 
 from hamcontestanalysis.data.data_source import DataSource
 
 
+def read_arrow_ipc(
+    path: Union[str, PathLike],
+    columns: Optional[List[str]] = None,
+    memory_map: bool = True,
+) -> DataFrame:
+    """Read an Arrow IPC (Feather v2) file, memory-mapped by default.
+
+    Uncompressed files are not copied into the process memory when read, so that
+    several processes reading the same file share its pages through the OS cache.
+
+    Args:
+        path: string or os.PathLike with path of the file to read.
+        columns: list of columns to read. Defaults to None to read all columns.
+        memory_map: memory-map the file instead of reading it. Defaults to True.
+
+    Returns:
+        Dataframe with data from storage.
+    """
+    table = read_table(path, columns=columns, memory_map=memory_map)
+    return table.to_pandas(split_blocks=True)
+
+
 class StorageDataSource(DataSource, ABC):
     """Storage Data Source abstract class.
 
@@ -47,9 +70,15 @@ class StorageDataSource(DataSource, ABC):
     path: ClassVar[Union[str, PathLike]]
     prefix: Optional[str]
     storage_options: ClassVar[Mapping[str, Any]] = {}
-    supported_file_formats: ClassVar[List[str]] = ["csv", "parquet", "pickle"]
+    supported_file_formats: ClassVar[List[str]] = [
+        "csv",
+        "feather",
+        "parquet",
+        "pickle",
+    ]
     read_method_by_file_format: ClassVar[Mapping[str, Callable[..., DataFrame]]] = {
         "csv": read_csv,
+        "feather": read_arrow_ipc,
         "parquet": read_parquet,
     }
 
@@ -0,0 +1,201 @@
+"""Server-side cache of the data loaded by the dashboard sessions.
+
+The data loaded for a selection of logs is stored as uncompressed Arrow IPC files
+in the temporary storage, under a key derived from the selection, which is kept by
+the browser session. Every worker process serving the dashboard reads them
+memory-mapped, so that workers share the same pages through the OS cache, and the
+callbacks of a session get read-only views of its data instead of copies. Sessions
+with the same selection share their data, and different selections never overwrite
+each other.
+
+The cache is bounded by a disk budget, evicting the least recently used selections.
+"""
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from logging import getLogger
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from pandas import DataFrame
+
+from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.data.hot_cache import HotCacheDataSink
+from hamcontestanalysis.data.storage_source import read_arrow_ipc
+
+
+logger = getLogger(__name__)
+
+
+def digest_key(value: Any) -> str:
+    """Short, stable digest of a JSON serializable value, to be used as a cache key.
+
+    Args:
+        value (Any): Value describing the cached item. Objects that are not JSON
+            serializable are converted to strings.
+
+    Returns:
+        str: Hexadecimal digest of the value
+    """
+    description = json.dumps(value, default=str)
+    return blake2b(description.encode(), digest_size=8).hexdigest()
+
+
+class SessionDataCache:
+    """Disk-backed cache of the dashboard data, shared by all worker processes."""
+
+    def __init__(self, folder: str, max_bytes: int, max_memory_entries: int = 8):
+        """Session data cache constructor.
+
+        Args:
+            folder (str): Folder of the cached data
+            max_bytes (int): Disk budget of the cached data
+            max_memory_entries (int): Data sets kept mapped in each process.
+                Defaults to 8.
+        """
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[Tuple[str, int], DataFrame]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        contest: str,
+        mode: str,
+        callsigns_years: List[Tuple[str, int]],
+        rbn_years: Optional[List[int]] = None,
+    ) -> str:
+        """Key of the data of a selection of logs.
+
+        Args:
+            contest (str): Name of the contest
+            mode (str): Mode of the contest
+            callsigns_years (List[Tuple[str, int]]): Callsign and year of each log
+            rbn_years (Optional[List[int]]): Years with RBN data. Defaults to None.
+
+        Returns:
+            str: Key of the selection
+        """
+        return digest_key(
+            [
+                contest,
+                mode,
+                sorted([c.upper(), int(y)] for c, y in callsigns_years),
+                sorted(int(y) for y in rbn_years or []),
+            ]
+        )
+
+    def _path(self, key: str, name: str) -> str:
+        return os.path.join(self.folder, key, name, HotCacheDataSink.path)
+
+    def put(self, key: str, name: str, data: DataFrame) -> None:
+        """Store a data set of a selection, evicting old selections if needed.
+
+        Args:
+            key (str): Key of the selection
+            name (str): Name of the data set, e.g. contest or rbn
+            data (DataFrame): Data set
+        """
+        HotCacheDataSink(prefix=os.path.dirname(self._path(key, name))).push(data)
+        self._evict(keep=key)
+
+    def get(self, key: str, name: str) -> Optional[DataFrame]:
+        """Get a data set of a selection, as a read-only view.
+
+        Args:
+            key (str): Key of the selection
+            name (str): Name of the data set, e.g. contest or rbn
+
+        Returns:
+            Optional[DataFrame]: Data set, or None if it is not cached
+        """
+        path = self._path(key, name)
+        try:
+            memory_key = (path, os.stat(path).st_mtime_ns)
+            os.utime(os.path.join(self.folder, key))
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            if memory_key in self._memory:
+                self._memory.move_to_end(memory_key)
+                return self._memory[memory_key]
+        data = read_arrow_ipc(path, memory_map=True)
+        with self._lock:
+            self._memory[memory_key] = data
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+        return data
+
+    def recent_keys(self, limit: int) -> List[str]:
+        """Keys of the most recently used selections.
+
+        Args:
+            limit (int): Most keys returned
+
+        Returns:
+            List[str]: Keys of the selections, the most recently used first
+        """
+        if not os.path.isdir(self.folder):
+            return []
+        keys = sorted(
+            os.listdir(self.folder),
+            key=lambda k: os.path.getmtime(os.path.join(self.folder, k)),
+            reverse=True,
+        )
+        return keys[:limit]
+
+    def warm(self, key: str, chunk_size: int = 8 * 1024**2) -> None:
+        """Map the data sets of a selection and read them into the OS page cache.
+
+        Args:
+            key (str): Key of the selection
+            chunk_size (int): Bytes read at a time. Defaults to 8 MB.
+        """
+        for name in sorted(os.listdir(os.path.join(self.folder, key))):
+            if self.get(key=key, name=name) is None:
+                continue
+            with open(self._path(key, name), "rb") as file:
+                while file.read(chunk_size):
+                    pass
+
+    def _evict(self, keep: str) -> None:
+        """Remove the least recently used selections beyond the disk budget."""
+        entries = []
+        for key in os.listdir(self.folder):
+            folder = os.path.join(self.folder, key)
+            size = sum(
+                os.path.getsize(os.path.join(root, f))
+                for root, _, files in os.walk(folder)
+                for f in files
+            )
+            entries.append((os.path.getmtime(folder), key, size))
+        total = sum(size for _, _, size in entries)
+        for _, key, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            logger.info(f"Evict dashboard data {key}")
+            shutil.rmtree(os.path.join(self.folder, key), ignore_errors=True)
+            total -= size
+
+
+@lru_cache()
+def _get_session_cache(folder: str, max_bytes: int) -> SessionDataCache:
+    return SessionDataCache(folder=folder, max_bytes=max_bytes)
+
+
+def get_session_cache() -> SessionDataCache:
+    """Get the session data cache with the disk budget of the storage settings."""
+    settings = get_settings()
+    return _get_session_cache(
+        folder=os.path.join(settings.storage.paths.temporary, "dashboard"),
+        max_bytes=settings.storage.dashboard_cache_mb * 1024**2,
+    )
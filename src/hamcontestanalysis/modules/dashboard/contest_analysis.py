@@ -1,5 +1,16 @@
 """HamContestAnalysis dashboard."""
 import importlib
+import json
+import os
+import re
+from functools import lru_cache
+from functools import partial
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
 
 import dash
 import dash_bootstrap_components as dbc
@@ -8,14 +19,33 @@ from dash import html
 from dash.dependencies import Input
 from dash.dependencies import Output
 from dash.dependencies import State
-from pandas import concat
+from flask import Flask
+from flask import jsonify
+from flask import request
+from pandas import DataFrame
+from plotly.graph_objects import Figure
 
+from hamcontestanalysis.commons.cabrillo import CATEGORY_V2_TOKENS
+from hamcontestanalysis.commons.pandas.rolling import add_rolling_rates
+from hamcontestanalysis.commons.pandas.selection import select_logs
 from hamcontestanalysis.config import get_settings
-from hamcontestanalysis.modules.download.main import download_contest_data
-from hamcontestanalysis.modules.download.main import download_rbn_data
-from hamcontestanalysis.modules.download.main import exists
-from hamcontestanalysis.modules.download.main import exists_rbn
+from hamcontestanalysis.data.cache import get_load_cache
+from hamcontestanalysis.data.callsign_index import get_built_callsign_index
+from hamcontestanalysis.data.callsign_index import get_callsign_index
+from hamcontestanalysis.data.callsign_index import options_path
+from hamcontestanalysis.data.callsign_index import search_logs
+from hamcontestanalysis.data.minute_aggregates import MinuteAggregatesDataset
+from hamcontestanalysis.data.processed_contest_source import ProcessedContestDataset
+from hamcontestanalysis.modules.dashboard.cache import SessionDataCache
+from hamcontestanalysis.modules.dashboard.cache import get_session_cache
+from hamcontestanalysis.modules.dashboard.figures import FigureCache
+from hamcontestanalysis.modules.dashboard.figures import get_figure_cache
+from hamcontestanalysis.modules.dashboard.jobs import get_download_jobs
+from hamcontestanalysis.modules.dashboard.jobs import job_progress
+from hamcontestanalysis.modules.dashboard.startup import get_startup_timer
+from hamcontestanalysis.modules.dashboard.startup import prewarm
 from hamcontestanalysis.plots.common.plot_frequency import PlotFrequency
+from hamcontestanalysis.plots.common.plot_log_heatmap import LogHeatmapCalls
 from hamcontestanalysis.plots.common.plot_log_heatmap import PlotLogHeatmap
 from hamcontestanalysis.plots.common.plot_minutes_from_previous_call import (
     PlotMinutesPreviousCall,
@@ -23,34 +53,412 @@ from hamcontestanalysis.plots.common.plot_minutes_from_previous_call import (
 from hamcontestanalysis.plots.common.plot_qso_direction import PlotQsoDirection
 from hamcontestanalysis.plots.common.plot_qsos_hour import PlotQsosHour
 from hamcontestanalysis.plots.common.plot_rate import PlotRate
+from hamcontestanalysis.plots.common.plot_rolling_rate import ROLLING_RATE_COLUMN
 from hamcontestanalysis.plots.common.plot_rolling_rate import PlotRollingRate
 from hamcontestanalysis.plots.cqww.plot_contest_evolution import (
     AVAILABLE_FEATURES as AVAILABLE_FEATURES_CQWW,
 )
-from hamcontestanalysis.plots.rbn.plot_band_conditions import PlotBandConditions
-from hamcontestanalysis.plots.rbn.plot_cw_speed import PlotCwSpeed
-from hamcontestanalysis.plots.rbn.plot_number_rbn_spots import PlotNumberRbnSpots
-from hamcontestanalysis.plots.rbn.plot_snr import PlotSnr
+from hamcontestanalysis.plots.plot_base import add_plot_keys
+from hamcontestanalysis.plots.plot_base import get_input_columns
+from hamcontestanalysis.tables.table_base import TableBase
+from hamcontestanalysis.tables.table_view import TableView
 from hamcontestanalysis.utils import CONTINENTS
 
 
 YEAR_MIN = 2020
-DATA_CONTEST = None
-DATA_RBN = None
+# Points drawn by each time series plot, shared by all the logs compared
+MAX_POINTS = 5000
+# Rows of each page of the contest log table
+TABLE_PAGE_SIZE = 25
+# Time bins of the QSO rate plots, in minutes
+QSO_RATE_TIME_BINS = [5, 15, 30, 60]
+# Logs returned by each search of the callsign picker
+SEARCH_LIMIT = 50
 settings = get_settings()
 
 
-def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None:
-    """Main dashboard entrypoint.
+def _contest_input_columns(contest: str) -> Optional[List[str]]:
+    """Columns of the processed logs needed by the contest plots and tables.
 
-    This method generates the dashboard to be displayed with the analysis of each
-    contest.
+    The plots and tables built from the per-minute aggregates of the logs do not
+    need their QSOs, except for the calls of the log heatmap.
 
     Args:
-        debug (bool, optional): boolean with the debug option of dash. Defaults to
-            False.
-        host (str, optional): host for the dashboard. Defaults to "localhost".
-        port (int, optional): port to display the dashboard. Defaults to 8050.
+        contest (str): Name of the contest
+
+    Returns:
+        Optional[List[str]]: Columns to load, None to load all of them
+    """
+    return get_input_columns(
+        [
+            LogHeatmapCalls,
+            PlotFrequency,
+            PlotRollingRate,
+            PlotQsoDirection,
+            PlotMinutesPreviousCall,
+            importlib.import_module(
+                f"hamcontestanalysis.tables.{contest}.table_contest_log"
+            ).TableContestLog,
+        ]
+    )
+
+
+def _signal_logs(
+    signal: Optional[Dict[str, Any]], rbn: bool = False
+) -> Tuple[str, str, List[Tuple[str, int]]]:
+    """Contest, mode and logs of the data available to a session.
+
+    Args:
+        signal (Optional[Dict[str, Any]]): Data available to the session
+        rbn (bool): Only the logs of the years with RBN data. Defaults to False.
+
+    Raises:
+        PreventUpdate: No log is available yet
+
+    Returns:
+        Tuple[str, str, List[Tuple[str, int]]]: Contest, mode, and callsign and year
+            of each log
+    """
+    if not signal:
+        raise dash.exceptions.PreventUpdate
+    callsigns_years = [
+        (c, int(y))
+        for c, y in signal["callsigns_years"]
+        if not rbn or int(y) in signal["rbn_years"]
+    ]
+    if not callsigns_years:
+        raise dash.exceptions.PreventUpdate
+    return signal["contest"], signal["mode"], callsigns_years
+
+
+def _make_signal(
+    contest: str,
+    mode: str,
+    callsigns_years: List[Tuple[str, int]],
+    rbn_years: List[int],
+) -> Dict[str, Any]:
+    """Signal of the data available to a session, with its session cache key.
+
+    Args:
+        contest (str): Name of the contest
+        mode (str): Mode of the contest
+        callsigns_years (List[Tuple[str, int]]): Callsign and year of each log
+            available
+        rbn_years (List[int]): Years with RBN data available
+
+    Returns:
+        Dict[str, Any]: Signal of the session
+    """
+    return {
+        "key": SessionDataCache.make_key(
+            contest=contest,
+            mode=mode,
+            callsigns_years=callsigns_years,
+            rbn_years=rbn_years,
+        ),
+        "contest": contest,
+        "mode": mode,
+        "callsigns_years": [[c, int(y)] for c, y in callsigns_years],
+        "rbn_years": sorted(int(y) for y in rbn_years),
+    }
+
+
+def _load_session_data(signal: Dict[str, Any]) -> Tuple[DataFrame, Optional[DataFrame]]:
+    """Load the data available to a session and store it in the session cache.
+
+    The per-minute aggregates of the logs are stored too, see
+    `_session_aggregates`.
+
+    Args:
+        signal (Dict[str, Any]): Data available to the session
+
+    Returns:
+        Tuple[DataFrame, Optional[DataFrame]]: Contest and RBN data
+    """
+    cache = get_session_cache()
+    key = signal["key"]
+    contest, mode, callsigns_years = _signal_logs(signal=signal)
+    data_contest = ProcessedContestDataset(
+        contest=contest, mode=mode, callsigns_years=callsigns_years
+    ).load(columns=_contest_input_columns(contest=contest))
+    # Precompute the plot keys and the rolling rates once, so that the plots and
+    # tables use the shared data as is
+    data_contest = add_plot_keys(data=data_contest)
+    data_contest = add_rolling_rates(
+        data_contest,
+        windows=QSO_RATE_TIME_BINS,
+        name=ROLLING_RATE_COLUMN.format(target="qsos"),
+    )
+    data_contest = add_rolling_rates(
+        data_contest,
+        windows=importlib.import_module(
+            f"hamcontestanalysis.tables.{contest}.table_contest_log"
+        ).TableContestLog.rate_windows,
+        column="is_valid",
+    )
+    cache.put(
+        key=key,
+        name="aggregates",
+        data=MinuteAggregatesDataset(
+            contest=contest, mode=mode, callsigns_years=callsigns_years
+        ).load(),
+    )
+    if signal["rbn_years"]:
+        # Imported here, as the RBN modules are only needed for CW contests
+        from hamcontestanalysis.plots.rbn.plot_cw_speed import PlotCwSpeed
+
+        data_rbn = PlotCwSpeed(
+            contest=contest,
+            mode=mode,
+            callsigns_years=_signal_logs(signal=signal, rbn=True)[2],
+            time_bin_size=10,
+        ).data
+        cache.put(key=key, name="rbn", data=data_rbn)
+    cache.put(key=key, name="contest", data=data_contest)
+    return cache.get(key=key, name="contest"), cache.get(key=key, name="rbn")
+
+
+def _session_data(signal: Dict[str, Any]) -> Tuple[DataFrame, Optional[DataFrame]]:
+    """Get the data available to a session from the session cache.
+
+    The data are read-only views shared by all sessions and workers, and are loaded
+    again if they have been evicted.
+
+    Args:
+        signal (Dict[str, Any]): Data available to the session
+
+    Returns:
+        Tuple[DataFrame, Optional[DataFrame]]: Contest and RBN data
+    """
+    cache = get_session_cache()
+    data_contest = cache.get(key=signal["key"], name="contest")
+    if data_contest is None:
+        return _load_session_data(signal=signal)
+    return data_contest, cache.get(key=signal["key"], name="rbn")
+
+
+def _session_aggregates(signal: Dict[str, Any]) -> DataFrame:
+    """Get the per-minute aggregates of the logs of a session from the session cache.
+
+    Args:
+        signal (Dict[str, Any]): Data available to the session
+
+    Returns:
+        DataFrame: Per-minute aggregates of the logs
+    """
+    aggregates = get_session_cache().get(key=signal["key"], name="aggregates")
+    if aggregates is None:
+        _load_session_data(signal=signal)
+        aggregates = get_session_cache().get(key=signal["key"], name="aggregates")
+    return aggregates
+
+
+@lru_cache(maxsize=8)
+def _contest_log_view(signal_json: str) -> Tuple[TableBase, TableView]:
+    """Contest log table of the data available to a session, with its view.
+
+    The view is kept in the process to serve the pages of the table.
+
+    Args:
+        signal_json (str): Data available to the session, as JSON
+
+    Returns:
+        Tuple[TableBase, TableView]: Table and view of its data
+    """
+    signal = json.loads(signal_json)
+    contest, _, callsigns_years = _signal_logs(signal=signal)
+    table = importlib.import_module(
+        f"hamcontestanalysis.tables.{contest.lower()}.table_contest_log"
+    ).TableContestLog()
+    data_contest, _ = _session_data(signal=signal)
+    table.data = select_logs(
+        data=data_contest, callsigns_years=callsigns_years
+    ).reset_index(drop=True)
+    return table, table.view()
+
+
+@lru_cache(maxsize=8)
+def _log_heatmap_calls(
+    signal_json: str, time_bin_size: int, continents: Tuple[str, ...]
+) -> LogHeatmapCalls:
+    """Index of the calls in each cell of the log heatmap of a session.
+
+    The index is kept in the process to answer the clicks on the heatmap.
+
+    Args:
+        signal_json (str): Data available to the session, as JSON
+        time_bin_size (int): Time bin size in minutes, of the heatmap
+        continents (Tuple[str, ...]): Continents of the heatmap
+
+    Returns:
+        LogHeatmapCalls: Index of the calls
+    """
+    signal = json.loads(signal_json)
+    contest, mode, callsigns_years = _signal_logs(signal=signal)
+    plot = PlotLogHeatmap(
+        contest=contest,
+        mode=mode,
+        callsigns_years=callsigns_years,
+        time_bin_size=time_bin_size,
+        continents=list(continents),
+    )
+    plot.data = _session_data(signal=signal)[0]
+    return plot.calls_index()
+
+
+def _graph(
+    plot: Any,
+    signal: Dict[str, Any],
+    rbn: bool = False,
+    graph_id: Optional[str] = None,
+) -> dcc.Graph:
+    """Graph of a plot of the data available to a session.
+
+    The figure is taken from the figure cache, and only created, from the session
+    data or the per-minute aggregates of its logs, if it is not there.
+
+    Args:
+        plot (Any): Plot, without data
+        signal (Dict[str, Any]): Data available to the session
+        rbn (bool): The plot uses the RBN data. Defaults to False.
+        graph_id (Optional[str]): Identifier of the graph, to listen to its zoom.
+            Defaults to None.
+
+    Returns:
+        dcc.Graph: Graph of the plot
+    """
+
+    def create() -> Figure:
+        if getattr(plot, "uses_aggregates", False):
+            plot.aggregates = _session_aggregates(signal=signal)
+            return plot.plot()
+        data_contest, data_rbn = _session_data(signal=signal)
+        plot.data = data_rbn if rbn else data_contest
+        return plot.plot()
+
+    figure = get_figure_cache().get_or_create(
+        key=FigureCache.make_key(plot=plot, data_key=signal["key"]), create=create
+    )
+    if graph_id is None:
+        return dcc.Graph(figure=figure)
+    return dcc.Graph(id=graph_id, figure=figure)
+
+
+def _relayout_x_range(relayout_data: Optional[Dict[str, Any]]) -> Any:
+    """Visible range of the x axis of a graph, from its relayout data.
+
+    Args:
+        relayout_data (Optional[Dict[str, Any]]): Relayout data of the graph
+
+    Returns:
+        Any: Range of the x axis, None if it is autoscaled, or no update if the
+            relayout did not change it
+    """
+    lows, highs = {}, {}
+    for key, value in (relayout_data or {}).items():
+        axis, _, attribute = key.partition(".")
+        if not re.fullmatch(r"xaxis\d*", axis):
+            continue
+        if attribute == "autorange":
+            return None
+        if attribute == "range":
+            return list(value)
+        if attribute == "range[0]":
+            lows[axis] = value
+        elif attribute == "range[1]":
+            highs[axis] = value
+    for axis in lows:
+        if axis in highs:
+            return [lows[axis], highs[axis]]
+    return dash.no_update
+
+
+def _job_progress_children(
+    progress: Dict[str, Any], tasks: List[Dict[str, Any]]
+) -> html.Div:
+    """Progress bar and status of each task of a download job."""
+    items = [
+        html.Li(
+            f"{t['year']} - {t['callsign']}: {t['status']}"
+            if t["kind"] == "log"
+            else f"{t['year']} - RBN: {t['status']}"
+        )
+        for t in tasks
+    ]
+    return html.Div(
+        [
+            dbc.Progress(
+                value=progress["finished"],
+                max=max(progress["total"], 1),
+                label=f"{progress['finished']}/{progress['total']}",
+                animated=not progress["done"],
+                striped=not progress["done"],
+            ),
+            html.Ul(items),
+        ]
+    )
+
+
+def _prewarm_steps() -> List[Tuple[str, Callable[[], Any]]]:
+    """Steps loading what the first sessions are likely to use.
+
+    Returns:
+        List[Tuple[str, Callable[[], Any]]]: Name and function of each step: the
+            import of the plot and table modules, the callsign index of each contest
+            and mode whose list of available logs is stored, and the data of the
+            selections used most recently, loaded least recent first so that their
+            order of use is kept
+    """
+    modules = [
+        f"hamcontestanalysis.plots.rbn.{module}"
+        for module in [
+            "plot_band_conditions",
+            "plot_cw_speed",
+            "plot_number_rbn_spots",
+            "plot_snr",
+        ]
+    ] + [
+        f"hamcontestanalysis.{package}.{contest.lower()}.{module}"
+        for contest in settings.contest.contests
+        for package, module in [
+            ("plots", "plot_contest_evolution"),
+            ("tables", "table_contest_log"),
+            ("tables", "table_contest_summary"),
+        ]
+    ]
+
+    def import_modules() -> None:
+        for module in modules:
+            importlib.import_module(module)
+
+    steps = [("imports", import_modules)]
+    for contest in settings.contest.contests:
+        if not os.path.exists(options_path(contest=contest)):
+            continue
+        steps += [
+            (
+                f"callsign index {contest.lower()} {mode.lower()}",
+                partial(get_callsign_index, contest=contest, mode=mode),
+            )
+            for mode in getattr(settings.contest, contest.lower()).modes.modes
+        ]
+    cache = get_session_cache()
+    steps += [
+        (f"session data {key}", partial(cache.warm, key=key))
+        for key in reversed(cache.recent_keys(limit=settings.storage.dashboard_prewarm))
+    ]
+    return steps
+
+
+def create_app() -> dash.Dash:
+    """Create the dashboard application.
+
+    The application keeps no data in the process, so that it can be served by
+    several worker processes, e.g. with
+    `gunicorn "hamcontestanalysis.modules.dashboard.contest_analysis:create_server()"`.
+
+    Returns:
+        dash.Dash: Dashboard application
     """
     app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 
@@ -93,11 +501,31 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             options=[],
             multi=True,
             value=None,
-            placeholder="Choose year - callsign pairs...",
+            placeholder="Type a callsign to choose year - callsign pairs...",
         ),
         style={"width": "25%", "display": "inline-block"},
     )
 
+    dropdown_search_filters = html.Div(
+        [
+            dcc.Dropdown(
+                id="search_years",
+                options=[],
+                multi=True,
+                value=None,
+                placeholder="Any year",
+            ),
+            dcc.Dropdown(
+                id="search_category_operator",
+                options=CATEGORY_V2_TOKENS["category_operator"],
+                multi=False,
+                value=None,
+                placeholder="Any category (stored logs)",
+            ),
+        ],
+        style={"width": "25%", "display": "inline-block"},
+    )
+
     @app.callback(
         Output("mode", "options"),
         [Input("contest", "value")],
@@ -110,23 +538,48 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
         return options
 
     @app.callback(
-        Output("callsigns_years", "options"),
+        Output("search_years", "options"),
         [Input("contest", "value"), Input("mode", "value")],
     )
-    def load_available_calls_years(contest, mode):
+    def load_available_years(contest, mode):
         if not contest or not mode:
             return []
+        return get_callsign_index(contest=contest, mode=mode).available_years
 
-        data_source_class = importlib.import_module(
-            f"hamcontestanalysis.data.{contest.lower()}.storage_source"
-        ).CabrilloDataSource
-        data = data_source_class.get_all_options().query(f"(mode == '{mode}')")
-
-        options = [
+    @app.callback(
+        Output("callsigns_years", "options"),
+        [
+            Input("contest", "value"),
+            Input("mode", "value"),
+            Input("callsigns_years", "search_value"),
+            Input("search_years", "value"),
+            Input("search_category_operator", "value"),
+        ],
+        [State("callsigns_years", "value")],
+    )
+    def search_calls_years(contest, mode, search_value, years, category, value):
+        if not contest or not mode:
+            return []
+        # Options selected are kept, otherwise the dropdown drops them
+        selected = [
+            {"label": f"{v.split(',')[1]} - {v.split(',')[0]}", "value": v}
+            for v in value or []
+        ]
+        if not search_value:
+            return selected
+        matches = search_logs(
+            contest=contest,
+            mode=mode,
+            prefix=search_value,
+            years=years,
+            category_operator=category,
+            limit=SEARCH_LIMIT,
+        )
+        return selected + [
             {"label": f"{y} - {c}", "value": f"{c},{y}"}
-            for y, c in data[["year", "callsign"]].to_numpy()
+            for c, y in matches
+            if f"{c},{y}" not in (value or [])
         ]
-        return options
 
     submit_button = html.Div(
         html.Button(
@@ -137,51 +590,73 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
         )
     )
 
-    # Download step
+    # Download step, run as a background job polled by the interval
     @app.callback(
-        Output("signal", "data"),
+        [
+            Output("job", "data"),
+            Output("job_interval", "disabled", allow_duplicate=True),
+        ],
         [Input("submit-button", "n_clicks")],
         [
             State("contest", "value"),
             State("mode", "value"),
             State("callsigns_years", "value"),
         ],
+        prevent_initial_call=True,
     )
-    def run_download(n_clicks, contest, mode, callsigns_years):
-        if not callsigns_years:
+    def submit_download(n_clicks, contest, mode, callsigns_years):
+        if not n_clicks or not callsigns_years:
             raise dash.exceptions.PreventUpdate
         callsign_years_tuple_list = []
         for callsign_year in callsigns_years:
             callsign = callsign_year.split(",")[0]
             year = int(callsign_year.split(",")[1])
-            callsign_years_tuple_list.append(tuple([callsign, year]))
-            if not exists(contest=contest, year=year, mode=mode, callsign=callsign):
-                download_contest_data(
-                    contest=contest, years=[year], callsigns=[callsign], mode=mode
-                )
-            if mode.lower() == "cw" and not exists_rbn(
-                contest=contest, year=year, mode=mode
-            ):
-                download_rbn_data(contest=contest, years=[year], mode=mode)
-        data_contest = PlotRate(
+            callsign_years_tuple_list.append((callsign, year))
+        job_id = get_download_jobs().submit(
             contest=contest, mode=mode, callsigns_years=callsign_years_tuple_list
-        ).data
-        data_rbn = None
-        if mode == "cw":
-            data_rbn = PlotCwSpeed(
-                contest=contest,
-                mode=mode,
-                callsigns_years=callsign_years_tuple_list,
-                time_bin_size=10,
-            ).data
-
-        global DATA_CONTEST
-        DATA_CONTEST = data_contest
+        )
+        return {"job_id": job_id, "contest": contest, "mode": mode}, False
 
-        global DATA_RBN
-        DATA_RBN = data_rbn
+    @app.callback(
+        [
+            Output("job_progress", "children"),
+            Output("signal", "data"),
+            Output("job_interval", "disabled"),
+        ],
+        [Input("job_interval", "n_intervals")],
+        [State("job", "data"), State("signal", "data")],
+    )
+    def poll_download(n_intervals, job, signal):
+        if not job:
+            raise dash.exceptions.PreventUpdate
+        tasks = get_download_jobs().status(job_id=job["job_id"])
+        progress = job_progress(tasks=tasks)
+        new_signal = _make_signal(
+            contest=job["contest"],
+            mode=job["mode"],
+            callsigns_years=progress["callsigns_years"],
+            rbn_years=progress["rbn_years"],
+        )
+        if not progress["callsigns_years"] or (
+            signal is not None and signal["key"] == new_signal["key"]
+        ):
+            new_signal = dash.no_update
+        else:
+            # Load the data once here, before all the plots ask for it
+            _load_session_data(signal=new_signal)
+        return (
+            _job_progress_children(progress=progress, tasks=tasks),
+            new_signal,
+            progress["done"],
+        )
 
-        return n_clicks > 0
+    progress_download = html.Div(
+        [
+            dcc.Store(id="job"),
+            dcc.Interval(id="job_interval", interval=1000, disabled=True),
+            html.Div(id="job_progress"),
+        ]
+    )
 
     # Graph Contest log
     graph_contest_log = html.Div(
@@ -190,6 +665,7 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
                 id="ph_contest_log",
             ),
             html.Div(html.Div(id="contest_log_heatmap")),
+            html.Div(id="log_heatmap_calls"),
         ]
     )
 
@@ -224,24 +700,9 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             Input("cl_contest_log_continent", "value"),
             Input("rb_contest_log_time_bin", "value"),
         ],
-        [
-            State("contest", "value"),
-            State("mode", "value"),
-            State("callsigns_years", "value"),
-        ],
     )
-    def plot_contest_log_heatmap(
-        signal, continents, time_bin_size, contest, mode, callsigns_years
-    ):
-        f_callsigns_years = []
-        if not signal:
-            raise dash.exceptions.PreventUpdate
-        for callsign_year in callsigns_years:
-            callsign = callsign_year.split(",")[0]
-            year = int(callsign_year.split(",")[1])
-            f_callsigns_years.append((callsign, year))
-            if not exists(callsign=callsign, year=year, contest=contest, mode=mode):
-                raise dash.exceptions.PreventUpdate
+    def plot_contest_log_heatmap(signal, continents, time_bin_size):
+        contest, mode, f_callsigns_years = _signal_logs(signal=signal)
         plot = PlotLogHeatmap(
             contest=contest,
             mode=mode,
@@ -249,8 +710,37 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             continents=continents,
             time_bin_size=time_bin_size,
         )
-        plot.data = DATA_CONTEST.copy()
-        return dcc.Graph(figure=plot.plot())
+        return _graph(plot=plot, signal=signal, graph_id="graph_log_heatmap")
+
+    # Calls of the heatmap cell clicked, looked up on demand
+    @app.callback(
+        Output("log_heatmap_calls", "children"),
+        [Input("graph_log_heatmap", "clickData")],
+        [
+            State("signal", "data"),
+            State("rb_contest_log_time_bin", "value"),
+            State("cl_contest_log_continent", "value"),
+        ],
+    )
+    def show_log_heatmap_calls(click_data, signal, time_bin_size, continents):
+        if not click_data:
+            raise dash.exceptions.PreventUpdate
+        _, _, f_callsigns_years = _signal_logs(signal=signal)
+        point = click_data["points"][0]
+        callsign, year = f_callsigns_years[point["curveNumber"]]
+        calls = _log_heatmap_calls(
+            signal_json=json.dumps(signal, sort_keys=True),
+            time_bin_size=time_bin_size,
+            continents=tuple(continents),
+        ).calls(
+            callsign_year=f"{callsign.upper()}({year})",
+            contest_hour=point["y"],
+            contest_minute=point["x"],
+        )
+        return html.P(
+            f"{callsign.upper()} ({year}) - hour {point['y']}, minute {point['x']}: "
+            + (", ".join(calls) or "no QSOs")
+        )
 
     # Graph qsos/hour
     graph_qsos_hour = html.Div(
@@ -291,24 +781,9 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             Input("cl_qsos_hour_continent", "value"),
             Input("rb_qsos_hour_time_bin", "value"),
         ],
-        [
-            State("contest", "value"),
-            State("mode", "value"),
-            State("callsigns_years", "value"),
-        ],
     )
-    def plot_qsos_hour(
-        signal, continents, time_bin_size, contest, mode, callsigns_years
-    ):
-        f_callsigns_years = []
-        if not signal:
-            raise dash.exceptions.PreventUpdate
-        for callsign_year in callsigns_years:
-            callsign = callsign_year.split(",")[0]
-            year = int(callsign_year.split(",")[1])
-            f_callsigns_years.append((callsign, year))
-            if not exists(callsign=callsign, year=year, contest=contest, mode=mode):
-                raise dash.exceptions.PreventUpdate
+    def plot_qsos_hour(signal, continents, time_bin_size):
+        contest, mode, f_callsigns_years = _signal_logs(signal=signal)
         plot = PlotQsosHour(
             contest=contest,
             mode=mode,
@@ -316,41 +791,29 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             continents=continents,
             time_bin_size=time_bin_size,
         )
-        plot.data = DATA_CONTEST.copy()
-        return dcc.Graph(figure=plot.plot())
+        return _graph(plot=plot, signal=signal)
 
     # Graph frequency
-    graph_frequency = html.Div(html.Div(id="frequency"))
+    graph_frequency = html.Div(
+        [dcc.Store(id="range_frequency"), html.Div(id="frequency")]
+    )
 
     @app.callback(
         Output("frequency", "children"),
-        [Input("signal", "data")],
-        [
-            State("contest", "value"),
-            State("mode", "value"),
-            State("callsigns_years", "value"),
-        ],
+        [Input("signal", "data"), Input("range_frequency", "data")],
     )
-    def plot_frequency(signal, contest, mode, callsigns_years):
-        f_callsigns_years = []
-        if not signal:
-            raise dash.exceptions.PreventUpdate
-        for callsign_year in callsigns_years:
-            callsign = callsign_year.split(",")[0]
-            year = int(callsign_year.split(",")[1])
-            f_callsigns_years.append((callsign, year))
-            if not exists(callsign=callsign, year=year, contest=contest, mode=mode):
-                raise dash.exceptions.PreventUpdate
+    def plot_frequency(signal, x_range):
+        contest, mode, f_callsigns_years = _signal_logs(signal=signal)
         plot = PlotFrequency(
             contest=contest, mode=mode, callsigns_years=f_callsigns_years
-        )
-        plot.data = DATA_CONTEST.copy()
-        return dcc.Graph(figure=plot.plot())
+        ).set_resolution(max_points=MAX_POINTS, x_range=x_range)
+        return _graph(plot=plot, signal=signal, graph_id="graph_frequency")
 
     # Graph qso rate
     graph_qso_rate = html.Div(
         [
             html.Div(id="ph_qso_rate"),
+            dcc.Store(id="range_qso_rate"),
             html.Div(html.Div(id="qso_rate")),
         ]
     )
@@ -375,7 +838,7 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
                 ),
                 dcc.RadioItems(
                     id="rb_qso_rate_time_bin",
-                    options=[5, 15, 30, 60],
+                    options=QSO_RATE_TIME_BINS,
                     value=60,
                     inline=True,
                 ),
@@ -388,23 +851,11 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             Input("signal", "data"),
             Input("rb_qso_rate_type", "value"),
             Input("rb_qso_rate_time_bin", "value"),
-        ],
-        [
-            State("contest", "value"),
-            State("mode", "value"),
-            State("callsigns_years", "value"),
+            Input("range_qso_rate", "data"),
         ],
     )
-    def plot_qso_rate(signal, plot_type, time_bin, contest, mode, callsigns_years):
-        f_callsigns_years = []
-        if not signal:
-            raise dash.exceptions.PreventUpdate
-        for callsign_year in callsigns_years:
-            callsign = callsign_year.split(",")[0]
-            year = int(callsign_year.split(",")[1])
-            f_callsigns_years.append((callsign, year))
-            if not exists(callsign=callsign, year=year, contest=contest, mode=mode):
-                raise dash.exceptions.PreventUpdate
+    def plot_qso_rate(signal, plot_type, time_bin, x_range):
+        contest, mode, f_callsigns_years = _signal_logs(signal=signal)
         if plot_type == "hour":
             plot = PlotRate(
                 contest=contest,
@@ -421,8 +872,8 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             )
         else:
             raise ValueError("plot_type must be either 'hour' or 'rolling'")
-        plot.data = DATA_CONTEST.copy()
-        return dcc.Graph(figure=plot.plot())
+        plot.set_resolution(max_points=MAX_POINTS, x_range=x_range)
+        return _graph(plot=plot, signal=signal, graph_id="graph_qso_rate")
 
     # Graph qso direction
     graph_qso_direction = html.Div(
@@ -449,30 +900,16 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             Input("signal", "data"),
             Input("range_hour_qso_direction", "value"),
         ],
-        [
-            State("contest", "value"),
-            State("mode", "value"),
-            State("callsigns_years", "value"),
-        ],
     )
-    def plot_qso_direction(signal, contest_hours, contest, mode, callsigns_years):
-        f_callsigns_years = []
-        if not signal:
-            raise dash.exceptions.PreventUpdate
-        for callsign_year in callsigns_years:
-            callsign = callsign_year.split(",")[0]
-            year = int(callsign_year.split(",")[1])
-            f_callsigns_years.append((callsign, year))
-            if not exists(callsign=callsign, year=year, contest=contest, mode=mode):
-                raise dash.exceptions.PreventUpdate
+    def plot_qso_direction(signal, contest_hours):
+        contest, mode, f_callsigns_years = _signal_logs(signal=signal)
         plot = PlotQsoDirection(
             contest=contest,
             mode=mode,
             callsigns_years=f_callsigns_years,
             contest_hours=contest_hours,
         )
-        plot.data = DATA_CONTEST.copy()
-        return dcc.Graph(figure=plot.plot())
+        return _graph(plot=plot, signal=signal)
 
     # Graph band conditions
     graph_band_conditions = html.Div(
@@ -520,39 +957,25 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             Input("rb_band_conditions_reference", "value"),
             Input("cl_band_conditions_continent", "value"),
         ],
-        [
-            State("contest", "value"),
-            State("mode", "value"),
-            State("callsigns_years", "value"),
-        ],
     )
     def plot_band_conditions(
         signal,
         time_bin_size,
         reference,
         continents,
-        contest,
-        mode,
-        callsigns_years,
     ):
-        years = []
-        if not signal:
-            raise dash.exceptions.PreventUpdate
-        for callsign_year in callsigns_years:
-            year = int(callsign_year.split(",")[1])
-            years.append(year)
-            if not exists_rbn(year=year, contest=contest, mode=mode):
-                raise dash.exceptions.PreventUpdate
+        from hamcontestanalysis.plots.rbn.plot_band_conditions import PlotBandConditions
+
+        contest, mode, _ = _signal_logs(signal=signal, rbn=True)
         plot = PlotBandConditions(
             contest=contest,
             mode=mode,
-            years=years,
+            years=signal["rbn_years"],
             time_bin_size=time_bin_size,
             reference=reference,
             continents=continents,
         )
-        plot.data = DATA_RBN
-        return dcc.Graph(figure=plot.plot())
+        return _graph(plot=plot, signal=signal, rbn=True)
 
     # Graph RBN stats
     graph_rbn_stats = html.Div(
@@ -604,24 +1027,15 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             Input("rb_rbn_time_bin", "value"),
             Input("cl_rbn_rx_continent", "value"),
         ],
-        [
-            State("contest", "value"),
-            State("mode", "value"),
-            State("callsigns_years", "value"),
-        ],
     )
-    def plot_rbn_stats(
-        signal, feature, time_bin_size, rx_continents, contest, mode, callsigns_years
-    ):
-        f_callsigns_years = []
-        if not signal:
-            raise dash.exceptions.PreventUpdate
-        for callsign_year in callsigns_years:
-            callsign = callsign_year.split(",")[0]
-            year = int(callsign_year.split(",")[1])
-            f_callsigns_years.append((callsign, year))
-            if not exists_rbn(year=year, contest=contest, mode=mode):
-                raise dash.exceptions.PreventUpdate
+    def plot_rbn_stats(signal, feature, time_bin_size, rx_continents):
+        from hamcontestanalysis.plots.rbn.plot_cw_speed import PlotCwSpeed
+        from hamcontestanalysis.plots.rbn.plot_number_rbn_spots import (
+            PlotNumberRbnSpots,
+        )
+        from hamcontestanalysis.plots.rbn.plot_snr import PlotSnr
+
+        contest, mode, f_callsigns_years = _signal_logs(signal=signal, rbn=True)
         if feature == "speed":
             plot = PlotCwSpeed(
                 contest=contest,
@@ -647,13 +1061,13 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             )
         else:
             raise ValueError("Plot does not exist")
-        plot.data = DATA_RBN
-        return dcc.Graph(figure=plot.plot())
+        return _graph(plot=plot, signal=signal, rbn=True)
 
     # Graph contest_evolution_feature
     graph_contest_evolution_feature = html.Div(
         [
             html.Div(id="ph_contest_evolution"),
+            dcc.Store(id="range_contest_evolution"),
             html.Div(html.Div(id="contest_evolution_feature")),
         ]
     )
@@ -691,25 +1105,11 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             Input("signal", "data"),
             Input("rb_contest_evolution_feature", "value"),
             Input("rb_contest_evolution_time_bin", "value"),
-        ],
-        [
-            State("contest", "value"),
-            State("mode", "value"),
-            State("callsigns_years", "value"),
+            Input("range_contest_evolution", "data"),
         ],
     )
-    def plot_contest_evolution_feature(
-        signal, feature, time_bin_size, contest, mode, callsigns_years
-    ):
-        f_callsigns_years = []
-        if not signal:
-            raise dash.exceptions.PreventUpdate
-        for callsign_year in callsigns_years:
-            callsign = callsign_year.split(",")[0]
-            year = int(callsign_year.split(",")[1])
-            f_callsigns_years.append((callsign, year))
-            if not exists_rbn(year=year, contest=contest, mode=mode):
-                raise dash.exceptions.PreventUpdate
+    def plot_contest_evolution_feature(signal, feature, time_bin_size, x_range):
+        contest, mode, f_callsigns_years = _signal_logs(signal=signal)
         plot_contest_evolution_class = importlib.import_module(
             f"hamcontestanalysis.plots.{contest}.plot_contest_evolution"
         ).PlotContestEvolution
@@ -718,9 +1118,8 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             callsigns_years=f_callsigns_years,
             feature=feature,
             time_bin_size=time_bin_size,
-        )
-        plot.data = DATA_CONTEST.copy()
-        return dcc.Graph(figure=plot.plot())
+        ).set_resolution(max_points=MAX_POINTS, x_range=x_range)
+        return _graph(plot=plot, signal=signal, graph_id="graph_contest_evolution")
 
     # Graph minutes previous call
     graph_minutes_previous_call = html.Div(
@@ -754,31 +1153,15 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             Input("signal", "data"),
             Input("rb_previous_call_time_bin", "value"),
         ],
-        [
-            State("contest", "value"),
-            State("mode", "value"),
-            State("callsigns_years", "value"),
-        ],
     )
-    def plot_minutes_from_previous_call(
-        signal, time_bin_size, contest, mode, callsigns_years
-    ):
-        f_callsigns_years = []
-        if not signal:
-            raise dash.exceptions.PreventUpdate
-        for callsign_year in callsigns_years:
-            callsign = callsign_year.split(",")[0]
-            year = int(callsign_year.split(",")[1])
-            f_callsigns_years.append((callsign, year))
-            if not exists_rbn(year=year, contest=contest, mode=mode):
-                raise dash.exceptions.PreventUpdate
+    def plot_minutes_from_previous_call(signal, time_bin_size):
+        contest, mode, f_callsigns_years = _signal_logs(signal=signal)
         plot = PlotMinutesPreviousCall(
             mode=mode,
             callsigns_years=f_callsigns_years,
             time_bin_size=time_bin_size,
         )
-        plot.data = DATA_CONTEST.copy()
-        return dcc.Graph(figure=plot.plot())
+        return _graph(plot=plot, signal=signal)
 
     # Table contest log
     table_contest_log = html.Div(html.Div(id="table_contest_log"))
@@ -788,36 +1171,37 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
         [
             Input("signal", "data"),
         ],
+    )
+    def show_table_contest_data(signal):
+        _signal_logs(signal=signal)
+        table, view = _contest_log_view(signal_json=json.dumps(signal, sort_keys=True))
+        return table.show(
+            page_size=TABLE_PAGE_SIZE, table_id="table_contest_log_data", view=view
+        )
+
+    @app.callback(
         [
-            State("contest", "value"),
-            State("mode", "value"),
-            State("callsigns_years", "value"),
+            Output("table_contest_log_data", "data"),
+            Output("table_contest_log_data", "page_count"),
         ],
+        [
+            Input("table_contest_log_data", "page_current"),
+            Input("table_contest_log_data", "page_size"),
+            Input("table_contest_log_data", "sort_by"),
+            Input("table_contest_log_data", "filter_query"),
+        ],
+        [State("signal", "data")],
+        prevent_initial_call=True,
     )
-    def show_table_contest_data(signal, contest, mode, callsigns_years):
-        f_callsigns_years = []
-        if not signal or not callsigns_years:
-            raise dash.exceptions.PreventUpdate
-        for callsign_year in callsigns_years:
-            callsign = callsign_year.split(",")[0]
-            year = int(callsign_year.split(",")[1])
-            f_callsigns_years.append((callsign, year))
-            if not exists(callsign=callsign, year=year, contest=contest, mode=mode):
-                raise dash.exceptions.PreventUpdate
-
-        table = importlib.import_module(
-            f"hamcontestanalysis.tables.{contest.lower()}.table_contest_log"
-        ).TableContestLog()
-
-        _data = []
-        for callsign, year in f_callsigns_years:
-            _data.append(
-                DATA_CONTEST.query(
-                    f"(mycall == '{callsign}') & (year == {year})"
-                ).copy()
-            )
-        table.data = concat(_data).reset_index(drop=True)
-        return table.show(page_size=25)
+    def page_table_contest_data(page_current, page_size, sort_by, filter_query, signal):
+        _signal_logs(signal=signal)
+        _, view = _contest_log_view(signal_json=json.dumps(signal, sort_keys=True))
+        return view.page(
+            page_current=page_current or 0,
+            page_size=page_size,
+            sort_by=sort_by,
+            filter_query=filter_query,
+        )
 
     # Table contest summary
     table_summary = html.Div(html.Div(id="table_summary"))
@@ -827,37 +1211,26 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
         [
             Input("signal", "data"),
         ],
-        [
-            State("contest", "value"),
-            State("mode", "value"),
-            State("callsigns_years", "value"),
-        ],
     )
-    def show_table_summary(signal, contest, mode, callsigns_years):
-        f_callsigns_years = []
-        if not signal or not callsigns_years:
-            raise dash.exceptions.PreventUpdate
-        for callsign_year in callsigns_years:
-            callsign = callsign_year.split(",")[0]
-            year = int(callsign_year.split(",")[1])
-            f_callsigns_years.append((callsign, year))
-            if not exists(callsign=callsign, year=year, contest=contest, mode=mode):
-                raise dash.exceptions.PreventUpdate
+    def show_table_summary(signal):
+        contest, mode, f_callsigns_years = _signal_logs(signal=signal)
 
         table = importlib.import_module(
             f"hamcontestanalysis.tables.{contest.lower()}.table_contest_summary"
         ).TableContestSummary()
 
-        _data = []
-        for callsign, year in f_callsigns_years:
-            _data.append(
-                DATA_CONTEST.query(
-                    f"(mycall == '{callsign}') & (year == {year})"
-                ).copy()
-            )
-        table.data = concat(_data).reset_index(drop=True)
+        table.data = select_logs(
+            data=_session_aggregates(signal=signal), callsigns_years=f_callsigns_years
+        ).reset_index(drop=True)
         return table.show()
 
+    # Zooming a time series plot draws the visible range at full resolution
+    for name in ["frequency", "qso_rate", "contest_evolution"]:
+        app.callback(
+            Output(f"range_{name}", "data"),
+            [Input(f"graph_{name}", "relayoutData")],
+        )(_relayout_x_range)
+
     # Construct layout of the dashboard using components defined above
     app.layout = html.Div(
         [
@@ -865,7 +1238,9 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
             radio_contest,
             radio_mode,
             dropdown_year_call,
+            dropdown_search_filters,
             submit_button,
+            progress_download,
             table_summary,
             table_contest_log,
             graph_contest_log,
@@ -880,5 +1255,83 @@ def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None
         ]
     )
 
-    # Run the dashboard
-    app.run(debug=debug, host=host, port=port)
+    @app.server.route("/search-logs")
+    def search_logs_endpoint():
+        """Available logs of a contest whose callsign starts with a prefix.
+
+        Only an index already built, e.g. by the prewarm, is searched, so that a
+        request never downloads the list of available logs.
+        """
+        arguments = request.args
+        contest = arguments.get("contest", "").lower()
+        mode = arguments.get("mode", "").lower()
+        if contest not in settings.contest.contests:
+            return jsonify(error=f"Unknown contest: {contest}"), 400
+        if mode not in getattr(settings.contest, contest).modes.modes:
+            return jsonify(error=f"Unknown mode of {contest}: {mode}"), 400
+        try:
+            years = [int(y) for y in arguments.getlist("year")] or None
+            limit = int(arguments.get("limit", SEARCH_LIMIT))
+        except ValueError:
+            return jsonify(error="year and limit must be integers"), 400
+        if limit < 0:
+            return jsonify(error="limit must not be negative"), 400
+        index = get_built_callsign_index(contest=contest, mode=mode)
+        if index is None:
+            return jsonify(error=f"Index of {contest} {mode} not built yet"), 503
+        matches = search_logs(
+            contest=contest,
+            mode=mode,
+            prefix=arguments.get("q", ""),
+            years=years,
+            category_operator=arguments.get("category_operator"),
+            limit=limit,
+            index=index,
+        )
+        return jsonify([{"callsign": c, "year": y} for c, y in matches])
+
+    @app.server.route("/startup")
+    def startup_report():
+        """Duration of each phase of the startup of this worker process."""
+        return jsonify(get_startup_timer().report())
+
+    @app.server.route("/cache-stats")
+    def cache_stats():
+        """Statistics of the caches of this worker process, to tune their budgets."""
+        return jsonify(
+            figures=get_figure_cache().stats(), loads=get_load_cache().stats()
+        )
+
+    return app
+
+
+def _start() -> dash.Dash:
+    """Create the application, and prewarm it in the background."""
+    timer = get_startup_timer()
+    with timer.phase("create app"):
+        app = create_app()
+    with timer.phase("plan prewarm"):
+        steps = _prewarm_steps()
+    prewarm(steps=steps, timer=timer)
+    timer.log(title="Dashboard started")
+    return app
+
+
+def create_server() -> Flask:
+    """Create the WSGI server of the dashboard, e.g. for gunicorn."""
+    return _start().server
+
+
+def main(debug: bool = False, host: str = "localhost", port: int = 8050) -> None:
+    """Main dashboard entrypoint.
+
+    This method generates the dashboard to be displayed with the analysis of each
+    contest.
+
+    Args:
+        debug (bool, optional): boolean with the debug option of dash. Defaults to
+            False.
+        host (str, optional): host for the dashboard. Defaults to "localhost".
+        port (int, optional): port to display the dashboard. Defaults to 8050.
+    """
+    _start().run(debug=debug, host=host, port=port)
@@ -0,0 +1,139 @@
+"""Cache of the figures rendered by the dashboard.
+
+Changing an option of a plot, e.g. a continent or the time bin, aggregates the data
+and builds the Plotly figure again, even for a combination just viewed. Figures are
+cached as serialized JSON, keyed by the plot class, the data it is built from and
+its parameters, so that going back to a view returns immediately.
+
+The cache is bounded by a memory budget in the storage settings, evicting the least
+recently used figures.
+"""
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from logging import getLogger
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+from plotly.graph_objects import Figure
+
+from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.modules.dashboard.cache import digest_key
+
+
+logger = getLogger(__name__)
+
+# Attributes of the plots that are not parameters
+_NON_PARAMETERS = ("_data", "_aggregates", "_calibration")
+
+
+class FigureCache:
+    """LRU cache of serialized figures, bounded by a memory budget."""
+
+    def __init__(self, max_bytes: int):
+        """Figure cache constructor.
+
+        Args:
+            max_bytes (int): Memory budget of the serialized figures. 0 disables the
+                cache.
+        """
+        self.max_bytes = max_bytes
+        self._figures: "OrderedDict[str, str]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(plot: Any, data_key: str) -> str:
+        """Key of the figure of a plot.
+
+        Args:
+            plot (Any): Plot, whose attributes other than its data are its parameters
+            data_key (str): Fingerprint of the data of the plot, e.g. the key of the
+                selection in the session data cache
+
+        Returns:
+            str: Key of the figure
+        """
+        parameters = {
+            k: v for k, v in sorted(vars(plot).items()) if k not in _NON_PARAMETERS
+        }
+        return digest_key(
+            [type(plot).__module__, type(plot).__qualname__, data_key, parameters]
+        )
+
+    def get_or_create(self, key: str, create: Callable[[], Figure]) -> Dict[str, Any]:
+        """Get a figure from the cache, creating it if missing.
+
+        Args:
+            key (str): Key of the figure, from `make_key`
+            create (Callable[[], Figure]): Function creating the figure
+
+        Returns:
+            Dict[str, Any]: Figure, as the dictionary of its JSON
+        """
+        with self._lock:
+            figure_json = self._figures.get(key)
+            if figure_json is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if figure_json is None:
+            figure_json = create().to_json()
+            self._store(key=key, figure_json=figure_json)
+        return json.loads(figure_json)
+
+    def _store(self, key: str, figure_json: str) -> None:
+        """Store a figure, evicting the least recently used ones if needed."""
+        if len(figure_json) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._figures:
+                return
+            self._figures[key] = figure_json
+            self._nbytes += len(figure_json)
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._figures.popitem(last=False)
+                self._nbytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all figures and reset the statistics."""
+        with self._lock:
+            self._figures.clear()
+            self._nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistics of the cache.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, hit rate, evictions, number of figures and
+                memory used
+        """
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._figures),
+                "bytes": self._nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+@lru_cache()
+def _get_figure_cache(max_bytes: int) -> FigureCache:
+    return FigureCache(max_bytes=max_bytes)
+
+
+def get_figure_cache() -> FigureCache:
+    """Get the figure cache with the memory budget of the storage settings."""
+    return _get_figure_cache(get_settings().storage.figure_cache_mb * 1024**2)
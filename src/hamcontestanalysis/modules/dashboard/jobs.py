@@ -0,0 +1,206 @@
+"""Background download jobs of the dashboard.
+
+Downloading and processing the logs of a selection, and the RBN data of its years,
+can take minutes, so it runs as a job in a pool of local worker processes instead of
+inside a dashboard callback. The job is split into one task per log and per RBN
+year. Each task records its status in its own small JSON file in the temporary
+storage, so that any worker process serving the dashboard can report the progress
+of a job, and plots can be rendered as soon as each log is available.
+"""
+import json
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from logging import getLogger
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from hamcontestanalysis.config import get_settings
+
+
+logger = getLogger(__name__)
+
+# Number of worker processes running the download tasks of all sessions
+DOWNLOAD_WORKERS = 2
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def _write_status(path: str, task: Dict[str, Any], status: str, **extra: Any) -> None:
+    """Write the status of a task atomically."""
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w") as f:
+        json.dump({**task, "status": status, **extra}, f)
+    os.replace(temporary_path, path)
+
+
+def run_task(path: str, task: Dict[str, Any]) -> None:
+    """Run a download task, recording its status.
+
+    Args:
+        path (str): Path of the status file of the task
+        task (Dict[str, Any]): Task, with its kind (log or rbn), contest, mode, year
+            and, for logs, callsign
+    """
+    # Imported here, as the download module imports every data source
+    from hamcontestanalysis.modules.download.main import download_contest_data
+    from hamcontestanalysis.modules.download.main import download_rbn_data
+
+    _write_status(path=path, task=task, status=RUNNING)
+    try:
+        if task["kind"] == "log":
+            download_contest_data(
+                callsigns=[task["callsign"]],
+                years=[task["year"]],
+                contest=task["contest"],
+                mode=task["mode"],
+            )
+        else:
+            download_rbn_data(
+                contest=task["contest"], years=[task["year"]], mode=task["mode"]
+            )
+    except Exception as e:  # pylint: disable=broad-except
+        logger.exception(f"Download task {task} failed")
+        _write_status(path=path, task=task, status=FAILED, error=str(e))
+        return
+    _write_status(path=path, task=task, status=DONE)
+
+
+class DownloadJobs:
+    """Download jobs run in a pool of local workers, with their progress on disk."""
+
+    def __init__(self, folder: str, executor: Executor):
+        """Download jobs constructor.
+
+        Args:
+            folder (str): Folder of the status files of the jobs
+            executor (Executor): Pool running the download tasks
+        """
+        self.folder = folder
+        self.executor = executor
+
+    def submit(
+        self, contest: str, mode: str, callsigns_years: List[Tuple[str, int]]
+    ) -> str:
+        """Submit the download of a selection of logs, and the RBN data if CW.
+
+        Logs and RBN years already stored are marked as done without running a task.
+
+        Args:
+            contest (str): Name of the contest
+            mode (str): Mode of the contest
+            callsigns_years (List[Tuple[str, int]]): Callsign and year of each log
+
+        Returns:
+            str: Identifier of the job
+        """
+        job_id = uuid.uuid4().hex
+        os.makedirs(os.path.join(self.folder, job_id))
+        tasks = [
+            dict(kind="log", contest=contest, mode=mode, callsign=c, year=int(y))
+            for c, y in dict.fromkeys(callsigns_years)
+        ]
+        if mode == "cw":
+            tasks += [
+                dict(kind="rbn", contest=contest, mode=mode, year=int(y))
+                for y in sorted({int(y) for _, y in callsigns_years})
+            ]
+        for number, task in enumerate(tasks):
+            path = os.path.join(self.folder, job_id, f"{number:04d}.json")
+            if self._is_stored(task=task):
+                _write_status(path=path, task=task, status=DONE)
+            else:
+                _write_status(path=path, task=task, status=PENDING)
+                self.executor.submit(run_task, path, task)
+        logger.info(f"Submitted download job {job_id} with {len(tasks)} tasks")
+        return job_id
+
+    @staticmethod
+    def _is_stored(task: Dict[str, Any]) -> bool:
+        from hamcontestanalysis.modules.download.main import exists
+        from hamcontestanalysis.modules.download.main import exists_rbn
+
+        if task["kind"] == "log":
+            return exists(
+                contest=task["contest"],
+                year=task["year"],
+                callsign=task["callsign"],
+                mode=task["mode"],
+            )
+        return exists_rbn(contest=task["contest"], year=task["year"], mode=task["mode"])
+
+    def status(self, job_id: str) -> List[Dict[str, Any]]:
+        """Status of the tasks of a job.
+
+        Args:
+            job_id (str): Identifier of the job
+
+        Returns:
+            List[Dict[str, Any]]: Tasks of the job, with their status
+        """
+        folder = os.path.join(self.folder, job_id)
+        tasks = []
+        for name in sorted(os.listdir(folder)):
+            if name.endswith(".json"):
+                with open(os.path.join(folder, name)) as f:
+                    tasks.append(json.load(f))
+        return tasks
+
+
+def job_progress(tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summary of the progress of a job.
+
+    Args:
+        tasks (List[Dict[str, Any]]): Tasks of the job, with their status
+
+    Returns:
+        Dict[str, Any]: Logs and RBN years available, number of tasks finished and
+            whether the job is finished
+    """
+    finished = [t for t in tasks if t["status"] in (DONE, FAILED)]
+    return {
+        "callsigns_years": [
+            (t["callsign"], t["year"])
+            for t in tasks
+            if t["kind"] == "log" and t["status"] == DONE
+        ],
+        "rbn_years": [
+            t["year"] for t in tasks if t["kind"] == "rbn" and t["status"] == DONE
+        ],
+        "finished": len(finished),
+        "total": len(tasks),
+        "done": len(finished) == len(tasks),
+    }
+
+
+@lru_cache()
+def _get_download_jobs(folder: str, max_workers: int) -> DownloadJobs:
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+    return DownloadJobs(folder=folder, executor=executor)
+
+
+def get_download_jobs(max_workers: Optional[int] = None) -> DownloadJobs:
+    """Get the download jobs of this process, with its pool of workers.
+
+    Args:
+        max_workers (Optional[int]): Number of worker processes. Defaults to None
+            for `DOWNLOAD_WORKERS`.
+
+    Returns:
+        DownloadJobs: Download jobs
+    """
+    return _get_download_jobs(
+        folder=os.path.join(get_settings().storage.paths.temporary, "dashboard_jobs"),
+        max_workers=max_workers or DOWNLOAD_WORKERS,
+    )
@@ -0,0 +1,108 @@
+"""Startup of the dashboard.
+
+The dashboard starts serving before the data it may need later is ready: heavy
+modules are imported when first used, and the data likely to be used first, i.e.
+the indexes of the available logs and the selections analysed recently, is loaded
+by a background thread once the server is up.
+
+The time of each phase of the startup, in the foreground or in the background, is
+recorded and reported, to find what makes it slow.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from logging import getLogger
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+
+logger = getLogger(__name__)
+
+
+class StartupTimer:
+    """Duration of each phase of the startup."""
+
+    def __init__(self):
+        """Startup timer constructor."""
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase of the startup.
+
+        Args:
+            name (str): Name of the phase
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.phases.append((name, time.perf_counter() - start))
+
+    def report(self) -> Dict[str, float]:
+        """Duration of each phase, in seconds, in the order they finished.
+
+        Returns:
+            Dict[str, float]: Duration of each phase, and the time elapsed since the
+                timer was created as total
+        """
+        with self._lock:
+            report = dict(self.phases)
+        report["total"] = time.perf_counter() - self.started
+        return report
+
+    def log(self, title: str) -> None:
+        """Log the duration of each phase.
+
+        Args:
+            title (str): Title of the report
+        """
+        lines = [
+            f"{name}: {seconds * 1000:.0f} ms"
+            for name, seconds in self.report().items()
+        ]
+        logger.info(f"{title}\n  " + "\n  ".join(lines))
+
+
+def prewarm(
+    steps: List[Tuple[str, Callable[[], Any]]], timer: StartupTimer
+) -> threading.Thread:
+    """Run the prewarm steps in a background thread.
+
+    A step failing is logged and does not stop the others, as everything prewarmed
+    is loaded again on demand anyway.
+
+    Args:
+        steps (List[Tuple[str, Callable[[], Any]]]): Name and function of each step
+        timer (StartupTimer): Timer recording the duration of each step
+
+    Returns:
+        threading.Thread: Thread running the steps
+    """
+
+    def run() -> None:
+        for name, step in steps:
+            with timer.phase(f"prewarm {name}"):
+                try:
+                    step()
+                except Exception:  # pylint: disable=broad-except
+                    logger.warning(f"Prewarm step {name} failed", exc_info=True)
+        timer.log(title="Dashboard prewarmed")
+
+    thread = threading.Thread(target=run, name="dashboard-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+@lru_cache()
+def get_startup_timer() -> StartupTimer:
+    """Get the startup timer of the process, created on first use."""
+    return StartupTimer()
@@ -2,11 +2,35 @@
 import importlib
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from datetime import date
+from datetime import timedelta
+from typing import Any
+from typing import Dict
 from typing import List
+from typing import Optional
+from zipfile import BadZipFile
 
+from pandas import DataFrame
+
+from hamcontestanalysis.commons import get_call_info
+from hamcontestanalysis.commons.cabrillo import parse_cabrillo_header
+from hamcontestanalysis.commons.pandas.rbn import compute_skimmer_calibration
 from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.data.catalog import get_catalog
+from hamcontestanalysis.data.hot_cache import ensure_hot_cache
+from hamcontestanalysis.data.hot_cache import hot_cache_enabled
+from hamcontestanalysis.data.migrations import PROCESSING_VERSION
+from hamcontestanalysis.data.minute_aggregates import ensure_minute_aggregates
+from hamcontestanalysis.data.processed_rbn_source import (
+    ProcessedReverseBeaconDataSource,
+)
 from hamcontestanalysis.data.raw_contest_sink import RawCabrilloDataSink
+from hamcontestanalysis.data.raw_contest_sink import RawCabrilloMetaDataSink
+from hamcontestanalysis.data.raw_rbn_sink import RawReverseBeaconCalibrationDataSink
 from hamcontestanalysis.data.raw_rbn_sink import RawReverseBeaconDataSink
+from hamcontestanalysis.data.raw_rbn_sink import RawReverseBeaconDateDataSink
 from hamcontestanalysis.data.rbn.storage_source import ReverseBeaconRawDataSource
 from hamcontestanalysis.modules.download.data_manipulation import data_manipulation
 
@@ -14,6 +38,28 @@ from hamcontestanalysis.modules.download.data_manipulation import data_manipulat
 logger = logging.getLogger(__name__)
 
 
+def _exists_partition(path: str, kind: str, **keys: Any) -> bool:
+    """Partition is registered in the storage catalog.
+
+    Partitions stored before the catalog existed are registered on first lookup.
+
+    Args:
+        path (str): path of the partition file
+        kind (str): kind of partition in the catalog
+        keys (Any): partition keys
+
+    Returns:
+        bool: partition exists
+    """
+    catalog = get_catalog()
+    if catalog.contains(path=path):
+        return True
+    if os.path.exists(path=path):
+        catalog.register(kind=kind, path=path, **keys)
+        return True
+    return False
+
+
 def exists(contest: str, year: int, callsign: str, mode: str) -> bool:
     """Parquet exists for that call/contest/year/mode.
 
@@ -27,10 +73,11 @@ def exists(contest: str, year: int, callsign: str, mode: str) -> bool:
         bool: partition exists
     """
     settings = get_settings()
-    path = settings.storage.paths.raw_data.format(
-        contest=contest, mode=mode, year=year, callsign=callsign
+    keys = dict(contest=contest, mode=mode, year=year, callsign=callsign.lower())
+    path = os.path.join(
+        settings.storage.paths.raw_data.format(**keys), RawCabrilloDataSink.path
     )
-    return os.path.exists(path=path)
+    return _exists_partition(path=path, kind=RawCabrilloDataSink.catalog_kind, **keys)
 
 
 def exists_rbn(contest: str, year: int, mode: str) -> bool:
@@ -45,8 +92,91 @@ def exists_rbn(contest: str, year: int, mode: str) -> bool:
         bool: partition exists
     """
     settings = get_settings()
-    path = settings.storage.paths.raw_rbn.format(contest=contest, mode=mode, year=year)
-    return os.path.exists(path=path)
+    keys = dict(contest=contest, mode=mode, year=year)
+    path = os.path.join(
+        settings.storage.paths.raw_rbn.format(**keys), RawReverseBeaconDataSink.path
+    )
+    return _exists_partition(
+        path=path, kind=RawReverseBeaconDataSink.catalog_kind, **keys
+    )
+
+
+def exists_rbn_calibration(contest: str, year: int, mode: str) -> bool:
+    """Parquet exists for the RBN skimmer calibration.
+
+    Args:
+        contest (str): string with the name of the contest (case insensitive)
+        year (int): year of the contest
+        mode (str): mode of the contest
+
+    Returns:
+        bool: partition exists
+    """
+    settings = get_settings()
+    keys = dict(contest=contest, mode=mode, year=year)
+    path = os.path.join(
+        settings.storage.paths.raw_rbn_calibration.format(**keys),
+        RawReverseBeaconCalibrationDataSink.path,
+    )
+    return _exists_partition(
+        path=path, kind=RawReverseBeaconCalibrationDataSink.catalog_kind, **keys
+    )
+
+
+def exists_rbn_date(rbn_date: date, mode: str) -> bool:
+    """Parquet exists for the RBN spots of a day and transmission mode.
+
+    Args:
+        rbn_date (date): day of the spots
+        mode (str): transmission mode of the spots (case insensitive)
+
+    Returns:
+        bool: partition exists
+    """
+    settings = get_settings()
+    keys = dict(mode=mode.lower(), date=rbn_date.strftime("%Y-%m-%d"))
+    path = os.path.join(
+        settings.storage.paths.raw_rbn_date.format(**keys),
+        RawReverseBeaconDateDataSink.path,
+    )
+    return _exists_partition(
+        path=path, kind=RawReverseBeaconDateDataSink.catalog_kind, **keys
+    )
+
+
+def local_logs(contest: str, mode: str, year: Optional[int] = None) -> DataFrame:
+    """List the contest logs stored locally, from the storage catalog.
+
+    Args:
+        contest (str): Name of the contest
+        mode (str): Mode of the contest
+        year (Optional[int]): Year of the contest. Defaults to None for all years.
+
+    Returns:
+        DataFrame: One row per log, with callsign, year, rows and download time
+    """
+    return get_catalog().list_partitions(
+        kind=RawCabrilloDataSink.catalog_kind, contest=contest, mode=mode, year=year
+    )
+
+
+def _log_metadata(header: Dict[str, str], callsign: str) -> DataFrame:
+    """Metadata of a log from its Cabrillo header.
+
+    Args:
+        header (Dict[str, str]): Tags of the Cabrillo header
+        callsign (str): Callsign of the log, used if missing in the header
+
+    Returns:
+        DataFrame: Metadata of the log in a single row, with its continent
+    """
+    metadata = parse_cabrillo_header(header=header)
+    metadata["callsign"] = metadata["callsign"] or callsign.upper()
+    try:
+        metadata["continent"] = get_call_info().get_continent(metadata["callsign"])
+    except KeyError:
+        metadata["continent"] = None
+    return DataFrame([metadata])
 
 
 def download_contest_data(
@@ -77,23 +207,63 @@ def download_contest_data(
                 contest_data = data_source_class(
                     callsign=callsign, year=year, mode=mode
                 ).load()
-                contest_data["meta_data"] = str(contest_data._attrs)
+                metadata = _log_metadata(header=contest_data.attrs, callsign=callsign)
 
                 # Feature engineering
                 contest_data = data_manipulation(data=contest_data, contest=contest)
 
                 # Store data
-                prefix_raw_storage_data = settings.storage.paths.raw_data.format(
+                partition = dict(
                     contest=contest, mode=mode, year=year, callsign=callsign.lower()
                 )
+                RawCabrilloMetaDataSink(
+                    prefix=settings.storage.paths.raw_metadata.format(**partition),
+                    partition=partition,
+                ).push(metadata)
+                prefix_raw_storage_data = settings.storage.paths.raw_data.format(
+                    **partition
+                )
                 logger.info(f"Store data in {prefix_raw_storage_data}")
-                RawCabrilloDataSink(prefix=prefix_raw_storage_data).push(contest_data)
+                sink = RawCabrilloDataSink(
+                    prefix=prefix_raw_storage_data,
+                    partition=dict(**partition, processing_version=PROCESSING_VERSION),
+                )
+                sink.push(contest_data)
+                ensure_minute_aggregates(sink.path)
+                if hot_cache_enabled():
+                    ensure_hot_cache(sink.path)
             else:
                 logger.info(
                     f"\t- {contest} - {mode} - {year} - {callsign} already exists!"
                 )
 
 
+def query_logs(
+    contest: Optional[str] = None,
+    mode: Optional[str] = None,
+    year: Optional[int] = None,
+    **fields: Any,
+) -> DataFrame:
+    """Metadata of the stored logs matching the given header fields.
+
+    For instance, all single operator all band high power logs from Europe in 2022
+    are `query_logs(year=2022, category_operator="SINGLE-OP", category_band="ALL",
+    category_power="HIGH", continent="EU")`.
+
+    Args:
+        contest (Optional[str]): Name of the contest. Defaults to None.
+        mode (Optional[str]): Mode of the contest. Defaults to None.
+        year (Optional[int]): Year of the contest. Defaults to None.
+        fields (Any): Metadata fields to filter on, e.g. category_power or club
+
+    Returns:
+        DataFrame: One row per log, with its metadata
+    """
+    return get_catalog().list_log_metadata(
+        contest=contest, mode=mode, year=year, **fields
+    )
+
+
 def download_rbn_data(contest: str, years: List[int], mode: str = "cw"):
     """Download RBN data.
 
@@ -112,13 +282,138 @@ def download_rbn_data(contest: str, years: List[int], mode: str = "cw"):
                 contest=contest, year=year, mode=mode
             ).load()
             # Store data
-            prefix_raw_rbn_data = settings.storage.paths.raw_rbn.format(
-                contest=contest, mode=mode, year=year
-            )
+            partition = dict(contest=contest, mode=mode, year=year)
+            prefix_raw_rbn_data = settings.storage.paths.raw_rbn.format(**partition)
             logger.info(f"Store data in {prefix_raw_rbn_data}")
-            RawReverseBeaconDataSink(prefix=prefix_raw_rbn_data).push(rbn_data)
+            sink = RawReverseBeaconDataSink(
+                prefix=prefix_raw_rbn_data, partition=partition
+            )
+            sink.push(rbn_data)
+            if hot_cache_enabled():
+                ensure_hot_cache(sink.path)
         else:
             logger.info(f"\t- RBN for {contest} - {mode} - {year} already exists!")
+    calibrate_rbn_data(contest=contest, years=years, mode=mode)
+
+
+def download_rbn_date(rbn_date: date, modes: List[str], force: bool = False):
+    """Download the RBN spots of a day, and store one partition per mode.
+
+    The day is only downloaded if any of the modes is missing in the storage, and a
+    partition is written for every requested mode, even without spots, so that
+    interrupted downloads can be resumed.
+
+    Args:
+        rbn_date (date): day to download
+        modes (List[str]): transmission modes of the spots to keep, e.g. cw
+        force (bool, optional): Force download even if it exists. Defaults to False.
+    """
+    settings = get_settings()
+    missing_modes = [
+        mode.lower()
+        for mode in modes
+        if force or not exists_rbn_date(rbn_date=rbn_date, mode=mode)
+    ]
+    if not missing_modes:
+        logger.info(f"\t- RBN for {rbn_date} - {', '.join(modes)} already exists!")
+        return
+    logger.info(f"  - RBN: {rbn_date} - {', '.join(missing_modes)}")
+    rbn_data = ReverseBeaconRawDataSource(
+        year=rbn_date.year, mode="mixed", dates=[rbn_date], tx_modes=missing_modes
+    ).load_date(rbn_date=rbn_date)
+    for mode in missing_modes:
+        partition = dict(mode=mode, date=rbn_date.strftime("%Y-%m-%d"))
+        prefix_raw_rbn_data = settings.storage.paths.raw_rbn_date.format(**partition)
+        RawReverseBeaconDateDataSink(
+            prefix=prefix_raw_rbn_data, partition=partition
+        ).push(
+            rbn_data.loc[rbn_data["tx_mode"].str.lower() == mode].reset_index(drop=True)
+        )
+
+
+def download_rbn_dates(
+    start_date: date,
+    end_date: date,
+    modes: List[str],
+    workers: int = 4,
+    force: bool = False,
+):
+    """Download RBN spots for an arbitrary date range, one day per task.
+
+    Days are downloaded in parallel and stored in a date partitioned store, outside
+    of any contest. Days already downloaded are skipped, so that the command can be
+    resumed. Failed days are logged and retried in the next run.
+
+    Args:
+        start_date (date): first day to download
+        end_date (date): last day to download (included)
+        modes (List[str]): transmission modes of the spots to keep, e.g. cw
+        workers (int, optional): Number of days downloaded in parallel. Defaults to 4.
+        force (bool, optional): Force download even if it exists. Defaults to False.
+    """
+    if end_date < start_date:
+        raise ValueError("End date must be on or after the start date.")
+    logger.info(f"Downloading RBN from {start_date} to {end_date}")
+    rbn_dates = [
+        start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)
+    ]
+    failed = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                download_rbn_date, rbn_date=rbn_date, modes=modes, force=force
+            ): rbn_date
+            for rbn_date in rbn_dates
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except (OSError, ValueError, KeyError, BadZipFile) as e:
+                logger.error(f"\t- RBN for {futures[future]} failed: {e}")
+                failed.append(futures[future])
+    if failed:
+        logger.warning(
+            f"{len(failed)} days failed, run the command again to resume: "
+            f"{', '.join(str(d) for d in sorted(failed))}"
+        )
+
+
+def calibrate_rbn_data(
+    contest: str, years: List[int], mode: str = "cw", force: bool = False
+):
+    """Compute and store the RBN skimmer SNR calibration of each contest edition.
+
+    Args:
+        contest (str): Name of the contest
+        years (List[int]): Years of the contests
+        mode (str): Mode of the contest. Defaults to "cw".
+        force (bool, optional): Recompute even if it exists. Defaults to False.
+    """
+    settings = get_settings()
+    for year in years:
+        if not exists_rbn(contest=contest, year=year, mode=mode):
+            logger.info(f"\t- RBN for {contest} - {mode} - {year} not downloaded!")
+            continue
+        if exists_rbn_calibration(contest=contest, year=year, mode=mode) and not force:
+            logger.info(
+                f"\t- RBN calibration for {contest} - {mode} - {year} already exists!"
+            )
+            continue
+        logger.info(f"  - RBN calibration: {contest} - {mode} - {year}")
+        rbn_data = ProcessedReverseBeaconDataSource(
+            contest=contest, year=year, mode=mode
+        ).load()
+        if rbn_data.empty:
+            continue
+        calibration = compute_skimmer_calibration(data=rbn_data)
+        partition = dict(contest=contest, mode=mode, year=year)
+        prefix_calibration = settings.storage.paths.raw_rbn_calibration.format(
+            **partition
+        )
+        logger.info(f"Store calibration in {prefix_calibration}")
+        RawReverseBeaconCalibrationDataSink(
+            prefix=prefix_calibration, partition=partition
+        ).push(calibration)
 
 
 def main(
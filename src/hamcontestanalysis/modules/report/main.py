@@ -0,0 +1,432 @@
+"""Static HTML report of a selection of logs.
+
+The report is a folder with an index page, showing the summary tables of the logs
+and embedding one page per plot, and a single copy of plotly.js referenced by all
+of them, so that it can be published as is, e.g. on the website of a club.
+
+The data sets shared by the plots are planned by a `Report`, see
+`hamcontestanalysis.modules.report.planner`: the logs, their per-minute aggregates
+and the RBN data of their years are loaded once, with the columns derived by the
+plots added once, and written as uncompressed Arrow IPC files, which the processes
+building the figures in parallel read memory-mapped instead of loading the data
+again.
+"""
+import html
+import importlib
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from logging import getLogger
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from pandas import DataFrame
+from plotly.offline import get_plotlyjs
+
+from hamcontestanalysis.commons.pandas.aggregates import minute_aggregates
+from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.data.hot_cache import HotCacheDataSink
+from hamcontestanalysis.data.storage_source import read_arrow_ipc
+from hamcontestanalysis.modules.report.planner import Report
+from hamcontestanalysis.utils import CONTINENTS
+
+
+logger = getLogger(__name__)
+
+# File of plotly.js in the report, shared by all the plot pages
+PLOTLYJS = "plotly.min.js"
+
+
+def _item(
+    name: str, title: str, module: str, cls: str, data: str = "contest", **kwargs: Any
+) -> Dict[str, Any]:
+    """Plot of the report."""
+    return dict(
+        name=name, title=title, module=module, cls=cls, data=data, kwargs=kwargs
+    )
+
+
+def report_items(
+    contest: str,
+    mode: str,
+    callsigns_years: List[Tuple[str, int]],
+    rbn_years: List[int],
+) -> List[Dict[str, Any]]:
+    """Plots of the report, with the default options of the dashboard.
+
+    Args:
+        contest (str): Name of the contest
+        mode (str): Mode of the contest
+        callsigns_years (List[Tuple[str, int]]): Callsign and year of each log
+        rbn_years (List[int]): Years with RBN data, whose RBN plots are included
+
+    Returns:
+        List[Dict[str, Any]]: Name, title, module and class of each plot, with the
+            keyword arguments of the class and the data set it is built from, contest
+            or rbn
+    """
+    common = "hamcontestanalysis.plots.common"
+    logs = dict(contest=contest, mode=mode, callsigns_years=callsigns_years)
+    items = [
+        _item(
+            "log_heatmap",
+            "Log heatmap",
+            f"{common}.plot_log_heatmap",
+            "PlotLogHeatmap",
+            continents=CONTINENTS,
+            **logs,
+        ),
+        _item(
+            "qsos_hour",
+            "QSOs per hour",
+            f"{common}.plot_qsos_hour",
+            "PlotQsosHour",
+            continents=CONTINENTS,
+            time_bin_size=60,
+            **logs,
+        ),
+        _item(
+            "frequency",
+            "Frequency",
+            f"{common}.plot_frequency",
+            "PlotFrequency",
+            **logs,
+        ),
+        _item(
+            "rate",
+            "QSO rate",
+            f"{common}.plot_rate",
+            "PlotRate",
+            time_bin_size=60,
+            **logs,
+        ),
+        _item(
+            "rolling_rate",
+            "QSO rolling rate",
+            f"{common}.plot_rolling_rate",
+            "PlotRollingRate",
+            time_bin_size=60,
+            **logs,
+        ),
+        _item(
+            "qso_direction",
+            "QSO direction",
+            f"{common}.plot_qso_direction",
+            "PlotQsoDirection",
+            contest_hours=[0, 48],
+            **logs,
+        ),
+        _item(
+            "minutes_previous_call",
+            "Minutes from previous call",
+            f"{common}.plot_minutes_from_previous_call",
+            "PlotMinutesPreviousCall",
+            mode=mode,
+            callsigns_years=callsigns_years,
+            time_bin_size=5,
+        ),
+    ]
+    module = f"hamcontestanalysis.plots.{contest}.plot_contest_evolution"
+    features = importlib.import_module(module).AVAILABLE_FEATURES
+    items += [
+        _item(
+            f"contest_evolution_{feature}",
+            title,
+            module,
+            "PlotContestEvolution",
+            mode=mode,
+            callsigns_years=callsigns_years,
+            feature=feature,
+        )
+        for feature, (_, title, _) in features.items()
+    ]
+    if not rbn_years:
+        return items
+
+    rbn = "hamcontestanalysis.plots.rbn"
+    rbn_logs = dict(
+        logs,
+        callsigns_years=[(c, y) for c, y in callsigns_years if int(y) in rbn_years],
+        time_bin_size=60,
+    )
+    items += [
+        _item(
+            "cw_speed",
+            "CW speed",
+            f"{rbn}.plot_cw_speed",
+            "PlotCwSpeed",
+            "rbn",
+            **rbn_logs,
+        ),
+        _item(
+            "snr",
+            "RBN SNR",
+            f"{rbn}.plot_snr",
+            "PlotSnr",
+            "rbn",
+            rx_continents=CONTINENTS,
+            **rbn_logs,
+        ),
+        _item(
+            "number_rbn_spots",
+            "RBN spots",
+            f"{rbn}.plot_number_rbn_spots",
+            "PlotNumberRbnSpots",
+            "rbn",
+            rx_continents=CONTINENTS,
+            **rbn_logs,
+        ),
+        _item(
+            "band_conditions",
+            "Band conditions",
+            f"{rbn}.plot_band_conditions",
+            "PlotBandConditions",
+            "rbn",
+            contest=contest,
+            mode=mode,
+            years=rbn_years,
+            time_bin_size=60,
+            reference="EU",
+            continents=CONTINENTS,
+        ),
+    ]
+    return items
+
+
+@lru_cache(maxsize=3)
+def _shared_data(path: str) -> DataFrame:
+    """Data set of the report, memory-mapped once by each worker process."""
+    return read_arrow_ipc(path, memory_map=True)
+
+
+def render_item(
+    item: Dict[str, Any], data_paths: Dict[str, str], folder: str
+) -> Optional[str]:
+    """Build the figure of a plot and write its page.
+
+    Args:
+        item (Dict[str, Any]): Plot, from `report_items`
+        data_paths (Dict[str, str]): Path of the Arrow IPC file of each data set
+        folder (str): Folder of the report
+
+    Returns:
+        Optional[str]: File name of the page, or None if the plot failed
+    """
+    try:
+        plot = getattr(importlib.import_module(item["module"]), item["cls"])(
+            **item["kwargs"]
+        )
+        if getattr(plot, "uses_aggregates", False):
+            plot.aggregates = _shared_data(data_paths["aggregates"])
+        else:
+            plot.data = _shared_data(data_paths[item["data"]])
+        file_name = f"{item['name']}.html"
+        plot.plot().write_html(
+            os.path.join(folder, file_name), include_plotlyjs=PLOTLYJS
+        )
+        return file_name
+    except Exception:  # pylint: disable=broad-except
+        logger.warning(f"Plot {item['name']} failed", exc_info=True)
+        return None
+
+
+def _index(
+    contest: str,
+    mode: str,
+    callsigns_years: List[Tuple[str, int]],
+    summary: DataFrame,
+    pages: List[Tuple[Dict[str, Any], Optional[str]]],
+) -> str:
+    """Index page of the report."""
+    title = html.escape(
+        f"{contest.upper()} {mode.upper()} - "
+        + ", ".join(f"{c.upper()} ({y})" for c, y in callsigns_years)
+    )
+    sections = [
+        f'<h2>{html.escape(item["title"])}</h2>\n'
+        + (
+            f'<iframe src="{file_name}" width="100%" height="650" frameborder="0">'
+            "</iframe>"
+            if file_name
+            else "<p>Not available.</p>"
+        )
+        for item, file_name in pages
+    ]
+    return "\n".join(
+        [
+            "<!DOCTYPE html>",
+            '<html><head><meta charset="utf-8">',
+            f"<title>{title}</title></head><body>",
+            f"<h1>{title}</h1>",
+            "<h2>Summary</h2>",
+            summary.to_html(index=False, na_rep="", border=0),
+            *sections,
+            "</body></html>",
+        ]
+    )
+
+
+def write_report(
+    contest: str,
+    mode: str,
+    callsigns_years: List[Tuple[str, int]],
+    data_contest: DataFrame,
+    data_rbn: Optional[DataFrame],
+    output: str,
+    executor: Executor,
+    data_aggregates: Optional[DataFrame] = None,
+) -> Dict[str, Optional[str]]:
+    """Write the report of the data of a selection of logs.
+
+    Args:
+        contest (str): Name of the contest
+        mode (str): Mode of the contest
+        callsigns_years (List[Tuple[str, int]]): Callsign and year of each log
+        data_contest (DataFrame): Processed logs
+        data_rbn (Optional[DataFrame]): RBN data of the years of the logs, None to
+            leave the RBN plots out
+        output (str): Folder of the report
+        executor (Executor): Executor building the figures
+        data_aggregates (Optional[DataFrame]): Per-minute aggregates of the logs.
+            Defaults to None to aggregate the processed logs.
+
+    Returns:
+        Dict[str, Optional[str]]: File name of the page of each plot, None for the
+            plots that failed
+    """
+    os.makedirs(output, exist_ok=True)
+    with open(os.path.join(output, PLOTLYJS), "w", encoding="utf-8") as f:
+        f.write(get_plotlyjs())
+    rbn_years = (
+        sorted({int(y) for y in data_rbn["year"].unique()})
+        if data_rbn is not None and not data_rbn.empty
+        else []
+    )
+    report = Report(
+        contest=contest, mode=mode, callsigns_years=callsigns_years
+    ).add_items(
+        report_items(
+            contest=contest,
+            mode=mode,
+            callsigns_years=callsigns_years,
+            rbn_years=rbn_years,
+        )
+    )
+    data_sets = report.load(
+        contest=data_contest, aggregates=data_aggregates, rbn=data_rbn
+    )
+    # The summary tables are built from the aggregates, even if no plot uses them
+    data_aggregates = data_sets.get("aggregates")
+    if data_aggregates is None:
+        data_aggregates = minute_aggregates(data_contest)
+
+    os.makedirs(get_settings().storage.paths.temporary, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=get_settings().storage.paths.temporary) as tmp:
+        data_paths = {}
+        for name in report.plan():
+            HotCacheDataSink(prefix=os.path.join(tmp, name)).push(data_sets[name])
+            data_paths[name] = os.path.join(tmp, name, HotCacheDataSink.path)
+        futures = [
+            (item, executor.submit(render_item, item, data_paths, output))
+            for item in report.items
+        ]
+        pages = [(item, future.result()) for item, future in futures]
+
+    table = importlib.import_module(
+        f"hamcontestanalysis.tables.{contest}.table_contest_summary"
+    ).TableContestSummary()
+    table.data = data_aggregates
+    summary = table.view().data.rename(
+        columns={c["id"]: c["name"] for c in table.columns}
+    )
+    with open(os.path.join(output, "index.html"), "w", encoding="utf-8") as f:
+        f.write(
+            _index(
+                contest=contest,
+                mode=mode,
+                callsigns_years=callsigns_years,
+                summary=summary,
+                pages=pages,
+            )
+        )
+    return {item["name"]: file_name for item, file_name in pages}
+
+
+def main(
+    contest: str,
+    mode: str,
+    callsigns_years: List[Tuple[str, int]],
+    output: str,
+    workers: Optional[int] = None,
+    rbn: bool = True,
+) -> None:
+    """Main report entrypoint.
+
+    The logs, and the RBN data of the years stored, must have been downloaded.
+
+    Args:
+        contest (str): Name of the contest
+        mode (str): Mode of the contest
+        callsigns_years (List[Tuple[str, int]]): Callsign and year of each log
+        output (str): Folder of the report
+        workers (Optional[int]): Processes building the figures. Defaults to None
+            for the number of CPUs.
+        rbn (bool): Include the RBN plots of the years with RBN data stored.
+            Defaults to True.
+    """
+    # Imported here, as the download module imports every data source
+    from hamcontestanalysis.modules.download.main import exists_rbn
+
+    contest, mode = contest.lower(), mode.lower()
+    callsigns_years = [(c.upper(), int(y)) for c, y in callsigns_years]
+    rbn_years = (
+        sorted(
+            {
+                y
+                for _, y in callsigns_years
+                if exists_rbn(contest=contest, year=y, mode=mode)
+            }
+        )
+        if rbn
+        else []
+    )
+    report = Report(
+        contest=contest, mode=mode, callsigns_years=callsigns_years
+    ).add_items(
+        report_items(
+            contest=contest,
+            mode=mode,
+            callsigns_years=callsigns_years,
+            rbn_years=rbn_years,
+        )
+    )
+    logger.info(f"Load {len(callsigns_years)} logs, and RBN data of {rbn_years}")
+    data_sets = report.load()
+    logger.info(
+        "Data sets loaded in "
+        + ", ".join(f"{k}: {v:.2f} s" for k, v in report.timings.items())
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        pages = write_report(
+            contest=contest,
+            mode=mode,
+            callsigns_years=callsigns_years,
+            data_contest=data_sets["contest"],
+            data_rbn=data_sets.get("rbn"),
+            output=output,
+            executor=executor,
+            data_aggregates=data_sets.get("aggregates"),
+        )
+    failed = [name for name, file_name in pages.items() if file_name is None]
+    if failed:
+        logger.warning(f"Plots left out of the report: {failed}")
+    logger.info(f"Report written to {os.path.join(output, 'index.html')}")
@@ -0,0 +1,257 @@
+"""Planner of the plots of a report.
+
+The plots of a report are declared on a `Report`, with the keyword arguments of
+their classes. Before any figure is built, the report plans the data sets shared by
+the plots:
+
+- contest: the QSOs of the logs, with only the columns read by the plots built from
+  them
+- aggregates: the per-minute aggregates of the logs, for the plots counting QSOs by
+  time bin, band or continent
+- rbn: the RBN data of the years of the RBN plots
+
+Each data set is loaded once, and the columns the plots derive from it, e.g. the
+plot keys or the rolling rates, are added once with `add_shared_columns`, instead of
+once per plot. The figures are then built from the shared data sets, in parallel.
+"""
+import importlib
+import time
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from pandas import DataFrame
+from plotly.graph_objects import Figure
+
+from hamcontestanalysis.commons.pandas.aggregates import minute_aggregates
+from hamcontestanalysis.commons.pandas.selection import get_log_index
+from hamcontestanalysis.data.minute_aggregates import MinuteAggregatesDataset
+from hamcontestanalysis.data.processed_contest_source import ProcessedContestDataset
+from hamcontestanalysis.plots.plot_base import get_input_columns
+from hamcontestanalysis.plots.plot_rbn_base import load_rbn_data
+
+
+logger = getLogger(__name__)
+
+# Data sets shared by the plots, in the order they are loaded
+DATA_SETS = ["contest", "aggregates", "rbn"]
+
+
+def data_set(item: Dict[str, Any], plot: Any) -> str:
+    """Get the data set a plot of a report is built from.
+
+    Args:
+        item (Dict[str, Any]): Plot of the report
+        plot (Any): Instance of the plot
+
+    Returns:
+        str: Name of the data set, contest, aggregates or rbn
+    """
+    if getattr(plot, "uses_aggregates", False):
+        return "aggregates"
+    return item["data"]
+
+
+class Report:
+    """Plots of a selection of logs, built from shared data sets."""
+
+    def __init__(self, contest: str, mode: str, callsigns_years: List[Tuple[str, int]]):
+        """Report constructor.
+
+        Args:
+            contest (str): Name of the contest
+            mode (str): Mode of the contest
+            callsigns_years (List[Tuple[str, int]]): Callsign and year of each log
+        """
+        self.contest = contest
+        self.mode = mode
+        self.callsigns_years = callsigns_years
+        self.items: List[Dict[str, Any]] = []
+        self.timings: Dict[str, float] = {}
+        self._plots: Optional[Dict[str, Any]] = None
+
+    def add(
+        self,
+        name: str,
+        title: str,
+        module: str,
+        cls: str,
+        data: str = "contest",
+        **kwargs: Any,
+    ) -> "Report":
+        """Add a plot to the report.
+
+        Args:
+            name (str): Name of the plot, unique in the report
+            title (str): Title of the plot
+            module (str): Module of the plot class
+            cls (str): Name of the plot class
+            data (str): Data set of the plot, contest or rbn. Plots using the
+                aggregates are built from them regardless. Defaults to contest.
+            kwargs (Any): Keyword arguments of the plot class
+
+        Returns:
+            Report: The report itself
+        """
+        return self.add_items(
+            [
+                dict(
+                    name=name,
+                    title=title,
+                    module=module,
+                    cls=cls,
+                    data=data,
+                    kwargs=kwargs,
+                )
+            ]
+        )
+
+    def add_items(self, items: Iterable[Dict[str, Any]]) -> "Report":
+        """Add several plots to the report.
+
+        Args:
+            items (Iterable[Dict[str, Any]]): Plots, as built by `add`
+
+        Returns:
+            Report: The report itself
+        """
+        self.items.extend(items)
+        self._plots = None
+        return self
+
+    @property
+    def plots(self) -> Dict[str, Any]:
+        """Instance of each plot of the report, leaving out those failing."""
+        if self._plots is None:
+            self._plots = {}
+            for item in self.items:
+                try:
+                    self._plots[item["name"]] = getattr(
+                        importlib.import_module(item["module"]), item["cls"]
+                    )(**item["kwargs"])
+                except Exception:  # pylint: disable=broad-except
+                    logger.warning(f"Plot {item['name']} failed", exc_info=True)
+        return self._plots
+
+    def plan(self) -> Dict[str, List[str]]:
+        """Plan the data sets shared by the plots.
+
+        Returns:
+            Dict[str, List[str]]: Names of the plots built from each data set
+                needed, in the order they are loaded
+        """
+        plan: Dict[str, List[str]] = {}
+        for item in self.items:
+            if item["name"] in self.plots:
+                plot = self.plots[item["name"]]
+                plan.setdefault(data_set(item=item, plot=plot), []).append(item["name"])
+        return {name: plan[name] for name in DATA_SETS if name in plan}
+
+    def _load(
+        self, name: str, plots: List[Any], given: Dict[str, DataFrame]
+    ) -> DataFrame:
+        """Load a data set from storage, or derive it from the data sets given."""
+        if name == "contest":
+            return ProcessedContestDataset(
+                contest=self.contest,
+                mode=self.mode,
+                callsigns_years=self.callsigns_years,
+            ).load(columns=get_input_columns(plots))
+        if name == "aggregates":
+            if "contest" in given:
+                return minute_aggregates(given["contest"])
+            return MinuteAggregatesDataset(
+                contest=self.contest,
+                mode=self.mode,
+                callsigns_years=self.callsigns_years,
+            ).load()
+        years = sorted({int(y) for plot in plots for y in plot.years})
+        return load_rbn_data(contest=self.contest, mode=self.mode, years=years)
+
+    def load(self, **data_sets: Optional[DataFrame]) -> Dict[str, DataFrame]:
+        """Load each data set planned once, with the columns shared by its plots.
+
+        The aggregates are derived from the QSOs if these are given but not the
+        aggregates, and read from storage otherwise.
+
+        Args:
+            data_sets (Optional[DataFrame]): Data sets already loaded, by name,
+                which are used as given. None values are ignored.
+
+        Returns:
+            Dict[str, DataFrame]: Data sets planned, by name
+        """
+        given = {k: v for k, v in data_sets.items() if v is not None}
+        loaded = dict(given)
+        for name, names in self.plan().items():
+            start = time.perf_counter()
+            plots = [self.plots[n] for n in names]
+            data = given[name] if name in given else self._load(name, plots, given)
+            for plot in plots:
+                if hasattr(plot, "add_shared_columns"):
+                    data = plot.add_shared_columns(data)
+            loaded[name] = data
+            self.timings[name] = time.perf_counter() - start
+        return loaded
+
+    def _figure(self, name: str, data_sets: Dict[str, DataFrame]) -> Optional[Figure]:
+        """Build the figure of a plot from the data sets, None if it fails."""
+        start = time.perf_counter()
+        try:
+            plot = self.plots[name]
+            item = next(i for i in self.items if i["name"] == name)
+            data = data_sets[data_set(item=item, plot=plot)]
+            if getattr(plot, "uses_aggregates", False):
+                plot.aggregates = data
+            else:
+                plot.data = data
+            return plot.plot()
+        except Exception:  # pylint: disable=broad-except
+            logger.warning(f"Plot {name} failed", exc_info=True)
+            return None
+        finally:
+            self.timings[f"plot.{name}"] = time.perf_counter() - start
+
+    def render(
+        self,
+        data_sets: Optional[Dict[str, DataFrame]] = None,
+        executor: Optional[Executor] = None,
+    ) -> Dict[str, Optional[Figure]]:
+        """Build the figures of the plots, in parallel.
+
+        The plots share the data sets in memory, hence the figures are built by
+        threads. The logs of the data sets are indexed before, so that the plots
+        selecting their logs do not index them concurrently.
+
+        Args:
+            data_sets (Optional[Dict[str, DataFrame]]): Data sets, from `load`.
+                Defaults to None to load them.
+            executor (Optional[Executor]): Thread executor building the figures.
+                Defaults to None for a thread pool of one thread per plot.
+
+        Returns:
+            Dict[str, Optional[Figure]]: Figure of each plot, None for the plots
+                that failed
+        """
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=max(len(self.items), 1)) as pool:
+                return self.render(data_sets=data_sets, executor=pool)
+
+        if data_sets is None:
+            data_sets = self.load()
+        for name, callsign in [("contest", "mycall"), ("rbn", "dx")]:
+            if name in data_sets and callsign in data_sets[name].columns:
+                get_log_index(data=data_sets[name], callsign=callsign)
+        futures = {
+            item["name"]: executor.submit(self._figure, item["name"], data_sets)
+            for item in self.items
+            if item["name"] in self.plots
+        }
+        figures = {name: f.result() for name, f in futures.items()}
+        return {item["name"]: figures.get(item["name"]) for item in self.items}
@@ -1,21 +1,24 @@
 """Plot QSO rate."""
 
+from typing import ClassVar
+from typing import List
 from typing import Optional
 
-from pandas import to_datetime
-from pandas import to_timedelta
 from plotly.express import scatter
 from plotly.graph_objects import Figure
 from plotly.offline import plot as po_plot
 
 from hamcontestanalysis.plots import PLOT_TEMPLATE
 from hamcontestanalysis.plots.plot_base import PlotBase
+from hamcontestanalysis.plots.plot_base import add_plot_keys
 from hamcontestanalysis.utils import BANDMAP
 
 
 class PlotFrequency(PlotBase):
     """Plot QSOs Hour."""
 
+    input_columns: ClassVar[List[str]] = ["mycall", "year", "hour", "frequency", "band"]
+
     def plot(self, save: bool = False) -> Optional[Figure]:
         """Create plot.
 
@@ -25,10 +28,12 @@ class PlotFrequency(PlotBase):
         Returns:
             Optional[Figure]: Plotly figure
         """
-        _data = self.data.assign(
-            callsign_year=lambda x: x["mycall"] + "(" + x["year"].astype(str) + ")",
-            dummy_datetime=lambda x: to_datetime("2000-01-01")
-            + to_timedelta(x["hour"], "H"),
+        _data = self.data.pipe(add_plot_keys).pipe(
+            self._downsample,
+            x="dummy_datetime",
+            y="frequency",
+            by=["callsign_year", "band"],
+            method="minmax",
         )
         fig = scatter(
             _data,
@@ -48,6 +53,7 @@ class PlotFrequency(PlotBase):
         fig.update_layout(hovermode="x unified", template=PLOT_TEMPLATE)
         fig.update_xaxes(title="Dummy contest datetime")
         fig.update_yaxes(title="Frequency", matches=None)
+        self._set_x_range(fig)
 
         if not save:
             return fig
@@ -1,30 +1,35 @@
 """Plot QSO rate."""
 
+from typing import ClassVar
 from typing import List
 from typing import Optional
 from typing import Tuple
 
 from numpy import arange
-from numpy import floor
 from numpy import int64
-from numpy import vectorize
+from numpy import uint16
 from numpy import where
 from pandas import DataFrame
-from pandas import Grouper
 from pandas import pivot_table
 from plotly.graph_objects import Figure
 from plotly.graph_objects import Heatmap
 from plotly.offline import plot as po_plot
 from plotly.subplots import make_subplots
 
+from hamcontestanalysis.commons.pandas.aggregates import contest_minute
+from hamcontestanalysis.commons.pandas.aggregates import rollup
 from hamcontestanalysis.plots import PLOT_TEMPLATE
 from hamcontestanalysis.plots.plot_base import PlotBase
+from hamcontestanalysis.plots.plot_base import add_plot_keys
 from hamcontestanalysis.utils import CONTINENTS
 
 
 class PlotLogHeatmap(PlotBase):
     """Plot Contest log heatmap."""
 
+    input_columns: ClassVar[List[str]] = ["mycall", "year", "hour", "continent"]
+    uses_aggregates: ClassVar[bool] = True
+
     def __init__(
         self,
         contest: str,
@@ -51,23 +56,17 @@ class PlotLogHeatmap(PlotBase):
         """Prepare dataframe for plotting."""
         # Aggregate original dataframe
         grp = (
-            self.data.query(f"continent.isin({self.continents})")
-            .assign(
-                callsign_year=lambda x: x["mycall"] + "(" + x["year"].astype(str) + ")",
-                contest_hour=lambda x: floor(x["hour"]).astype(int64),
+            rollup(
+                self.aggregates.query(f"continent.isin({self.continents})"),
+                by=["mycall", "year"],
+                time_bin_size=self.time_bin,
             )
-            .groupby(
-                [
-                    Grouper(key="datetime", freq=f"{self.time_bin}Min"),
-                    "callsign_year",
-                    "contest_hour",
-                ],
-                as_index=False,
-            )
-            .agg(qsos=("callsign_year", "count"), calls=("call", "unique"))
+            .pipe(add_plot_keys)
             .assign(
-                contest_minute=lambda x: x["datetime"].dt.minute.astype(int64),
+                contest_hour=lambda x: (x["minute"] // 60).astype(int64),
+                contest_minute=lambda x: (x["minute"] % 60).astype(int64),
             )
+            .loc[:, ["callsign_year", "contest_hour", "contest_minute", "qsos"]]
         )
 
         # Template for missing values
@@ -89,15 +88,26 @@ class PlotLogHeatmap(PlotBase):
             df_template.merge(
                 grp, how="left", on=["contest_minute", "contest_hour", "callsign_year"]
             )
-            .drop(columns=["datetime"])
             .assign(
                 qsos=lambda x: where(x["qsos"].isnull(), 0, x["qsos"]),
-                calls=lambda x: where(x["calls"].isnull(), "[]", x["calls"]),
             )
             .astype({"qsos": int64})
         )
         return grp
 
+    def calls_index(self) -> "LogHeatmapCalls":
+        """Index of the calls worked in each cell of the heatmap.
+
+        The figure only carries the number of QSOs of each cell, the calls are
+        looked up in the index on demand, e.g. when a cell is clicked.
+
+        Returns:
+            LogHeatmapCalls: Index of the calls
+        """
+        return LogHeatmapCalls(
+            data=self.data, time_bin_size=self.time_bin, continents=self.continents
+        )
+
     def plot(self, save: bool = False) -> Optional[Figure]:
         """Create plot.
 
@@ -105,7 +115,7 @@ class PlotLogHeatmap(PlotBase):
             save (bool): Save file in html. Defaults to False.
 
         Returns:
-            Optinal[Figure]: _description_
+            Optional[Figure]: Figure with one heatmap of QSOs per log
         """
         n_callsigns_years = len(self.callsigns_years)
         fig = make_subplots(
@@ -117,30 +127,25 @@ class PlotLogHeatmap(PlotBase):
         )
         _data = self._prepare_dataframe()
         z_max = _data["qsos"].max()
+        logs = dict(tuple(_data.groupby("callsign_year", sort=False)))
         for irow, (callsign, year) in enumerate(self.callsigns_years):
-            _df = _data.query(f"(callsign_year == '{callsign.upper()}({year})')")
+            _df = logs.get(f"{callsign.upper()}({year})", _data.iloc[:0])
             table = pivot_table(
                 _df, values="qsos", index=["contest_hour"], columns=["contest_minute"]
             )
-            table_calls = pivot_table(
-                _df,
-                values="calls",
-                index=["contest_hour"],
-                columns=["contest_minute"],
-                aggfunc=lambda x: x.values[0],
-            )
-            vfunc = vectorize(lambda x: f"QSOs: {', '.join(x)}")
-
             fig.add_trace(
                 Heatmap(
                     x=table.columns,
                     y=table.index,
-                    z=table.values,
-                    hoverinfo="text",
-                    text=vfunc(table_calls),
+                    # Counts as small integers, the smallest encoding of the cells
+                    z=table.values.astype(uint16),
+                    name=f"{callsign.upper()}({year})",
+                    hovertemplate=(
+                        "Hour %{y}, minute %{x}<br>QSOs: %{z}<extra>%{fullData.name}"
+                        "</extra>"
+                    ),
                     colorbar=dict(
-                        title=f"QSOs / {self.time_bin}min",
-                        titleside="top",
+                        title=dict(text=f"QSOs / {self.time_bin}min", side="top"),
                         tickmode="array",
                         tickvals=arange(0, z_max + 1, 1),
                         ticks="outside",
@@ -160,3 +165,49 @@ class PlotLogHeatmap(PlotBase):
         if not save:
             return fig
         po_plot(fig, filename="log_heatmap.html")
+
+
+class LogHeatmapCalls:
+    """Calls worked in each cell of the log heatmap, indexed by log, hour and minute."""
+
+    input_columns: ClassVar[List[str]] = ["mycall", "year", "hour", "continent", "call"]
+
+    def __init__(self, data: DataFrame, time_bin_size: int, continents: List[str]):
+        """Init method of the LogHeatmapCalls class.
+
+        Args:
+            data (DataFrame): Processed logs
+            time_bin_size (int): Time bin size in minutes, of the heatmap
+            continents (List[str]): Continents of the heatmap
+        """
+        self._calls = (
+            data.pipe(add_plot_keys)
+            .query(f"continent.isin({continents})")
+            .assign(minute=lambda x: contest_minute(x["hour"]))
+            .assign(
+                contest_hour=lambda x: x["minute"] // 60,
+                contest_minute=lambda x: (x["minute"] % 60)
+                // time_bin_size
+                * time_bin_size,
+            )
+            .set_index(["callsign_year", "contest_hour", "contest_minute"])["call"]
+            .sort_index()
+        )
+
+    def calls(
+        self, callsign_year: str, contest_hour: int, contest_minute: int
+    ) -> List[str]:
+        """Calls worked in a cell of the heatmap.
+
+        Args:
+            callsign_year (str): Log, e.g. EF6T(2022)
+            contest_hour (int): Hour of the contest, row of the heatmap
+            contest_minute (int): First minute of the time bin, column of the heatmap
+
+        Returns:
+            List[str]: Calls worked, in order and without repetitions
+        """
+        key = (callsign_year, int(contest_hour), int(contest_minute))
+        if key not in self._calls.index:
+            return []
+        return self._calls.loc[[key]].unique().tolist()
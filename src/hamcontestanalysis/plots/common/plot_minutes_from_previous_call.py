@@ -1,16 +1,17 @@
 """Plot minutes until next call."""
 
+from typing import ClassVar
 from typing import List
 from typing import Optional
 from typing import Tuple
 
-from pandas import concat
 from plotly.express import histogram
 from plotly.graph_objects import Figure
 from plotly.offline import plot as po_plot
 
 from hamcontestanalysis.plots import PLOT_TEMPLATE
 from hamcontestanalysis.plots.plot_base import PlotBase
+from hamcontestanalysis.plots.plot_base import add_plot_keys
 
 
 CONTEST_MINUTES = 48 * 60
@@ -19,6 +20,14 @@ CONTEST_MINUTES = 48 * 60
 class PlotMinutesPreviousCall(PlotBase):
     """Plot Minutes from previous call histogram."""
 
+    input_columns: ClassVar[List[str]] = [
+        "mycall",
+        "year",
+        "hour",
+        "minutes_from_previous_call",
+        "band_transition_from_previous_call",
+    ]
+
     def __init__(
         self, mode: str, callsigns_years: List[Tuple[str, int]], time_bin_size: int = 5
     ):
@@ -44,17 +53,10 @@ class PlotMinutesPreviousCall(PlotBase):
             Optional[Figure]: Plotly figure
         """
         # Filter callsigns and years
-        _data = []
-        for callsign, year in self.callsigns_years:
-            _data.append(
-                self.data.query(f"(mycall == '{callsign}') & (year == {year})")
-            )
-        _data = concat(_data)
+        _data = self._select_logs(self.data)
 
         # Dummy datetime to compare + time aggregation
-        _data = _data.assign(
-            callsign_year=lambda x: x["mycall"] + "(" + x["year"].astype(str) + ")",
-        )
+        _data = _data.pipe(add_plot_keys)
 
         _data_filtered = _data.query("~(minutes_from_previous_call.isnull())")
         fig = histogram(
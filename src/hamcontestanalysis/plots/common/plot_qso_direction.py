@@ -1,5 +1,6 @@
 """Plot QSO rate."""
 
+from typing import ClassVar
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -12,11 +13,14 @@ from plotly.offline import plot as po_plot
 
 from hamcontestanalysis.plots import PLOT_TEMPLATE
 from hamcontestanalysis.plots.plot_base import PlotBase
+from hamcontestanalysis.plots.plot_base import add_plot_keys
 
 
 class PlotQsoDirection(PlotBase):
     """Plot QSO direction."""
 
+    input_columns: ClassVar[List[str]] = ["mycall", "year", "hour", "heading", "call"]
+
     def __init__(
         self,
         contest: str,
@@ -46,9 +50,7 @@ class PlotQsoDirection(PlotBase):
         """
         bin_width = 10
         grp = (
-            self.data.assign(
-                callsign_year=lambda x: x["mycall"] + "(" + x["year"].astype(str) + ")"
-            )
+            self.data.pipe(add_plot_keys)
             .query(
                 f"(hour >= {self.contest_hours[0]}) & (hour < {self.contest_hours[1]})"
             )
@@ -1,5 +1,6 @@
 """Plot QSO rate."""
 
+from typing import ClassVar
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -10,15 +11,25 @@ from plotly.express import bar
 from plotly.graph_objects import Figure
 from plotly.offline import plot as po_plot
 
+from hamcontestanalysis.commons.pandas.aggregates import rollup
 from hamcontestanalysis.plots import PLOT_TEMPLATE
 from hamcontestanalysis.plots.plot_base import PlotBase
 from hamcontestanalysis.utils import CONTINENTS
-from hamcontestanalysis.utils.calculations import custom_floor
 
 
 class PlotQsosHour(PlotBase):
     """Plot QSOs Hour."""
 
+    input_columns: ClassVar[List[str]] = [
+        "mycall",
+        "year",
+        "hour",
+        "band",
+        "band_id",
+        "continent",
+    ]
+    uses_aggregates: ClassVar[bool] = True
+
     def __init__(
         self,
         contest: str,
@@ -52,16 +63,13 @@ class PlotQsosHour(PlotBase):
         """
         # Groupby data
         grp = (
-            self.data.assign(
-                hour_rounded=lambda x: custom_floor(
-                    x=x["hour"], precision=float(self.time_bin_size) / 60
-                )
-            )
-            .query(f"(continent.isin({self.continents}))")
-            .groupby(
-                ["mycall", "year", "band", "band_id", "hour_rounded"], as_index=False
+            rollup(
+                self.aggregates.query(f"(continent.isin({self.continents}))"),
+                by=["mycall", "year", "band", "band_id"],
+                time_bin_size=self.time_bin_size,
             )
-            .aggregate(qsos=("call", "count"))
+            .assign(hour_rounded=lambda x: x["minute"] / 60)
+            .loc[:, ["mycall", "year", "band", "band_id", "hour_rounded", "qsos"]]
         )
 
         grp = (
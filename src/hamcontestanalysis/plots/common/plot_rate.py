@@ -1,23 +1,27 @@
 """Plot QSO rate."""
 
+from typing import ClassVar
 from typing import List
 from typing import Optional
 from typing import Tuple
 
-from pandas import Grouper
-from pandas import to_datetime
-from pandas import to_timedelta
 from plotly.express import line
 from plotly.graph_objects import Figure
 from plotly.offline import plot as po_plot
 
+from hamcontestanalysis.commons.pandas.aggregates import SUM_COLUMNS
+from hamcontestanalysis.commons.pandas.aggregates import rollup
 from hamcontestanalysis.plots import PLOT_TEMPLATE
 from hamcontestanalysis.plots.plot_base import PlotBase
+from hamcontestanalysis.plots.plot_base import add_plot_keys
 
 
 class PlotRate(PlotBase):
     """Plot Rate."""
 
+    input_columns: ClassVar[List[str]] = ["mycall", "year", "hour"]
+    uses_aggregates: ClassVar[bool] = True
+
     def __init__(
         self,
         contest: str,
@@ -33,11 +37,14 @@ class PlotRate(PlotBase):
             mode (str): Mode of the contest
             callsigns_years (List[Tuple[str, int]]): Callsign and year of the contest
             time_bin_size (int, optional): Time bin size in minutes. Defaults to 1.
-            target (str, optional): Target to be plotted. Defaults to qsos.
+            target (str, optional): Target to be plotted, qsos or a column summed
+                by the aggregates, e.g. is_valid. Defaults to qsos.
         """
         super().__init__(contest=contest, mode=mode, callsigns_years=callsigns_years)
         self.time_bin = time_bin_size
         self.target = target
+        if target != "qsos" and target not in SUM_COLUMNS:
+            raise ValueError("Target to plot not known!")
 
     def plot(self, save: bool = False) -> Optional[Figure]:
         """Create plot.
@@ -48,29 +55,12 @@ class PlotRate(PlotBase):
         Returns:
             Optional[Figure]: _description_
         """
-        # TODO: Add this in the processing.
-        self.data = self.data.assign(qsos=1)
-
         grp = (
-            self.data.assign(
-                dummy_datetime=lambda x: to_datetime("2000-01-01")
-                + to_timedelta(x["hour"], "H"),
-                callsign_year=lambda x: x["mycall"] + "(" + x["year"].astype(str) + ")",
-            )
-            .groupby(
-                [
-                    Grouper(key="dummy_datetime", freq=f"{self.time_bin}Min"),
-                    "callsign_year",
-                ],
-                as_index=False,
-            )[self.target]
-            .sum()
-            .reset_index(drop=True)
-            .rename(
-                columns={
-                    self.target: f"{self.target}_sum",
-                }
-            )
+            rollup(self.aggregates, by=["mycall", "year"], time_bin_size=self.time_bin)
+            .pipe(add_plot_keys)
+            .rename(columns={self.target: f"{self.target}_sum"})
+            .loc[:, ["dummy_datetime", "callsign_year", f"{self.target}_sum"]]
+            .pipe(self._downsample, x="dummy_datetime", y=f"{self.target}_sum")
         )
 
         fig = line(
@@ -85,6 +75,7 @@ class PlotRate(PlotBase):
             },
         )
         fig.update_layout(hovermode="x unified", template=PLOT_TEMPLATE)
+        self._set_x_range(fig)
         fig.update_xaxes(title="Dummy contest datetime")
         fig.update_yaxes(title=f"QSOs / {self.time_bin}min")
 
@@ -1,22 +1,31 @@
 """Plot QSO rate."""
 
+from typing import ClassVar
 from typing import List
 from typing import Optional
 from typing import Tuple
 
-from pandas import to_datetime
-from pandas import to_timedelta
+from pandas import DataFrame
 from plotly.express import line
 from plotly.graph_objects import Figure
 from plotly.offline import plot as po_plot
 
+from hamcontestanalysis.commons.pandas.rolling import add_rolling_rates
 from hamcontestanalysis.plots import PLOT_TEMPLATE
 from hamcontestanalysis.plots.plot_base import PlotBase
+from hamcontestanalysis.plots.plot_base import add_plot_keys
+
+
+# Name of the columns of the rolling rates of a target, by window in minutes, shared
+# with the data prepared by the dashboard
+ROLLING_RATE_COLUMN = "{target}_rolling_{{window}}"
 
 
 class PlotRollingRate(PlotBase):
     """Plot Rate."""
 
+    input_columns: ClassVar[List[str]] = ["mycall", "year", "datetime", "hour"]
+
     def __init__(
         self,
         contest: str,
@@ -37,6 +46,24 @@ class PlotRollingRate(PlotBase):
         super().__init__(contest=contest, mode=mode, callsigns_years=callsigns_years)
         self.time_bin = time_bin_size
         self.target = target
+        if target != "qsos":
+            self.input_columns = self.input_columns + [target]
+
+    def add_shared_columns(self, data: DataFrame) -> DataFrame:
+        """Add the plot keys and the rolling rates of the target.
+
+        Args:
+            data (DataFrame): Processed logs
+
+        Returns:
+            DataFrame: Processed logs with the rolling rates of the time bin size
+        """
+        return add_rolling_rates(
+            data=add_plot_keys(data),
+            windows=[self.time_bin],
+            column=None if self.target == "qsos" else self.target,
+            name=ROLLING_RATE_COLUMN.format(target=self.target),
+        )
 
     def plot(self, save: bool = False) -> Optional[Figure]:
         """Create plot.
@@ -47,29 +74,15 @@ class PlotRollingRate(PlotBase):
         Returns:
             Optional[Figure]: Plotly figure
         """
-        # TODO: Add this in the processing.
-        self.data = self.data.assign(qsos=1)
-
+        name = ROLLING_RATE_COLUMN.format(target=self.target)
         grp = (
-            self.data.assign(
-                dummy_datetime=lambda x: to_datetime("2000-01-01")
-                + to_timedelta(x["hour"], "H"),
-                callsign_year=lambda x: x["mycall"] + "(" + x["year"].astype(str) + ")",
-            )
-            .reset_index(drop=True)
-            .join(
-                self.data.set_index("datetime")
-                .groupby(["mycall", "year"])[[self.target]]
-                .transform(
-                    lambda d: d.rolling(f"{self.time_bin}T", min_periods=1).sum()
-                )
-                .reset_index(drop=True)
-                .rename(
-                    columns={
-                        self.target: f"{self.target}_sum",
-                    }
-                )
-            )
+            self.add_shared_columns(self.data)
+            .loc[
+                :,
+                ["dummy_datetime", "callsign_year", name.format(window=self.time_bin)],
+            ]
+            .rename(columns={name.format(window=self.time_bin): f"{self.target}_sum"})
+            .pipe(self._downsample, x="dummy_datetime", y=f"{self.target}_sum")
         )
 
         fig = line(
@@ -86,6 +99,7 @@ class PlotRollingRate(PlotBase):
         fig.update_layout(hovermode="x unified", template=PLOT_TEMPLATE)
         fig.update_xaxes(title="Dummy contest datetime")
         fig.update_yaxes(title=f"QSOs / {self.time_bin}min (rolling sum)")
+        self._set_x_range(fig)
 
         if not save:
             return fig
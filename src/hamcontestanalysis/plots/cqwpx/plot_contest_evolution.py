@@ -1,20 +1,18 @@
 """Plot CQ WPX contest evolution."""
 
+from typing import ClassVar
 from typing import List
 from typing import Optional
 from typing import Tuple
 
-from pandas import Grouper
-from pandas import concat
-from pandas import to_datetime
-from pandas import to_timedelta
 from plotly.express import scatter
 from plotly.graph_objects import Figure
 from plotly.offline import plot as po_plot
 
-from hamcontestanalysis.commons.pandas.general import hour_of_contest
+from hamcontestanalysis.commons.pandas.aggregates import rollup
 from hamcontestanalysis.plots import PLOT_TEMPLATE
 from hamcontestanalysis.plots.plot_base import PlotBase
+from hamcontestanalysis.plots.plot_base import add_plot_keys
 
 
 AVAILABLE_FEATURES = {
@@ -40,6 +38,11 @@ AVAILABLE_FEATURES = {
 class PlotContestEvolution(PlotBase):
     """Plot CQ WPX evolution."""
 
+    input_columns: ClassVar[List[str]] = ["mycall", "year", "hour"] + [
+        feature[0] for feature in AVAILABLE_FEATURES.values()
+    ]
+    uses_aggregates: ClassVar[bool] = True
+
     def __init__(
         self,
         mode: str,
@@ -72,37 +75,25 @@ class PlotContestEvolution(PlotBase):
             Optional[Figure]: Plotly figure
         """
         # Filter callsigns and years
-        _data = []
-        for callsign, year in self.callsigns_years:
-            _data.append(
-                self.data.query(f"(mycall == '{callsign}') & (year == {year})")
-            )
-        _data = concat(_data)
+        _data = self._select_logs(self.aggregates)
 
-        # Dummy datetime to compare + time aggregation
+        # Time aggregation + dummy datetime to compare, with the last value of the
+        # cumulative features and the mean of the others in each time bin
         _data = (
-            _data.pipe(
-                func=hour_of_contest,
-            )
-            .assign(
-                dummy_datetime=lambda x: to_datetime("2000-01-01")
-                + to_timedelta(x["hour"], "H"),
-                callsign_year=lambda x: x["mycall"] + "(" + x["year"].astype(str) + ")",
-            )
-            .groupby(
+            rollup(_data, by=["mycall", "year"], time_bin_size=self.time_bin_size)
+            .pipe(add_plot_keys)
+            .loc[
+                :,
                 [
                     "callsign_year",
-                    Grouper(key="dummy_datetime", freq=f"{self.time_bin_size}Min"),
+                    "dummy_datetime",
+                    AVAILABLE_FEATURES[self.feature][0],
                 ],
-                as_index=False,
-            )
-            .aggregate(
-                **{
-                    AVAILABLE_FEATURES[self.feature][0]: (
-                        AVAILABLE_FEATURES[self.feature][0],
-                        AVAILABLE_FEATURES[self.feature][2],
-                    )
-                }
+            ]
+            .pipe(
+                self._downsample,
+                x="dummy_datetime",
+                y=AVAILABLE_FEATURES[self.feature][0],
             )
         )
 
@@ -123,6 +114,7 @@ class PlotContestEvolution(PlotBase):
 
         fig.update_layout(hovermode="x unified", template=PLOT_TEMPLATE)
         fig.update_xaxes(title="Dummy contest datetime")
+        self._set_x_range(fig)
         fig.update_yaxes(
             title=f"CQ WPX {AVAILABLE_FEATURES[self.feature][1]}", matches=None
         )
@@ -1,15 +1,29 @@
 """HamContestAnalysis plot base class."""
 from abc import ABC
 from abc import abstractmethod
+from typing import Any
+from typing import ClassVar
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Tuple
+from typing import Union
 
 from pandas import DataFrame
-from pandas import concat
+from pandas import to_datetime
+from pandas import to_timedelta
 from plotly.graph_objects import Figure
 
-from hamcontestanalysis.data.processed_contest_source import ProcessedContestDataSource
+from hamcontestanalysis.commons.pandas.aggregates import minute_aggregates
+from hamcontestanalysis.commons.pandas.downsampling import downsample
+from hamcontestanalysis.commons.pandas.selection import select_logs
+from hamcontestanalysis.data.minute_aggregates import MinuteAggregatesDataset
+from hamcontestanalysis.data.processed_contest_source import ProcessedContestDataset
+
+
+# Derived columns shared by the plots: the legend of each log and the datetime of
+# its QSOs shifted to a common dummy contest, to compare logs of different years
+PLOT_KEY_COLUMNS = ["callsign_year", "dummy_datetime"]
 
 
 class PlotBase(ABC):
@@ -18,14 +32,28 @@ class PlotBase(ABC):
     This abstract class serves as a base interface for the different plots,
     It mainly defines the `PlotBase.plot` method as the
     way to create a plotly object, implemented by each plot subclass.
+
+    Each subclass declares in `input_columns` the columns of the processed log that
+    it needs, so that only those are read from storage. None reads all columns.
+
+    Plots counting or summing QSOs by time bin, band or continent set
+    `uses_aggregates`, and are built from the per-minute aggregates of the logs in
+    `aggregates` instead of their QSOs. Those are read from storage, or aggregated
+    from the QSOs if these have been set as data.
     """
 
+    input_columns: ClassVar[Optional[List[str]]] = None
+    uses_aggregates: ClassVar[bool] = False
+
     def __init__(self, contest: str, mode: str, callsigns_years: List[Tuple[str, int]]):
         """Init method of the base class."""
         self.contest = contest
         self.mode = mode
         self.callsigns_years = callsigns_years
         self._data = None
+        self._aggregates = None
+        self.max_points: Optional[int] = None
+        self.x_range: Optional[List[Any]] = None
 
     @property
     def data(self):
@@ -41,23 +69,110 @@ class PlotBase(ABC):
             raise TypeError("data must be a Pandas DataFrame")
         self._data = value
 
+    @property
+    def aggregates(self):
+        """Property of attribute aggregates."""
+        if not isinstance(self._aggregates, DataFrame):
+            if isinstance(self._data, DataFrame):
+                self._aggregates = minute_aggregates(self._data)
+            else:
+                self._aggregates = self._get_aggregates()
+        return self._aggregates
+
+    @aggregates.setter
+    def aggregates(self, value):
+        """Setter for the aggregates attribute."""
+        if not isinstance(value, DataFrame):
+            raise TypeError("aggregates must be a Pandas DataFrame")
+        self._aggregates = value
+
+    def _get_aggregates(self) -> DataFrame:
+        """Get the per-minute aggregates of the downloaded logs of the plot."""
+        return MinuteAggregatesDataset(
+            contest=self.contest, mode=self.mode, callsigns_years=self.callsigns_years
+        ).load()
+
     def _get_inputs(self) -> DataFrame:
         """Get downloaded inputs needed for the plot."""
-        data = []
-        for callsign, year in self.callsigns_years:
-            data_filtered = (
-                ProcessedContestDataSource(
-                    callsign=callsign.lower(),
-                    contest=self.contest,
-                    year=year,
-                    mode=self.mode,
-                )
-                .load()
-                .assign(year=int(year))
-                .assign(contest=self.contest)
-            )
-            data.append(data_filtered)
-        return concat(data, sort=False).reset_index(drop=True)
+        return ProcessedContestDataset(
+            contest=self.contest, mode=self.mode, callsigns_years=self.callsigns_years
+        ).load(columns=self.input_columns)
+
+    def _select_logs(self, data: DataFrame) -> DataFrame:
+        """Select the rows of the logs of the plot, in the order of the plot.
+
+        Args:
+            data (DataFrame): Processed logs, or their aggregates
+
+        Returns:
+            DataFrame: Rows of the logs of the plot
+        """
+        return select_logs(data=data, callsigns_years=self.callsigns_years)
+
+    def add_shared_columns(self, data: DataFrame) -> DataFrame:
+        """Add the columns the plot derives from data that other plots may share.
+
+        The columns are only computed if missing, so that the data shared by several
+        plots, e.g. in a report, is derived once before building their figures.
+
+        Args:
+            data (DataFrame): Processed logs, or their aggregates if the plot uses
+                them
+
+        Returns:
+            DataFrame: Data with the derived columns, the plot keys by default
+        """
+        if self.uses_aggregates:
+            return data
+        return add_plot_keys(data)
+
+    def set_resolution(
+        self, max_points: Optional[int], x_range: Optional[List[Any]] = None
+    ) -> "PlotBase":
+        """Downsample the time series of the plot to a budget of points.
+
+        Plots drawing long time series downsample them before building the figure,
+        keeping all the points if the budget is None.
+
+        Args:
+            max_points (Optional[int]): Points drawn in total, shared by all logs
+            x_range (Optional[List[Any]]): Visible range of the x axis, which is
+                drawn at the full resolution of the budget. Defaults to None for the
+                whole contest.
+
+        Returns:
+            PlotBase: The plot itself
+        """
+        self.max_points = max_points
+        self.x_range = x_range
+        return self
+
+    def _downsample(
+        self,
+        data: DataFrame,
+        x: str,
+        y: str,
+        by: Union[str, List[str]] = "callsign_year",
+        method: str = "lttb",
+    ) -> DataFrame:
+        """Downsample the time series to the resolution of the plot."""
+        if self.max_points is None:
+            return data
+        return downsample(
+            data=data,
+            x=x,
+            y=y,
+            max_points=self.max_points,
+            by=by,
+            x_range=self.x_range,
+            method=method,
+        )
+
+    def _set_x_range(self, fig: Figure) -> Figure:
+        """Zoom the figure to the visible range of the plot, if any."""
+        if self.x_range is not None:
+            fig.update_xaxes(range=self.x_range)
+        return fig
 
     @abstractmethod
     def plot(self, save: bool = False) -> Optional[Figure]:
@@ -69,3 +184,49 @@ class PlotBase(ABC):
         Returns:
             Optional[Figure]: Figure containing the plot
         """
+
+
+def get_input_columns(components: Iterable[Any]) -> Optional[List[str]]:
+    """Get the union of the input columns of several plots or tables.
+
+    Args:
+        components (Iterable[Any]): Plot or table classes (or instances) declaring
+            `input_columns`
+
+    Returns:
+        Optional[List[str]]: Columns needed, or None if any of them needs all columns
+    """
+    columns = {}
+    for component in components:
+        if getattr(component, "input_columns", None) is None:
+            return None
+        columns.update(dict.fromkeys(component.input_columns))
+    return list(columns)
+
+
+def add_plot_keys(data: DataFrame) -> DataFrame:
+    """Add the callsign_year and dummy_datetime columns shared by the plots.
+
+    The columns are only computed if missing, so that data prepared once, e.g. by
+    the dashboard, is used by every plot as is, without copying it.
+
+    Args:
+        data (DataFrame): Processed logs, with mycall, year and hour columns, or
+            their aggregates, with mycall, year and minute columns
+
+    Returns:
+        DataFrame: Processed logs with the plot keys
+    """
+    keys = {
+        "callsign_year": lambda x: x["mycall"] + "(" + x["year"].astype(str) + ")",
+        "dummy_datetime": lambda x: to_datetime("2000-01-01")
+        + (
+            to_timedelta(x["minute"], "min")
+            if "minute" in x.columns
+            else to_timedelta(x["hour"], "h")
+        ),
+    }
+    missing = {k: v for k, v in keys.items() if k not in data.columns}
+    if not missing:
+        return data
+    return data.assign(**missing)
@@ -1,19 +1,68 @@
 """HamContestAnalysis plot base class."""
 from abc import ABC
 from abc import abstractmethod
+from datetime import date
+from logging import getLogger
+from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 from pandas import DataFrame
+from pandas import Grouper
 from pandas import concat
 from plotly.graph_objects import Figure
+from pyarrow.dataset import Expression
 
+from hamcontestanalysis.commons.pandas.general import hour_of_contest
+from hamcontestanalysis.commons.pandas.rbn import apply_skimmer_calibration
+from hamcontestanalysis.commons.pandas.selection import select_logs
+from hamcontestanalysis.commons.pandas.streaming import combine_partial_aggregates
+from hamcontestanalysis.commons.pandas.streaming import partial_aggregate
+from hamcontestanalysis.config import get_settings
+from hamcontestanalysis.data.processed_rbn_source import (
+    ProcessedReverseBeaconCalibrationDataSource,
+)
 from hamcontestanalysis.data.processed_rbn_source import (
     ProcessedReverseBeaconDataSource,
 )
 
 
+logger = getLogger(__name__)
+
+
+def load_rbn_data(contest: str, mode: str, years: List[int]) -> DataFrame:
+    """Load the downloaded RBN data of several years of a contest.
+
+    Each edition is loaded once, even if its year is given several times.
+
+    Args:
+        contest (str): Contest name
+        mode (str): Mode of the contest
+        years (List[int]): Years of the contest
+
+    Returns:
+        DataFrame: RBN data with year and contest columns
+    """
+    data = []
+    for year in sorted({int(y) for y in years}):
+        data_filtered = (
+            ProcessedReverseBeaconDataSource(
+                contest=contest,
+                year=year,
+                mode=mode,
+            )
+            .load()
+            .assign(year=year)
+            .assign(contest=contest)
+        )
+        data.append(data_filtered)
+    return concat(data, sort=False).reset_index(drop=True)
+
+
 class PlotReverseBeaconBase(ABC):
     """Plot RBN abstract base class.
 
@@ -22,12 +71,26 @@ class PlotReverseBeaconBase(ABC):
     way to create a plotly object, implemented by each plot subclass.
     """
 
-    def __init__(self, contest: str, mode: str, years: List[int]):
-        """Init method of the base class."""
+    def __init__(
+        self, contest: str, mode: str, years: List[int], out_of_core: bool = False
+    ):
+        """Init method of the base class.
+
+        Args:
+            contest (str): Contest name
+            mode (str): Mode of the contest
+            years (List[int]): Years of the contest
+            out_of_core (bool): Stream the RBN data of each year in batches instead
+                of loading it in memory, whenever the plot supports it. Defaults to
+                False.
+        """
         self.contest = contest
         self.mode = mode
         self.years = years
+        self.out_of_core = out_of_core
         self._data = None
+        self._calibration = None
+        self._edition_starts: Dict[int, date] = {}
 
     @property
     def data(self):
@@ -45,20 +108,153 @@ class PlotReverseBeaconBase(ABC):
 
     def _get_inputs(self) -> Dict[str, DataFrame]:
         """Get downloaded inputs needed for the plot."""
-        data = []
-        for year in self.years:
-            data_filtered = (
-                ProcessedReverseBeaconDataSource(
-                    contest=self.contest,
-                    year=year,
-                    mode=self.mode,
+        return load_rbn_data(contest=self.contest, mode=self.mode, years=self.years)
+
+    def _iter_inputs(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Expression] = None,
+    ) -> Iterator[DataFrame]:
+        """Iterate over the inputs of the plot, in chunks of a single year at most.
+
+        If the data is already in memory, it yields the data of each year. Otherwise,
+        if `out_of_core` is set, it streams the stored data in batches, reading only
+        the given columns and rows matching the filters. The start of the contest
+        edition of each year is computed once, before its chunks are yielded.
+
+        Args:
+            columns (Optional[List[str]]): Columns needed. Defaults to None.
+            filters (Optional[Expression]): Filter pushed down to the scan. It is
+                only an optimisation, it is not applied to data already in memory.
+                Defaults to None.
+
+        Yields:
+            DataFrame: Chunk of RBN data with year and contest columns
+        """
+        if self.out_of_core and not isinstance(self._data, DataFrame):
+            for year in sorted({int(y) for y in self.years}):
+                self._set_edition_start(year)
+                source = ProcessedReverseBeaconDataSource(
+                    contest=self.contest, year=year, mode=self.mode
                 )
-                .load()
-                .assign(year=int(year))
-                .assign(contest=self.contest)
+                for batch in source.iter_batches(columns=columns, filters=filters):
+                    yield batch.assign(year=year, contest=self.contest)
+        else:
+            for year, data_year in self.data.groupby("year", sort=False):
+                self._set_edition_start(int(year))
+                yield data_year
+
+    def _set_edition_start(self, year: int) -> None:
+        """Compute the Saturday of the contest edition of a year, if not done yet."""
+        if year not in self._edition_starts:
+            dates = getattr(
+                getattr(get_settings().contest, self.contest).modes, self.mode
+            ).get_dates(year)
+            self._edition_starts[year] = dates[0].date()
+
+    def _hour_of_contest(self, data: DataFrame) -> DataFrame:
+        """Add the hour of each spot since the start of its contest edition.
+
+        Args:
+            data (DataFrame): Chunk of RBN data of a single year, from `_iter_inputs`
+
+        Returns:
+            DataFrame: Chunk with the hour column
+        """
+        year = int(data["year"].iloc[0])
+        return hour_of_contest(data=data, start=self._edition_starts[year])
+
+    def _select_logs(
+        self, data: DataFrame, callsigns_years: List[Tuple[str, int]]
+    ) -> DataFrame:
+        """Select the spots of the callsigns of several logs, in the order given.
+
+        Args:
+            data (DataFrame): RBN data with the dx and year columns
+            callsigns_years (List[Tuple[str, int]]): Callsign and year of each log
+
+        Returns:
+            DataFrame: Spots of the callsigns in the years of their logs
+        """
+        return select_logs(data=data, callsigns_years=callsigns_years, callsign="dx")
+
+    def _aggregate(
+        self,
+        prepare: Callable[[DataFrame], DataFrame],
+        keys: List[Union[str, Grouper]],
+        aggregations: Dict[str, Tuple[str, str]],
+        columns: Optional[List[str]] = None,
+        filters: Optional[Expression] = None,
+    ) -> DataFrame:
+        """Prepare and aggregate the inputs chunk by chunk.
+
+        Each chunk is prepared and aggregated into partial results, which are then
+        combined. Hence, memory stays bounded by the size of a chunk and the number
+        of groups, regardless of the number of years considered.
+
+        Args:
+            prepare (Callable[[DataFrame], DataFrame]): Function filtering and
+                adding the group by keys to each chunk
+            keys (List[Union[str, Grouper]]): Group by keys
+            aggregations (Dict[str, Tuple[str, str]]): Named aggregations, with
+                functions count, sum, mean, min or max
+            columns (Optional[List[str]]): Columns needed when streaming. Defaults
+                to None.
+            filters (Optional[Expression]): Filter pushed down when streaming.
+                Defaults to None.
+
+        Returns:
+            DataFrame: Aggregated data
+        """
+        partials = (
+            partial_aggregate(data=prepare(chunk), keys=keys, aggregations=aggregations)
+            for chunk in self._iter_inputs(columns=columns, filters=filters)
+        )
+        return combine_partial_aggregates(
+            partials=partials, keys=keys, aggregations=aggregations
+        )
+
+    @property
+    def calibration(self) -> DataFrame:
+        """Skimmer SNR calibration of the contest editions considered.
+
+        Editions without a stored calibration are left out, so that their spots
+        keep the uncalibrated SNR.
+        """
+        if not isinstance(self._calibration, DataFrame):
+            calibrations = []
+            for year in sorted({int(y) for y in self.years}):
+                try:
+                    calibration = ProcessedReverseBeaconCalibrationDataSource(
+                        contest=self.contest, year=year, mode=self.mode
+                    ).load()
+                except FileNotFoundError:
+                    logger.warning(
+                        f"No RBN calibration for {self.contest} - {self.mode} - "
+                        f"{year}, its SNR is not calibrated. Run the "
+                        "`download rbn-calibration` command to compute it."
+                    )
+                    continue
+                calibrations.append(calibration.assign(year=year))
+            self._calibration = (
+                concat(calibrations, sort=False).reset_index(drop=True)
+                if calibrations
+                else DataFrame(columns=["callsign", "band", "offset", "year"])
             )
-            data.append(data_filtered)
-        return concat(data, sort=False).reset_index(drop=True)
+        return self._calibration
+
+    def _calibrate_snr(self, data: DataFrame) -> DataFrame:
+        """Correct the SNR of each spot with the offset of its skimmer.
+
+        Args:
+            data (DataFrame): RBN data with the callsign, band, year and db columns
+
+        Returns:
+            DataFrame: RBN data with calibrated db
+        """
+        if self.calibration.empty:
+            return data
+        return apply_skimmer_calibration(data=data, calibration=self.calibration)
 
     @abstractmethod
     def plot(self, save: bool = False) -> Optional[Figure]:
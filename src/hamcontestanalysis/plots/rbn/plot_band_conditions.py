@@ -4,11 +4,13 @@ from typing import List
 from typing import Optional
 
 from numpy import where
+from pandas import DataFrame
 from pandas import Grouper
 from plotly.express import line
 from plotly.graph_objects import Figure
 from plotly.offline import plot as po_plot
 from plotly.subplots import make_subplots
+from pyarrow.dataset import field
 
 from hamcontestanalysis.plots import PLOT_TEMPLATE
 from hamcontestanalysis.plots.plot_rbn_base import PlotReverseBeaconBase
@@ -26,6 +28,7 @@ class PlotBandConditions(PlotReverseBeaconBase):
         time_bin_size: int,
         reference: str,
         continents: List[str],
+        out_of_core: bool = False,
     ):
         """Init method of the PlotBandConditions class.
 
@@ -36,24 +39,28 @@ class PlotBandConditions(PlotReverseBeaconBase):
             time_bin_size (int, optional): Time bin size in minutes.
             reference (str): Reference continent
             continents (List[str]): Continents to display
+            out_of_core (bool): Stream the RBN data instead of loading it in
+                memory. Defaults to False.
         """
-        super().__init__(contest=contest, mode=mode, years=years)
+        super().__init__(
+            contest=contest, mode=mode, years=years, out_of_core=out_of_core
+        )
         self.time_bin_size = time_bin_size
         self.reference = reference
         self.continents = continents
 
-    def plot(self, save: bool = False) -> Optional[Figure]:
-        """Create plot.
+    def _prepare(self, data: DataFrame) -> DataFrame:
+        """Filter spots from or to the reference continent, and add the continent.
 
         Args:
-            save (bool): Save file in html. Defaults to False.
+            data (DataFrame): Chunk of RBN data
 
         Returns:
-            Optional[Figure]: Plotly figure
+            DataFrame: Chunk with the continent column
         """
         bands = list(BANDMAP.keys())
-        grp = (
-            self.data.query(
+        return (
+            data.query(
                 f"(dx_cont == '{self.reference}') | (de_cont == '{self.reference}')"
             )
             .query(f"band.isin({bands})")
@@ -63,24 +70,34 @@ class PlotBandConditions(PlotReverseBeaconBase):
                 )
             )
             .query(f"continent.isin({self.continents})")
-            .groupby(
-                [
-                    "continent",
-                    "band",
-                    "year",
-                    Grouper(key="datetime", freq=f"{self.time_bin_size}Min"),
-                ],
-                as_index=False,
-            )
-            .agg(numerator=("freq", "count"))
-            .assign(
-                denominator=lambda x: (
-                    x.groupby(["band", "continent", "year"])["numerator"].transform(
-                        "sum"
-                    )
-                ),
-                percent=lambda x: 100.0 * x["numerator"] / x["denominator"],
-            )
+        )
+
+    def plot(self, save: bool = False) -> Optional[Figure]:
+        """Create plot.
+
+        Args:
+            save (bool): Save file in html. Defaults to False.
+
+        Returns:
+            Optional[Figure]: Plotly figure
+        """
+        grp = self._aggregate(
+            prepare=self._prepare,
+            keys=[
+                "continent",
+                "band",
+                "year",
+                Grouper(key="datetime", freq=f"{self.time_bin_size}Min"),
+            ],
+            aggregations={"numerator": ("freq", "count")},
+            columns=["dx_cont", "de_cont", "band", "freq", "datetime"],
+            filters=(field("dx_cont") == self.reference)
+            | (field("de_cont") == self.reference),
+        ).assign(
+            denominator=lambda x: (
+                x.groupby(["band", "continent", "year"])["numerator"].transform("sum")
+            ),
+            percent=lambda x: 100.0 * x["numerator"] / x["denominator"],
         )
 
         fig = make_subplots(
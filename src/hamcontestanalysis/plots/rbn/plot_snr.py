@@ -4,15 +4,15 @@ from typing import List
 from typing import Optional
 from typing import Tuple
 
+from pandas import DataFrame
 from pandas import Grouper
-from pandas import concat
 from pandas import to_datetime
 from pandas import to_timedelta
 from plotly.express import scatter
 from plotly.graph_objects import Figure
 from plotly.offline import plot as po_plot
+from pyarrow.dataset import field
 
-from hamcontestanalysis.commons.pandas.general import hour_of_contest
 from hamcontestanalysis.plots import PLOT_TEMPLATE
 from hamcontestanalysis.plots.plot_rbn_base import PlotReverseBeaconBase
 from hamcontestanalysis.utils import BANDMAP
@@ -28,6 +28,8 @@ class PlotSnr(PlotReverseBeaconBase):
         callsigns_years: List[Tuple[str, int]],
         time_bin_size: int,
         rx_continents: List[str],
+        calibrated: bool = False,
+        out_of_core: bool = False,
     ):
         """Init method of the PlotBandConditions class.
 
@@ -37,51 +39,68 @@ class PlotSnr(PlotReverseBeaconBase):
             callsigns_years (List[Tuple[str, int]]): List of callsign-year tuples
             time_bin_size (int): Time bin size in minutes
             rx_continents (List[str]): Continents of the RX stations
+            calibrated (bool): Correct the SNR with the skimmer calibration of the
+                contest edition. Defaults to False.
+            out_of_core (bool): Stream the RBN data instead of loading it in
+                memory. Defaults to False.
         """
         super().__init__(
-            contest=contest, mode=mode, years=[y for (_, y) in callsigns_years]
+            contest=contest,
+            mode=mode,
+            years=[y for (_, y) in callsigns_years],
+            out_of_core=out_of_core,
         )
         self.callsigns_years = callsigns_years
         self.time_bin_size = time_bin_size
         self.rx_continents = rx_continents
+        self.calibrated = calibrated
 
-    def plot(self, save: bool = False) -> Optional[Figure]:
-        """Create plot.
+    def _prepare(self, data: DataFrame) -> DataFrame:
+        """Filter callsigns and years, and add the group by keys.
 
         Args:
-            save (bool): Save file in html. Defaults to False.
+            data (DataFrame): Chunk of RBN data
 
         Returns:
-            Optional[Figure]: Plotly figure
+            DataFrame: Chunk with callsign_year and dummy_datetime columns
         """
         # Filter callsigns and years
-        _data = []
-        for callsign, year in self.callsigns_years:
-            _data.append(self.data.query(f"(dx == '{callsign}') & (year == {year})"))
-        _data = concat(_data)
+        _data = self._select_logs(data, callsigns_years=self.callsigns_years).query(
+            f"(de_cont.isin({self.rx_continents}))"
+        )
+        if _data.empty:
+            return _data
+        if self.calibrated:
+            _data = self._calibrate_snr(data=_data)
 
         # Dummy datetime to compare
-        _data = _data.pipe(
-            func=hour_of_contest,
+        return _data.pipe(
+            func=self._hour_of_contest,
         ).assign(
             dummy_datetime=lambda x: to_datetime("2000-01-01")
             + to_timedelta(x["hour"], "H"),
             callsign_year=lambda x: x["dx"] + "(" + x["year"].astype(str) + ")",
         )
 
-        # Groupby
-        _data = (
-            _data.reset_index(drop=True)
-            .query(f"(de_cont.isin({self.rx_continents}))")
-            .groupby(
-                [
-                    "callsign_year",
-                    "band",
-                    Grouper(key="dummy_datetime", freq=f"{self.time_bin_size}Min"),
-                ],
-                as_index=False,
-            )
-            .agg(db=("db", "mean"))
+    def plot(self, save: bool = False) -> Optional[Figure]:
+        """Create plot.
+
+        Args:
+            save (bool): Save file in html. Defaults to False.
+
+        Returns:
+            Optional[Figure]: Plotly figure
+        """
+        _data = self._aggregate(
+            prepare=self._prepare,
+            keys=[
+                "callsign_year",
+                "band",
+                Grouper(key="dummy_datetime", freq=f"{self.time_bin_size}Min"),
+            ],
+            aggregations={"db": ("db", "mean")},
+            columns=["callsign", "dx", "band", "db", "de_cont", "datetime"],
+            filters=field("dx").isin([c for (c, _) in self.callsigns_years]),
         )
 
         fig = scatter(
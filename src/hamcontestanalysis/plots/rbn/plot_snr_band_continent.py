@@ -32,6 +32,7 @@ class PlotSnrBandContinent(PlotReverseBeaconBase):
         year: int,
         time_bin_size: int,
         rx_continents: List[str],
+        calibrated: bool = False,
     ):
         """Init method of the PlotBandConditions class.
 
@@ -43,6 +44,9 @@ class PlotSnrBandContinent(PlotReverseBeaconBase):
             year (int): Year of the contest
             time_bin_size (int): Time bin size in minutes
             rx_continents (List[str]): Continents of the RX stations
+            calibrated (bool): Correct the SNR with the skimmer calibration of the
+                contest edition instead of restricting to a closed list of
+                spotters. Defaults to False.
         """
         super().__init__(contest=contest, mode=mode, years=[year])
         self.callsigns = [c.upper() for c in callsigns]
@@ -52,7 +56,8 @@ class PlotSnrBandContinent(PlotReverseBeaconBase):
         self.smoothing = 2
         self.min_rx_spots_per_hour = 2
         self.filter_str = None
-        self.closed_list_spotters = True
+        self.calibrated = calibrated
+        self.closed_list_spotters = not calibrated
 
     def _clean_dataset(self):
         _df = self.data.copy().assign(
@@ -70,6 +75,9 @@ class PlotSnrBandContinent(PlotReverseBeaconBase):
             .query(f"de_cont.isin({self.rx_continents})")
             .assign(freq=lambda x: np.round(x["freq"]).astype(int))
         )
+        if self.calibrated:
+            logger.info("Apply skimmer SNR calibration")
+            df_grp = self._calibrate_snr(data=df_grp)
 
         # Make sure that everyone is spotted by the same list of RX through the
         # whole contest.
@@ -1,12 +1,34 @@
 """Dash table containing the log of the contest."""
+from typing import ClassVar
+from typing import List
+
 from pandas import DataFrame
 
+from hamcontestanalysis.commons.pandas.rolling import add_rolling_rates
 from hamcontestanalysis.tables.table_base import TableBase
 
 
 class TableContestLog(TableBase):
     """Table containing the contest log."""
 
+    input_columns: ClassVar[List[str]] = [
+        "datetime",
+        "frequency",
+        "band",
+        "mode",
+        "call",
+        "zone",
+        "country",
+        "mycall",
+        "year",
+        "is_zone",
+        "is_dxcc",
+        "is_valid",
+    ]
+
+    # Windows of the rolling rates of valid QSOs, in minutes
+    rate_windows: ClassVar[List[int]] = [10, 30, 60]
+
     def __init__(self):
         """Init method."""
         columns = [
@@ -25,8 +47,8 @@ class TableContestLog(TableBase):
             {"name": "QSOs last 30 min", "id": "rate_30", "type": "numeric"},
             {"name": "QSOs last 60 min", "id": "rate_60", "type": "numeric"},
         ]
-        filter_action = "native"
-        sort_action = "native"
+        filter_action = "custom"
+        sort_action = "custom"
         style_table = {"height": "300px", "overflowY": "auto"}
         style_data = {
             "width": "150px",
@@ -44,28 +66,7 @@ class TableContestLog(TableBase):
         )
 
     def _filter_data(self) -> DataFrame:
-        self.data = (
-            self.data.copy()
-            .join(
-                self.data.set_index("datetime")
-                .groupby(["mycall", "year"])[["is_valid"]]
-                .transform(lambda d: d.rolling("10T", min_periods=1).sum())
-                .reset_index(drop=True)
-                .rename(columns={"is_valid": "rate_10"})
-            )
-            .join(
-                self.data.set_index("datetime")
-                .groupby(["mycall", "year"])[["is_valid"]]
-                .transform(lambda d: d.rolling("30T", min_periods=1).sum())
-                .reset_index(drop=True)
-                .rename(columns={"is_valid": "rate_30"})
-            )
-            .join(
-                self.data.set_index("datetime")
-                .groupby(["mycall", "year"])[["is_valid"]]
-                .transform(lambda d: d.rolling("60T", min_periods=1).sum())
-                .reset_index(drop=True)
-                .rename(columns={"is_valid": "rate_60"})
-            )
+        self.data = add_rolling_rates(
+            self.data, windows=self.rate_windows, column="is_valid"
         )
         return super()._filter_data()
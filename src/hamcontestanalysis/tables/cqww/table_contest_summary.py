@@ -1,7 +1,12 @@
 """Dash table containing the summary of the CQ WW contest."""
+from typing import ClassVar
+from typing import List
+
 from pandas import DataFrame
 from pandas import concat
 
+from hamcontestanalysis.commons.pandas.aggregates import minute_aggregates
+from hamcontestanalysis.commons.pandas.rolling import peak_rates
 from hamcontestanalysis.tables.table_base import TableBase
 from hamcontestanalysis.utils import BANDMAP
 
@@ -9,6 +14,18 @@ from hamcontestanalysis.utils import BANDMAP
 class TableContestSummary(TableBase):
     """Table containing the contest summary."""
 
+    input_columns: ClassVar[List[str]] = [
+        "year",
+        "mycall",
+        "band",
+        "is_valid",
+        "is_zone",
+        "is_dxcc",
+        "qso_points",
+        "hour",
+    ]
+    uses_aggregates: ClassVar[bool] = True
+
     def __init__(self):
         """Init method."""
         columns = [
@@ -16,6 +33,7 @@ class TableContestSummary(TableBase):
             {"name": "My Call", "id": "mycall", "type": "text"},
             {"name": "Band", "id": "band", "type": "numeric"},
             {"name": "QSOs", "id": "qsos", "type": "numeric"},
+            {"name": "Best 60 min", "id": "peak_60", "type": "numeric"},
             {"name": "CQ Zone", "id": "zones", "type": "numeric"},
             {"name": "DXCC", "id": "dxcc", "type": "numeric"},
             {"name": "QSO points", "id": "qso_points", "type": "numeric"},
@@ -40,14 +58,23 @@ class TableContestSummary(TableBase):
         )
 
     def _filter_data(self) -> DataFrame:
+        if "minute" not in self.data.columns:
+            self.data = minute_aggregates(self.data)
+        # Best rates of valid QSOs, of each log and of each of its bands
+        peaks = [
+            peak_rates(self.data, windows=[60], column="is_valid", by=by, time="minute")
+            for by in (["year", "mycall", "band"], ["year", "mycall"])
+        ]
         self.data = concat(
             [
-                self.data.groupby(["year", "mycall", "band"], as_index=False).agg(
+                self.data.groupby(["year", "mycall", "band"], as_index=False)
+                .agg(
                     qsos=("is_valid", "sum"),
                     zones=("is_zone", "sum"),
                     dxcc=("is_dxcc", "sum"),
                     qso_points=("qso_points", "sum"),
-                ),
+                )
+                .merge(peaks[0], how="left", on=["year", "mycall", "band"]),
                 self.data.groupby(["year", "mycall"], as_index=False)
                 .agg(
                     qsos=("is_valid", "sum"),
@@ -55,6 +82,7 @@ class TableContestSummary(TableBase):
                     dxcc=("is_dxcc", "sum"),
                     qso_points=("qso_points", "sum"),
                 )
+                .merge(peaks[1], how="left", on=["year", "mycall"])
                 .assign(score=lambda x: x["qso_points"] * (x["zones"] + x["dxcc"])),
             ]
         ).query(f"(band.isin({list(BANDMAP.keys())}) | (band.isnull()))")
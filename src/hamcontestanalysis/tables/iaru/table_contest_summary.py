@@ -1,7 +1,12 @@
 """Dash table containing the summary of the IARU HF contest."""
+from typing import ClassVar
+from typing import List
+
 from pandas import DataFrame
 from pandas import concat
 
+from hamcontestanalysis.commons.pandas.aggregates import minute_aggregates
+from hamcontestanalysis.commons.pandas.rolling import peak_rates
 from hamcontestanalysis.tables.table_base import TableBase
 from hamcontestanalysis.utils import BANDMAP
 
@@ -9,6 +14,17 @@ from hamcontestanalysis.utils import BANDMAP
 class TableContestSummary(TableBase):
     """Table containing the contest summary."""
 
+    input_columns: ClassVar[List[str]] = [
+        "year",
+        "mycall",
+        "band",
+        "is_valid",
+        "is_mult",
+        "qso_points",
+        "hour",
+    ]
+    uses_aggregates: ClassVar[bool] = True
+
     def __init__(self):
         """Init method."""
         columns = [
@@ -16,6 +32,7 @@ class TableContestSummary(TableBase):
             {"name": "My Call", "id": "mycall", "type": "text"},
             {"name": "Band", "id": "band", "type": "numeric"},
             {"name": "QSOs", "id": "qsos", "type": "numeric"},
+            {"name": "Best 60 min", "id": "peak_60", "type": "numeric"},
             {"name": "Multipliers", "id": "is_mult", "type": "numeric"},
             {"name": "QSO points", "id": "qso_points", "type": "numeric"},
             {"name": "Contest score", "id": "score", "type": "numeric"},
@@ -39,19 +56,29 @@ class TableContestSummary(TableBase):
         )
 
     def _filter_data(self) -> DataFrame:
+        if "minute" not in self.data.columns:
+            self.data = minute_aggregates(self.data)
+        # Best rates of valid QSOs, of each log and of each of its bands
+        peaks = [
+            peak_rates(self.data, windows=[60], column="is_valid", by=by, time="minute")
+            for by in (["year", "mycall", "band"], ["year", "mycall"])
+        ]
         self.data = concat(
             [
-                self.data.groupby(["year", "mycall", "band"], as_index=False).agg(
+                self.data.groupby(["year", "mycall", "band"], as_index=False)
+                .agg(
                     qsos=("is_valid", "sum"),
                     is_mult=("is_mult", "sum"),
                     qso_points=("qso_points", "sum"),
-                ),
+                )
+                .merge(peaks[0], how="left", on=["year", "mycall", "band"]),
                 self.data.groupby(["year", "mycall"], as_index=False)
                 .agg(
                     qsos=("is_valid", "sum"),
                     is_mult=("is_mult", "sum"),
                     qso_points=("qso_points", "sum"),
                 )
+                .merge(peaks[1], how="left", on=["year", "mycall"])
                 .assign(score=lambda x: x["qso_points"] * x["is_mult"]),
             ]
         ).query(f"(band.isin({list(BANDMAP.keys())}) | (band.isnull()))")
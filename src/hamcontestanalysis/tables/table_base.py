@@ -1,6 +1,7 @@
 """Base class for tables in the dashboards."""
 
 from typing import Any
+from typing import ClassVar
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -8,6 +9,8 @@ from typing import Optional
 from dash.dash_table import DataTable
 from pandas import DataFrame
 
+from hamcontestanalysis.tables.table_view import TableView
+
 
 class TableBase:
     """Table base class.
@@ -15,8 +18,18 @@ class TableBase:
     This class serves as a base interface for the different tables,
     It mainly defines the `TableBase.show` method as the
     way to create a plotly object, implemented by each table subclass.
+
+    Each subclass declares in `input_columns` the columns of the processed log that
+    it needs, so that only those are read from storage. None reads all columns.
+
+    Tables only summing QSOs by log and band set `uses_aggregates`, and their data
+    can be the per-minute aggregates of the logs instead of their QSOs, see
+    `hamcontestanalysis.commons.pandas.aggregates`.
     """
 
+    input_columns: ClassVar[Optional[List[str]]] = None
+    uses_aggregates: ClassVar[bool] = False
+
     def __init__(
         self,
         columns: List[Dict[str, str]],
@@ -106,22 +119,59 @@ class TableBase:
         _data = self.data.loc[:, column_names]
         return _data
 
-    def show(self, page_size: int = 250) -> Optional[DataTable]:
+    @property
+    def server_side(self) -> bool:
+        """Whether the table is paged, sorted and filtered on the server."""
+        return self.filter_action == "custom" or self.sort_action == "custom"
+
+    def view(self) -> TableView:
+        """Data of the table kept on the server, to serve its pages.
+
+        Returns:
+            TableView: View of the table data
+        """
+        return TableView(data=self._filter_data())
+
+    def show(
+        self,
+        page_size: int = 250,
+        table_id: Optional[str] = None,
+        view: Optional[TableView] = None,
+    ) -> Optional[DataTable]:
         """Create table.
 
+        Tables with custom actions only receive their first page, the next ones are
+        served by a callback of the dashboard from `TableView.page`.
+
         Args:
             page_size (int): number of rows to display. Defaults to 250.
+            table_id (Optional[str]): Identifier of the table, to page it from a
+                callback. Defaults to None.
+            view (Optional[TableView]): View of the table data, for tables with
+                custom actions. Defaults to None to create it.
 
         Returns:
             Optional[DataTable]: DataTable containing the table
         """
-        _data = self._filter_data()
+        kwargs = {} if table_id is None else {"id": table_id}
+        if self.server_side:
+            view = view or self.view()
+            records, page_count = view.page(page_current=0, page_size=page_size)
+            kwargs.update(
+                page_action="custom",
+                page_current=0,
+                page_count=page_count,
+                sort_mode="multi",
+            )
+        else:
+            records = self._filter_data().to_dict("records")
         return DataTable(
             columns=self.columns,
-            data=_data.to_dict("records"),
+            data=records,
             filter_action=self.filter_action,
             sort_action=self.sort_action,
             style_table=self.style_table,
             style_data=self.style_data,
             page_size=page_size,
+            **kwargs,
         )
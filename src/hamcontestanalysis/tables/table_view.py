@@ -0,0 +1,209 @@
+"""Server-side paging, sorting and filtering of the dashboard tables.
+
+Tables with custom actions keep their data on the server. The browser only receives
+the page being displayed, and sends back the page, sort and filter requested, which
+are applied here: filter expressions of the DataTable are translated into vectorized
+masks, and the sort order of each column is computed once and reused.
+"""
+import re
+import threading
+from logging import getLogger
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+from pandas import DataFrame
+from pandas import Series
+from pandas.api.types import is_datetime64_any_dtype
+from pandas.api.types import is_numeric_dtype
+
+
+logger = getLogger(__name__)
+
+# Filter operators of the DataTable, and their aliases
+OPERATORS = {
+    "=": "eq",
+    "eq": "eq",
+    "!=": "ne",
+    "ne": "ne",
+    "<": "lt",
+    "lt": "lt",
+    "<=": "le",
+    "le": "le",
+    ">": "gt",
+    "gt": "gt",
+    ">=": "ge",
+    "ge": "ge",
+    "contains": "contains",
+    "icontains": "icontains",
+    "scontains": "contains",
+    "datestartswith": "datestartswith",
+}
+
+_FILTER_TERM = re.compile(
+    r"\{(?P<column>[^}]+)\}\s*(?P<operator>!=|<=|>=|=|<|>|[a-z]+)\s*(?P<value>.*)"
+)
+
+
+def parse_filter_query(filter_query: Optional[str]) -> List[Tuple[str, str, str]]:
+    """Parse the filter query of a DataTable.
+
+    Args:
+        filter_query (Optional[str]): Filter query, e.g.
+            `{call} contains "EA" && {frequency} >= 14000`
+
+    Returns:
+        List[Tuple[str, str, str]]: Column, operator and value of each term. Terms
+            with unknown operators are ignored.
+    """
+    terms = []
+    for term in (filter_query or "").split(" && "):
+        match = _FILTER_TERM.fullmatch(term.strip())
+        if match is None:
+            continue
+        operator = OPERATORS.get(match["operator"].lower())
+        if operator is None:
+            logger.warning(f"Ignore filter term with unknown operator: {term}")
+            continue
+        value = match["value"].strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'`":
+            value = value[1:-1]
+        terms.append((match["column"], operator, value))
+    return terms
+
+
+def _compare(values: Any, operator: str, value: Any) -> np.ndarray:
+    """Mask of the values matching a comparison."""
+    if operator == "eq":
+        return values == value
+    if operator == "ne":
+        return values != value
+    if operator == "lt":
+        return values < value
+    if operator == "le":
+        return values <= value
+    if operator == "gt":
+        return values > value
+    return values >= value
+
+
+class TableView:
+    """Data of a table kept on the server, serving pages of it."""
+
+    def __init__(self, data: DataFrame):
+        """Table view constructor.
+
+        Args:
+            data (DataFrame): Data of the table
+        """
+        self.data = data.reset_index(drop=True)
+        self._orders: Dict[Tuple[str, bool], np.ndarray] = {}
+        self._strings: Dict[str, Series] = {}
+        self._lock = threading.Lock()
+
+    def _order(self, column: str, ascending: bool) -> np.ndarray:
+        """Row positions stably sorted by a column, with nulls last, computed once."""
+        with self._lock:
+            if (column, ascending) not in self._orders:
+                self._orders[(column, ascending)] = (
+                    self.data[column]
+                    .sort_values(ascending=ascending, kind="stable", na_position="last")
+                    .index.to_numpy()
+                )
+            return self._orders[(column, ascending)]
+
+    def _string(self, column: str) -> Series:
+        """Values of a column as strings, computed once."""
+        with self._lock:
+            if column not in self._strings:
+                values = self.data[column]
+                if is_datetime64_any_dtype(values):
+                    self._strings[column] = values.dt.strftime("%Y-%m-%d %H:%M:%S")
+                else:
+                    self._strings[column] = values.astype(str)
+            return self._strings[column]
+
+    def filter_mask(self, filter_query: Optional[str]) -> np.ndarray:
+        """Mask of the rows matching the filter query of the DataTable.
+
+        Args:
+            filter_query (Optional[str]): Filter query
+
+        Returns:
+            np.ndarray: Mask of the rows matching all the terms
+        """
+        mask = np.ones(len(self.data), dtype=bool)
+        for column, operator, value in parse_filter_query(filter_query):
+            if column not in self.data.columns:
+                continue
+            values = self.data[column]
+            if operator in ("contains", "icontains", "datestartswith"):
+                strings = self._string(column)
+                if operator == "datestartswith":
+                    term = strings.str.startswith(value)
+                else:
+                    term = strings.str.contains(
+                        value, case=operator == "contains", regex=False
+                    )
+            elif is_numeric_dtype(values):
+                try:
+                    term = _compare(values, operator, float(value))
+                except ValueError:
+                    term = np.zeros(len(self.data), dtype=bool)
+            elif is_datetime64_any_dtype(values):
+                term = _compare(self._string(column), operator, value)
+            else:
+                term = _compare(values.astype(str), operator, value)
+            mask &= np.asarray(term, dtype=bool)
+        return mask
+
+    def page(
+        self,
+        page_current: int,
+        page_size: int,
+        sort_by: Optional[List[Dict[str, str]]] = None,
+        filter_query: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Page of the filtered and sorted rows.
+
+        Args:
+            page_current (int): Page requested, from 0
+            page_size (int): Rows per page
+            sort_by (Optional[List[Dict[str, str]]]): Sort of the DataTable, with the
+                column_id and direction (asc or desc) of each column. Defaults to
+                None.
+            filter_query (Optional[str]): Filter query of the DataTable. Defaults
+                to None.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: Records of the page and number of pages
+        """
+        mask = self.filter_mask(filter_query=filter_query)
+        sort_by = [s for s in sort_by or [] if s["column_id"] in self.data.columns]
+        if len(sort_by) == 1:
+            order = self._order(
+                column=sort_by[0]["column_id"],
+                ascending=sort_by[0]["direction"] == "asc",
+            )
+            positions = order[mask[order]]
+        else:
+            positions = np.flatnonzero(mask)
+            if sort_by:
+                positions = (
+                    self.data.iloc[positions]
+                    .sort_values(
+                        [s["column_id"] for s in sort_by],
+                        ascending=[s["direction"] == "asc" for s in sort_by],
+                        kind="stable",
+                    )
+                    .index.to_numpy()
+                )
+        page_count = max(-(-len(positions) // page_size), 1)
+        start = page_current * page_size
+        records = self.data.iloc[positions[start : start + page_size]].to_dict(
+            "records"
+        )
+        return records, page_count
@@ -13,7 +13,7 @@ def fixture_runner(caplog: LogCaptureFixture):
     caplog.clear()
 
 
-@fixture(name="command", params=["download"])
+@fixture(name="command", params=["download", "report"])
 def fixture_command(request: FixtureRequest) -> str:
     return request.param
 
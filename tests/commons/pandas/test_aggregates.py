@@ -0,0 +1,55 @@
+"""Test per-minute aggregates of the contest logs."""
+import numpy as np
+import pytest
+from pandas import read_parquet
+from pandas.testing import assert_frame_equal
+
+from hamcontestanalysis.commons.pandas.aggregates import contest_minute
+from hamcontestanalysis.commons.pandas.aggregates import minute_aggregates
+from hamcontestanalysis.commons.pandas.aggregates import rollup
+
+
+@pytest.fixture
+def input_data():
+    return read_parquet(
+        "tests/resources/plots/common/plot_base__get_inputs__ef6t_2022_cr6k_2022.parquet"
+    )
+
+
+def test_contest_minute():
+    hours = np.array([0.0, 1 / 60, 2 / 60, 59 / 60, 1.0, 47 + 59 / 60])
+    assert contest_minute(hours).tolist() == [0, 1, 2, 59, 60, 2879]
+
+
+def test_minute_aggregates(input_data):
+    aggregates = minute_aggregates(input_data)
+    assert aggregates["qsos"].sum() == len(input_data)
+    assert aggregates["is_valid"].sum() == input_data["is_valid"].sum()
+    assert len(aggregates) < len(input_data)
+    assert not aggregates.duplicated(
+        ["mycall", "year", "minute", "band", "continent"]
+    ).any()
+
+
+def test_rollup(input_data):
+    aggregates = minute_aggregates(input_data)
+    hour = input_data.assign(minute=lambda x: contest_minute(x["hour"]) // 60 * 60)
+    expected = hour.groupby(["mycall", "minute"], as_index=False).agg(
+        qsos=("hour", "size"),
+        qso_points=("qso_points", "sum"),
+        cum_contest_score=("cum_contest_score", "last"),
+        diff_contest_score=("diff_contest_score", "mean"),
+    )
+    assert_frame_equal(
+        rollup(aggregates, by=["mycall"], time_bin_size=60).loc[:, expected.columns],
+        expected,
+        check_dtype=False,
+    )
+    assert_frame_equal(
+        rollup(
+            rollup(aggregates, by=["mycall", "band"], time_bin_size=5), ["mycall"]
+        ).loc[:, ["mycall", "qsos", "cum_contest_score"]],
+        rollup(aggregates, by=["mycall"]).loc[
+            :, ["mycall", "qsos", "cum_contest_score"]
+        ],
+    )
@@ -0,0 +1,69 @@
+"""Test downsampling of time series."""
+import numpy as np
+import pytest
+from pandas import DataFrame
+from pandas import Timestamp
+from pandas import date_range
+
+from hamcontestanalysis.commons.pandas.downsampling import downsample
+from hamcontestanalysis.commons.pandas.downsampling import lttb_indices
+from hamcontestanalysis.commons.pandas.downsampling import minmax_indices
+
+
+@pytest.fixture
+def series():
+    x = np.arange(1000, dtype=float)
+    y = np.sin(x / 50)
+    y[500] = 10.0
+    return x, y
+
+
+def test_lttb_indices(series):
+    x, y = series
+    indices = lttb_indices(x=x, y=y, n_out=100)
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 999
+    assert (np.diff(indices) > 0).all()
+    assert 500 in indices
+    assert (lttb_indices(x=x, y=y, n_out=2000) == np.arange(1000)).all()
+
+
+def test_minmax_indices(series):
+    x, y = series
+    indices = minmax_indices(x=x, y=y, n_out=100)
+    assert len(indices) <= 100
+    assert 500 in indices
+    assert np.argmin(y) in indices
+
+
+def test_downsample():
+    data = DataFrame(
+        {
+            "dummy_datetime": list(date_range("2000-01-01", periods=2880, freq="min"))
+            * 3,
+            "qsos": np.random.default_rng(0).poisson(2, size=3 * 2880),
+            "callsign_year": np.repeat(
+                ["EF6T(2022)", "CN3A(2022)", "EA3A(2021)"], 2880
+            ),
+        }
+    )
+    sampled = downsample(
+        data=data, x="dummy_datetime", y="qsos", max_points=300, by="callsign_year"
+    )
+    assert len(sampled) == 300
+    assert (sampled.groupby("callsign_year").size() == 100).all()
+
+    x_range = ["2000-01-01 10:00:00", "2000-01-01 11:00:00"]
+    zoomed = downsample(
+        data=data,
+        x="dummy_datetime",
+        y="qsos",
+        max_points=3000,
+        by="callsign_year",
+        x_range=x_range,
+    )
+    assert len(zoomed) == 3 * 63
+    assert zoomed["dummy_datetime"].min() == Timestamp("2000-01-01 09:59:00")
+
+    with pytest.raises(ValueError):
+        downsample(data=data, x="dummy_datetime", y="qsos", max_points=10, method="x")
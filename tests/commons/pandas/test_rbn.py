@@ -0,0 +1,49 @@
+"""Test RBN processing functions."""
+import pytest
+from pandas import DataFrame
+from pandas import date_range
+
+from hamcontestanalysis.commons.pandas.rbn import apply_skimmer_calibration
+from hamcontestanalysis.commons.pandas.rbn import compute_skimmer_calibration
+
+
+@pytest.fixture
+def rbn_data():
+    offsets = {"EA3A": 3.0, "DL1B": 0.0, "G4C": -2.0, "OH2D": 0.0}
+    rows = []
+    for i, dt in enumerate(date_range("2022-11-26", periods=12, freq="10Min")):
+        for callsign, offset in offsets.items():
+            rows.append(
+                {
+                    "callsign": callsign,
+                    "dx": "EF6T",
+                    "band": 20,
+                    "db": 20.0 + i % 3 + offset,
+                    "datetime": dt,
+                }
+            )
+    return DataFrame(rows)
+
+
+def test_compute_skimmer_calibration(rbn_data):
+    calibration = compute_skimmer_calibration(data=rbn_data).set_index("callsign")
+    assert calibration.loc["EA3A", "offset"] == pytest.approx(3.0)
+    assert calibration.loc["G4C", "offset"] == pytest.approx(-2.0)
+    assert calibration.loc["DL1B", "offset"] == pytest.approx(0.0)
+    assert (calibration["n_spots"] == 12).all()
+
+
+def test_compute_skimmer_calibration_min_skimmers(rbn_data):
+    calibration = compute_skimmer_calibration(data=rbn_data, min_skimmers=5)
+    assert calibration.empty
+
+
+def test_apply_skimmer_calibration(rbn_data):
+    calibration = compute_skimmer_calibration(data=rbn_data)
+    calibrated = apply_skimmer_calibration(
+        data=rbn_data.assign(callsign=rbn_data["callsign"].replace("OH2D", "K1E")),
+        calibration=calibration.query("callsign != 'OH2D'"),
+    )
+    assert len(calibrated) == len(rbn_data)
+    spread = calibrated.groupby("datetime")["db"].agg(lambda x: x.max() - x.min())
+    assert spread.abs().max() == pytest.approx(0.0)
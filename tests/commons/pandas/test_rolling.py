@@ -0,0 +1,49 @@
+"""Test rolling QSO rates."""
+import numpy as np
+import pytest
+from pandas import read_parquet
+
+from hamcontestanalysis.commons.pandas.aggregates import minute_aggregates
+from hamcontestanalysis.commons.pandas.rolling import add_rolling_rates
+from hamcontestanalysis.commons.pandas.rolling import peak_rates
+from hamcontestanalysis.commons.pandas.rolling import rolling_sums
+
+
+@pytest.fixture
+def input_data():
+    return read_parquet(
+        "tests/resources/plots/common/plot_base__get_inputs__ef6t_2022_cr6k_2022.parquet"
+    ).reset_index(drop=True)
+
+
+def test_rolling_sums():
+    times = np.array([0, 1, 1, 5, 10, 11])
+    sums = rolling_sums(times=times, windows=[1, 5])
+    assert sums.tolist() == [[1, 1, 2, 1, 1, 1], [1, 2, 3, 3, 1, 2]]
+    values = np.array([1, 0, 1, np.nan, 1, 1])
+    sums = rolling_sums(times=times, windows=[10], values=values)
+    assert sums.tolist() == [[1, 1, 2, 2, 2, 2]]
+
+
+def test_add_rolling_rates(input_data):
+    data = add_rolling_rates(input_data, windows=[10, 60], column="is_valid")
+    for window in [10, 60]:
+        expected = (
+            input_data.set_index("datetime")
+            .groupby(["mycall", "year"])["is_valid"]
+            .transform(lambda d, w=window: d.rolling(f"{w}min", min_periods=1).sum())
+        )
+        assert np.allclose(data[f"rate_{window}"], expected)
+    assert add_rolling_rates(data, windows=[10], column="is_valid") is data
+
+
+def test_peak_rates(input_data):
+    peaks = peak_rates(input_data, windows=[10, 60])
+    assert peaks.columns.tolist() == ["mycall", "year", "peak_10", "peak_60"]
+    assert (peaks["peak_10"] <= peaks["peak_60"]).all()
+    from_aggregates = peak_rates(
+        minute_aggregates(input_data), windows=[10, 60], column="qsos", time="minute"
+    )
+    assert np.allclose(
+        peaks[["peak_10", "peak_60"]], from_aggregates[["peak_10", "peak_60"]]
+    )
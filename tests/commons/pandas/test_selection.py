@@ -0,0 +1,32 @@
+"""Test selection of several logs."""
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from hamcontestanalysis.commons.pandas.selection import get_log_index
+from hamcontestanalysis.commons.pandas.selection import select_logs
+
+
+def test_select_logs():
+    data = DataFrame(
+        {
+            "mycall": ["EF6T", "EA/DL1AB", "EF6T", "CN3A", "EA/DL1AB", "O'NEIL"],
+            "year": [2022, 2022, 2021, 2022, 2022, 2022],
+            "call": ["A", "B", "C", "D", "E", "F"],
+        },
+        index=[10, 11, 12, 13, 14, 15],
+    )
+    selected = select_logs(
+        data=data,
+        callsigns_years=[("EA/DL1AB", 2022), ("O'NEIL", "2022"), ("EF6T", 2020)],
+    )
+    assert_frame_equal(selected, data.loc[[11, 14, 15]])
+    assert select_logs(data=data, callsigns_years=[]).empty
+    assert get_log_index(data=data) is get_log_index(data=data)
+
+
+def test_select_logs_other_callsign_column():
+    data = DataFrame({"dx": ["EF6T", "CN3A", "EF6T"], "year": [2022, 2022, 2021]})
+    selected = select_logs(
+        data=data, callsigns_years=[("EF6T", 2021), ("CN3A", 2022)], callsign="dx"
+    )
+    assert selected.index.tolist() == [2, 1]
@@ -0,0 +1,60 @@
+"""Test partial aggregations."""
+import pytest
+from pandas import DataFrame
+
+from hamcontestanalysis.commons.pandas.streaming import combine_partial_aggregates
+from hamcontestanalysis.commons.pandas.streaming import partial_aggregate
+
+
+AGGREGATIONS = {"mean": ("value", "mean"), "counts": ("value", "count")}
+
+
+@pytest.fixture
+def data():
+    return DataFrame(
+        {"key": ["a", "a", "b", "a", "b", "b"], "value": [1.0, 2.0, 3.0, 6.0, 5.0, 4.0]}
+    )
+
+
+def test_combine_partial_aggregates(data):
+    partials = [
+        partial_aggregate(data=chunk, keys=["key"], aggregations=AGGREGATIONS)
+        for chunk in [data.iloc[:2], data.iloc[2:5], data.iloc[5:]]
+    ]
+    result = combine_partial_aggregates(
+        partials=partials, keys=["key"], aggregations=AGGREGATIONS
+    )
+    expected = data.groupby("key", as_index=False).agg(**AGGREGATIONS)
+    assert result.equals(expected)
+
+
+def test_combine_partial_aggregates_generator(data):
+    partials = (
+        partial_aggregate(
+            data=data.iloc[i : i + 1], keys=["key"], aggregations=AGGREGATIONS
+        )
+        for i in range(len(data))
+    )
+    result = combine_partial_aggregates(
+        partials=partials, keys=["key"], aggregations=AGGREGATIONS
+    )
+    expected = data.groupby("key", as_index=False).agg(**AGGREGATIONS)
+    assert result.equals(expected)
+
+
+def test_combine_partial_aggregates_empty(data):
+    partials = [
+        partial_aggregate(data=data.iloc[:0], keys=["key"], aggregations=AGGREGATIONS)
+    ]
+    result = combine_partial_aggregates(
+        partials=partials, keys=["key"], aggregations=AGGREGATIONS
+    )
+    assert result.empty
+    assert list(result.columns) == ["key", "mean", "counts"]
+
+
+def test_partial_aggregate_unsupported(data):
+    with pytest.raises(ValueError):
+        partial_aggregate(
+            data=data, keys=["key"], aggregations={"m": ("value", "median")}
+        )
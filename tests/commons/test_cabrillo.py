@@ -0,0 +1,37 @@
+"""Test Cabrillo header parsing."""
+from hamcontestanalysis.commons.cabrillo import parse_cabrillo_header
+
+
+def test_parse_cabrillo_header():
+    metadata = parse_cabrillo_header(
+        header={
+            "CALLSIGN": "ef6t",
+            "CATEGORY-OPERATOR": "SINGLE-OP",
+            "CATEGORY-BAND": "ALL",
+            "CATEGORY-POWER": "high\r",
+            "CATEGORY-ASSISTED": "NON-ASSISTED",
+            "CLAIMED-SCORE": "9,123,456",
+            "CLUB": "Catalonia Contest Club",
+            "LOCATION": "DX",
+            "X-QSO": "ignored",
+        }
+    )
+    assert metadata["callsign"] == "EF6T"
+    assert metadata["category_operator"] == "SINGLE-OP"
+    assert metadata["category_power"] == "HIGH"
+    assert metadata["category_assisted"] is False
+    assert metadata["claimed_score"] == 9123456
+    assert metadata["club"] == "Catalonia Contest Club"
+    assert metadata["location"] == "DX"
+    assert metadata["category_overlay"] is None
+    assert "x_qso" not in metadata
+
+
+def test_parse_cabrillo_header_v2():
+    metadata = parse_cabrillo_header(
+        header={"CALLSIGN": "CN3A", "CATEGORY": "SINGLE-OP ASSISTED 20M LOW"}
+    )
+    assert metadata["category_operator"] == "SINGLE-OP"
+    assert metadata["category_band"] == "20M"
+    assert metadata["category_power"] == "LOW"
+    assert metadata["category_assisted"] is True
@@ -0,0 +1,13 @@
+"""Shared test fixtures."""
+import pytest
+
+from hamcontestanalysis.config import get_settings
+
+
+@pytest.fixture
+def storage_prefix(tmp_path, monkeypatch):
+    """Point the storage prefix to a temporary folder."""
+    monkeypatch.setenv("PYCA_STORAGE__PREFIX", str(tmp_path))
+    get_settings.cache_clear()
+    yield tmp_path
+    get_settings.cache_clear()
@@ -0,0 +1,149 @@
+"""Test load cache."""
+import os
+import threading
+import time
+
+import numpy as np
+from pandas import DataFrame
+
+from hamcontestanalysis.data.cache import LoadCache
+from hamcontestanalysis.data.cache import get_load_cache
+from hamcontestanalysis.data.processed_contest_source import ProcessedContestDataset
+from hamcontestanalysis.data.processed_contest_source import ProcessedContestDataSource
+
+
+DATA = DataFrame({"call": ["EA3A", "DL1B"], "band": [20, 40], "points": [1, 3]})
+
+
+def _loader(calls):
+    def load(columns):
+        calls.append(columns)
+        data = DATA if columns is None else DATA.loc[:, columns]
+        return data.assign(year=2022)
+
+    return load
+
+
+def test_load_cache_columns():
+    cache = LoadCache(max_bytes=10**6)
+    calls = []
+    data = cache.get_or_load(key="log", load=_loader(calls), columns=["call"])
+    assert data.columns.tolist() == ["call", "year"]
+    data = cache.get_or_load(key="log", load=_loader(calls), columns=["band", "call"])
+    assert data.columns.tolist() == ["band", "call", "year"]
+    data = cache.get_or_load(key="log", load=_loader(calls), columns=["call"])
+    assert calls == [["call"], ["band"]]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+    data["call"] = "K1AB"
+    data = cache.get_or_load(key="log", load=_loader(calls), columns=["call"])
+    assert data["call"].tolist() == ["EA3A", "DL1B"]
+
+
+def test_load_cache_no_copy():
+    cache = LoadCache(max_bytes=10**6)
+    calls = []
+    data = cache.get_or_load(key="log", load=_loader(calls))
+    cached = cache.get_or_load(key="log", load=_loader(calls))
+    assert len(calls) == 1
+    assert np.shares_memory(data["points"].values, cached["points"].values)
+
+    cached["points"] = 0
+    data = cache.get_or_load(key="log", load=_loader(calls))
+    assert data["points"].tolist() == [1, 3]
+
+
+def test_load_cache_nbytes():
+    cache = LoadCache(max_bytes=10**6)
+    calls = []
+    cache.get_or_load(key="log", load=_loader(calls), columns=["call"])
+    cache.get_or_load(key="log", load=_loader(calls), columns=["band"])
+    data = cache.get_or_load(key="log", load=_loader(calls), columns=["call", "band"])
+    assert cache.nbytes == int(data.memory_usage(deep=True).sum())
+    cache.clear()
+    assert cache.nbytes == 0
+
+
+def test_load_cache_eviction():
+    calls = []
+    nbytes = int(DATA.assign(year=2022).memory_usage(deep=True).sum())
+    cache = LoadCache(max_bytes=2 * nbytes)
+    for key in ["a", "b", "c", "a"]:
+        cache.get_or_load(key=key, load=_loader(calls))
+    assert cache.stats()["evictions"] == 2
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["bytes"] == 2 * nbytes
+    assert len(calls) == 4
+
+
+def _concurrently(*functions):
+    barrier = threading.Barrier(len(functions))
+
+    def run(function):
+        barrier.wait()
+        function()
+
+    threads = [threading.Thread(target=run, args=(f,)) for f in functions]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def _slow_loader(calls):
+    load = _loader(calls)
+
+    def slow_load(columns):
+        time.sleep(0.05)
+        return load(columns)
+
+    return slow_load
+
+
+def test_load_cache_concurrent():
+    cache = LoadCache(max_bytes=10**6)
+    calls = []
+    _concurrently(
+        *[lambda: cache.get_or_load(key="log", load=_slow_loader(calls))] * 4
+    )
+    assert calls == [None]
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 3
+
+    calls = []
+    cache.get_or_load(key="part", load=_loader(calls), columns=["call"])
+    _concurrently(
+        lambda: cache.get_or_load(
+            key="part", load=_slow_loader(calls), columns=["band"]
+        ),
+        lambda: cache.get_or_load(
+            key="part", load=_slow_loader(calls), columns=["points"]
+        ),
+    )
+    data = cache.get_or_load(
+        key="part", load=_loader(calls), columns=["call", "band", "points"]
+    )
+    assert sorted(calls, key=str) == [["band"], ["call"], ["points"]]
+    assert data.columns.tolist() == ["call", "band", "points", "year"]
+    assert cache.stats()["entries"] == 2
+
+
+def test_dataset_load_cached(storage_prefix):
+    path_data = ProcessedContestDataSource(
+        callsign="ef6t", contest="cqww", year=2022, mode="cw"
+    ).path_data
+    os.makedirs(os.path.dirname(path_data))
+    DATA.assign(mycall="EF6T").to_parquet(path_data)
+    dataset = ProcessedContestDataset(
+        contest="cqww", mode="cw", callsigns_years=[("EF6T", 2022)]
+    )
+
+    hits = get_load_cache().stats()["hits"]
+    dataset.load(columns=["call", "band"])
+    dataset.load(columns=["band"])
+    assert get_load_cache().stats()["hits"] == hits + 1
+
+    DATA.assign(mycall="EF6T", band=80).to_parquet(path_data)
+    os.utime(path_data, ns=(0, os.stat(path_data).st_mtime_ns + 10**9))
+    assert dataset.load(columns=["band"])["band"].tolist() == [80, 80]
@@ -0,0 +1,62 @@
+"""Test callsign index of the available logs."""
+import pytest
+from pandas import DataFrame
+
+from hamcontestanalysis.data import callsign_index
+from hamcontestanalysis.data.callsign_index import CallsignIndex
+from hamcontestanalysis.data.callsign_index import get_built_callsign_index
+from hamcontestanalysis.data.callsign_index import get_callsign_index
+from hamcontestanalysis.data.callsign_index import search_logs
+
+
+@pytest.fixture
+def index():
+    return CallsignIndex(
+        options=DataFrame(
+            {
+                "callsign": ["ef6t", "ea3a", "EF6T", "ea3abc", "dl1a", "ea3a", "ef6t"],
+                "year": [2022, 2022, 2021, 2021, 2022, 2021, 2022],
+            }
+        )
+    )
+
+
+def test_callsign_index(index):
+    assert index.available_years == [2022, 2021]
+    assert index.search(prefix="ea3") == [
+        ("ea3a", 2022),
+        ("ea3a", 2021),
+        ("ea3abc", 2021),
+    ]
+    assert index.search(prefix="EF6T") == [("ef6t", 2022), ("EF6T", 2021)]
+    assert index.search(prefix="ea3", years=[2021], limit=1) == [("ea3a", 2021)]
+    assert index.search(prefix="zz") == []
+
+
+def test_search_logs_category(index, monkeypatch):
+    class _Catalog:
+        def list_log_metadata(self, **filters):
+            assert filters["category_operator"] == "SINGLE-OP"
+            return DataFrame({"callsign": ["EA3ABC", "DL1A"], "year": [2021, 2022]})
+
+    monkeypatch.setattr(callsign_index, "get_callsign_index", lambda **_: index)
+    monkeypatch.setattr(callsign_index, "get_catalog", lambda: _Catalog())
+    assert search_logs(
+        contest="cqww", mode="cw", prefix="ea", category_operator="single-op"
+    ) == [("ea3abc", 2021)]
+
+
+def test_get_built_callsign_index(index, monkeypatch, storage_prefix):
+    built = []
+
+    def _build(contest, mode):
+        built.append((contest, mode))
+        return index
+
+    monkeypatch.setattr(callsign_index, "_INDEXES", {})
+    monkeypatch.setattr(callsign_index, "_build_callsign_index", _build)
+    assert get_built_callsign_index(contest="cqww", mode="cw") is None
+    assert get_callsign_index(contest="CQWW", mode="CW") is index
+    assert get_built_callsign_index(contest="cqww", mode="cw") is index
+    assert get_callsign_index(contest="cqww", mode="cw") is index
+    assert built == [("cqww", "cw")]
@@ -0,0 +1,136 @@
+"""Test storage catalog."""
+import os
+
+import pytest
+from pandas import DataFrame
+
+from hamcontestanalysis.data.catalog import StorageCatalog
+from hamcontestanalysis.data.raw_contest_sink import RawCabrilloDataSink
+from hamcontestanalysis.data.raw_contest_sink import RawCabrilloMetaDataSink
+
+
+@pytest.fixture
+def catalog(storage_prefix):
+    return StorageCatalog(path=str(storage_prefix / "catalog.sqlite"))
+
+
+def _push_log(prefix, callsign, year):
+    sink = RawCabrilloDataSink(
+        prefix=str(
+            prefix / f"contest=cqww/mode=cw/year={year}/callsign={callsign}/raw_data"
+        ),
+        partition=dict(
+            contest="cqww",
+            mode="cw",
+            year=year,
+            callsign=callsign,
+            processing_version=1,
+        ),
+    )
+    sink.push(DataFrame({"call": ["EA3A", "DL1B", "K1AB"]}))
+    return sink.path
+
+
+def test_sink_registers_partition(storage_prefix):
+    from hamcontestanalysis.data.catalog import get_catalog
+
+    path = _push_log(storage_prefix, "ef6t", 2022)
+    _push_log(storage_prefix, "cn3a", 2021)
+
+    partitions = get_catalog().list_partitions(
+        kind="contest", contest="cqww", mode="cw", year=2022
+    )
+    assert partitions["path"].tolist() == [path]
+    assert partitions.loc[0, "callsign"] == "ef6t"
+    assert partitions.loc[0, "rows"] == 3
+    assert partitions.loc[0, "bytes"] == os.path.getsize(path)
+    assert partitions.loc[0, "processing_version"] == 1
+    assert get_catalog().contains(path)
+
+
+def test_contains_deleted_partition(storage_prefix):
+    from hamcontestanalysis.data.catalog import get_catalog
+
+    path = _push_log(storage_prefix, "ef6t", 2022)
+    assert get_catalog().contains(path)
+
+    os.remove(path)
+    assert not get_catalog().contains(path)
+    assert get_catalog().list_partitions().empty
+
+
+def test_list_partitions_unknown_key(catalog):
+    with pytest.raises(ValueError):
+        catalog.list_partitions(kind="contest", **{"year = 1 OR 1": 1})
+
+
+def test_sync_and_validate(storage_prefix, catalog):
+    path = storage_prefix / "contest=cqww/mode=cw/year=2022/callsign=ef6t/raw_data"
+    os.makedirs(path)
+    DataFrame({"call": ["EA3A"]}).to_parquet(path / "data.parquet")
+
+    assert catalog.sync(prefix=str(storage_prefix)) == 1
+    partitions = catalog.list_partitions(kind="contest")
+    assert partitions.loc[0, "year"] == 2022
+    assert partitions.loc[0, "callsign"] == "ef6t"
+    assert catalog.validate().empty
+
+    DataFrame({"call": ["EA3A", "DL1B"]}).to_parquet(path / "data.parquet")
+    assert catalog.validate()["problem"].tolist() == ["modified"]
+
+    os.remove(path / "data.parquet")
+    assert catalog.validate()["problem"].tolist() == ["missing"]
+    catalog.sync(prefix=str(storage_prefix))
+    assert catalog.list_partitions().empty
+
+
+def test_register_unknown_key(storage_prefix, catalog):
+    path = str(storage_prefix / "data.parquet")
+    DataFrame({"call": ["EA3A"]}).to_parquet(path)
+    with pytest.raises(ValueError):
+        catalog.register(kind="contest", path=path, band=20)
+
+
+def _push_metadata(prefix, callsign, continent, power):
+    metadata = DataFrame(
+        [
+            {
+                "callsign": callsign.upper(),
+                "category_operator": "SINGLE-OP",
+                "category_band": "ALL",
+                "category_power": power,
+                "category_assisted": False,
+                "claimed_score": 1000,
+                "continent": continent,
+            }
+        ]
+    )
+    sink = RawCabrilloMetaDataSink(
+        prefix=str(
+            prefix / f"contest=cqww/mode=cw/year=2022/callsign={callsign}/raw_metadata"
+        ),
+        partition=dict(contest="cqww", mode="cw", year=2022, callsign=callsign),
+    )
+    sink.push(metadata)
+    return sink.path
+
+
+def test_log_metadata(storage_prefix):
+    from hamcontestanalysis.data.catalog import get_catalog
+
+    _push_metadata(storage_prefix, "ef6t", "EU", "HIGH")
+    _push_metadata(storage_prefix, "cn3a", "AF", "HIGH")
+    path = _push_metadata(storage_prefix, "ea3a", "EU", "LOW")
+
+    logs = get_catalog().list_log_metadata(
+        year=2022, category_operator="SINGLE-OP", category_power="HIGH", continent="EU"
+    )
+    assert logs["callsign"].tolist() == ["ef6t"]
+    assert logs.loc[0, "claimed_score"] == 1000
+    assert not logs.loc[0, "category_assisted"]
+
+    os.remove(path)
+    get_catalog().sync(prefix=str(storage_prefix))
+    assert get_catalog().list_log_metadata(continent="EU")["callsign"].tolist() == [
+        "ef6t"
+    ]
@@ -0,0 +1,30 @@
+"""Test Arrow IPC hot cache."""
+import os
+
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from hamcontestanalysis.data.hot_cache import ensure_hot_cache
+from hamcontestanalysis.data.storage_source import read_arrow_ipc
+
+
+def test_ensure_hot_cache(tmp_path):
+    path_data = str(tmp_path / "data.parquet")
+    data = DataFrame({"call": ["EA3A", "DL1B"], "band": [20, 40]})
+    data.to_parquet(path_data)
+
+    path_cache = ensure_hot_cache(path_data)
+    assert path_cache == str(tmp_path / "data.feather")
+    assert_frame_equal(read_arrow_ipc(path_cache), data)
+    assert_frame_equal(read_arrow_ipc(path_cache, columns=["band"]), data[["band"]])
+
+
+def test_ensure_hot_cache_stale(tmp_path):
+    path_data = str(tmp_path / "data.parquet")
+    DataFrame({"call": ["EA3A"]}).to_parquet(path_data)
+    path_cache = ensure_hot_cache(path_data)
+
+    data = DataFrame({"call": ["EA3A", "DL1B"]})
+    data.to_parquet(path_data)
+    os.utime(path_data, (os.path.getmtime(path_cache) + 1,) * 2)
+    assert_frame_equal(read_arrow_ipc(ensure_hot_cache(path_data)), data)
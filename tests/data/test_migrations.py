@@ -0,0 +1,39 @@
+"""Test migrations of processed contest logs."""
+import os
+
+from pandas import DataFrame
+
+from hamcontestanalysis.data.catalog import get_catalog
+from hamcontestanalysis.data.migrations import LEGACY_PROCESSING_VERSION
+from hamcontestanalysis.data.migrations import MIGRATIONS
+from hamcontestanalysis.data.migrations import PROCESSING_VERSION
+from hamcontestanalysis.data.migrations import read_processing_version
+from hamcontestanalysis.data.migrations import upgrade_all
+from hamcontestanalysis.data.processed_contest_source import ProcessedContestDataSource
+
+
+def test_migrations_registered():
+    versions = range(LEGACY_PROCESSING_VERSION, PROCESSING_VERSION)
+    assert sorted(MIGRATIONS) == list(versions)
+
+
+def test_upgrade_legacy_log(storage_prefix):
+    header = {"CALLSIGN": "EF6T", "CATEGORY-OPERATOR": "SINGLE-OP"}
+    source = ProcessedContestDataSource(
+        callsign="ef6t", contest="cqww", year=2022, mode="cw"
+    )
+    os.makedirs(os.path.dirname(source.path_data))
+    DataFrame(
+        {"call": ["EA3A", "DL1B"], "meta_data": [str(header), str(header)]}
+    ).to_parquet(source.path_data)
+    assert read_processing_version(source.path_data) == LEGACY_PROCESSING_VERSION
+
+    data = source.load()
+    assert data.columns.tolist() == ["call"]
+    assert read_processing_version(source.path_data) == PROCESSING_VERSION
+    partitions = get_catalog().list_partitions(kind="contest")
+    assert partitions["processing_version"].tolist() == [PROCESSING_VERSION]
+    metadata = get_catalog().list_log_metadata(category_operator="SINGLE-OP")
+    assert metadata["callsign"].tolist() == ["ef6t"]
+
+    assert upgrade_all(workers=2) == 0
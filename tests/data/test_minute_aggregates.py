@@ -0,0 +1,27 @@
+"""Test per-minute aggregates storage."""
+import os
+
+from pandas import DataFrame
+from pandas import read_parquet
+
+from hamcontestanalysis.data.minute_aggregates import ensure_minute_aggregates
+
+
+def test_ensure_minute_aggregates(tmp_path):
+    path_data = str(tmp_path / "data.parquet")
+    data = DataFrame(
+        {"mycall": ["EF6T"] * 3, "hour": [0.0, 0.5 / 60, 1.0], "band": [20, 20, 40]}
+    )
+    data.to_parquet(path_data)
+
+    path_aggregates = ensure_minute_aggregates(path_data)
+    assert path_aggregates == str(tmp_path / "minutes.parquet")
+    aggregates = read_parquet(path_aggregates)
+    assert aggregates[["minute", "band", "qsos"]].values.tolist() == [
+        [0, 20, 2],
+        [60, 40, 1],
+    ]
+
+    data.iloc[:1].to_parquet(path_data)
+    os.utime(path_data, (os.path.getmtime(path_aggregates) + 1,) * 2)
+    assert read_parquet(ensure_minute_aggregates(path_data))["qsos"].sum() == 1
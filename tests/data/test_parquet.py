@@ -0,0 +1,79 @@
+"""Test Parquet layout of the stored data sets."""
+from pandas import DataFrame
+from pandas import date_range
+from pandas import read_parquet
+from pyarrow.parquet import ParquetFile
+
+from hamcontestanalysis.config.storage import ParquetProfileSettings
+from hamcontestanalysis.data.parquet import benchmark_profiles
+from hamcontestanalysis.data.parquet import write_parquet
+
+
+def _data():
+    return DataFrame(
+        {
+            "datetime": date_range("2022-11-26", periods=100, freq="1Min")[::-1],
+            "band": [20, 40] * 50,
+            "call": [f"EA{i}A" for i in range(100)],
+        }
+    )
+
+
+def test_write_parquet(tmp_path):
+    path = tmp_path / "data.parquet"
+    profile = ParquetProfileSettings(
+        compression="zstd",
+        compression_level=5,
+        row_group_size=30,
+        sort_by=["datetime", "missing"],
+        use_dictionary=["band"],
+    )
+    write_parquet(data=_data(), path=path, profile=profile, metadata={b"key": "1"})
+
+    parquet_file = ParquetFile(path)
+    assert parquet_file.metadata.num_row_groups == 4
+    column = parquet_file.metadata.row_group(0).column(1)
+    assert column.compression == "ZSTD"
+    assert parquet_file.schema_arrow.metadata[b"key"] == b"1"
+    data = read_parquet(path)
+    assert data["datetime"].is_monotonic_increasing
+    assert data.index.equals(_data().index)
+
+
+def test_write_parquet_row_order(tmp_path):
+    path = tmp_path / "data.parquet"
+    data = DataFrame(
+        {
+            "datetime": date_range("2022-11-26", periods=3, freq="1Min").repeat(2),
+            "call": ["EA3A", "DL1B", "K1AB", "G4C", "OH2D", "JA1E"],
+        }
+    )
+    for sort_by in [["datetime"], ["datetime", "missing"]]:
+        profile = ParquetProfileSettings(sort_by=sort_by)
+        write_parquet(data=data, path=path, profile=profile)
+        assert read_parquet(path)["call"].tolist() == data["call"].tolist()
+
+    profile = ParquetProfileSettings(sort_by=["datetime"])
+    write_parquet(data=data.iloc[::-1], path=path, profile=profile)
+    assert read_parquet(path)["call"].tolist() == [
+        "DL1B",
+        "EA3A",
+        "G4C",
+        "K1AB",
+        "JA1E",
+        "OH2D",
+    ]
+
+
+def test_benchmark_profiles():
+    results = benchmark_profiles(
+        data=_data(),
+        profiles={
+            "default": ParquetProfileSettings(),
+            "zstd": ParquetProfileSettings(compression="zstd", compression_level=9),
+        },
+        repeat=1,
+    )
+    assert results["profile"].tolist() == ["default", "zstd"]
+    assert (results["bytes"] > 0).all()
+    assert (results[["write_s", "read_s"]] > 0).all().all()
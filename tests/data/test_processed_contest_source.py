@@ -0,0 +1,82 @@
+"""Test processed contest data sources."""
+import os
+
+import pytest
+from pandas import DataFrame
+from pandas import to_datetime
+from pyarrow.dataset import field
+
+from hamcontestanalysis.data.processed_contest_source import ProcessedContestDataset
+from hamcontestanalysis.data.processed_contest_source import ProcessedContestDataSource
+
+
+def _store_log(callsign, year, data):
+    path_data = ProcessedContestDataSource(
+        callsign=callsign.lower(), contest="cqww", year=year, mode="cw"
+    ).path_data
+    os.makedirs(os.path.dirname(path_data))
+    data.to_parquet(path_data)
+
+
+@pytest.mark.parametrize("hot_cache", ["true", "false"])
+def test_processed_contest_dataset(storage_prefix, monkeypatch, hot_cache):
+    monkeypatch.setenv("PYCA_STORAGE__HOT_CACHE", hot_cache)
+    log = DataFrame(
+        {
+            "mode": ["CW", "CW"],
+            "call": ["EA3A", "DL1B"],
+            "datetime": to_datetime(["2022-11-26 00:00", "2022-11-26 00:01"]),
+        }
+    )
+    _store_log(callsign="EF6T", year=2021, data=log.assign(mycall="EF6T"))
+    _store_log(callsign="CN3A", year=2022, data=log.assign(mycall="CN3A", qso_points=3))
+
+    dataset = ProcessedContestDataset(
+        contest="cqww", mode="cw", callsigns_years=[("EF6T", 2021), ("CN3A", "2022")]
+    )
+    data = dataset.load()
+    assert len(data) == 4
+    assert data["year"].tolist() == [2021, 2021, 2022, 2022]
+    assert (data["contest"] == "cqww").all()
+    assert (data["mode"] == "CW").all()
+    assert "callsign" not in data.columns
+    assert data["qso_points"].isna().sum() == 2
+
+    data = dataset.load(filters=field("year") == 2022)
+    assert data["mycall"].unique().tolist() == ["CN3A"]
+
+
+def test_processed_contest_dataset_columns(storage_prefix):
+    log = DataFrame({"mycall": ["EF6T"], "call": ["EA3A"], "band": [20]})
+    _store_log(callsign="EF6T", year=2021, data=log)
+
+    data = ProcessedContestDataset(
+        contest="cqww", mode="cw", callsigns_years=[("EF6T", 2021)]
+    ).load(columns=["call", "missing"])
+    assert sorted(data.columns) == ["call", "contest", "year"]
+
+
+@pytest.mark.parametrize("hot_cache", ["true", "false"])
+def test_processed_contest_dataset_types(storage_prefix, monkeypatch, hot_cache):
+    monkeypatch.setenv("PYCA_STORAGE__HOT_CACHE", hot_cache)
+    _store_log(
+        callsign="EF6T",
+        year=2021,
+        data=DataFrame({"mycall": ["EF6T"], "frequency": [14025], "rst": [599]}),
+    )
+    _store_log(
+        callsign="CN3A",
+        year=2022,
+        data=DataFrame({"mycall": ["CN3A"], "frequency": [7012.5], "rst": ["5NN"]}),
+    )
+
+    data = ProcessedContestDataset(
+        contest="cqww", mode="cw", callsigns_years=[("EF6T", 2021), ("CN3A", 2022)]
+    ).load()
+    assert data["frequency"].tolist() == [14025.0, 7012.5]
+    assert data["rst"].tolist() == ["599", "5NN"]
+
+    data = ProcessedContestDataset(
+        contest="cqww", mode="cw", callsigns_years=[("EF6T", 2021), ("CN3A", 2022)]
+    ).load(columns=["frequency"], filters=field("frequency") > 10000)
+    assert data["frequency"].tolist() == [14025.0]
@@ -0,0 +1,43 @@
+"""Test storage data sinks."""
+import os
+
+import pytest
+from pandas import DataFrame
+from pandas import read_parquet
+
+from hamcontestanalysis.data.raw_rbn_sink import RawReverseBeaconDateDataSink
+
+
+def test_push_temporary_files(storage_prefix, monkeypatch):
+    sink = RawReverseBeaconDateDataSink(prefix=str(storage_prefix / "cw"))
+    save = sink.save
+    temporary_paths = []
+
+    def save_and_record(data, file_format, path, **kwargs):
+        temporary_paths.append(path)
+        save(data=data, file_format=file_format, path=path, **kwargs)
+
+    monkeypatch.setattr(sink, "save", save_and_record)
+    sink.push(DataFrame({"dx": ["EF6T"]}))
+    sink.push(DataFrame({"dx": ["CN3A", "EA3A"]}))
+
+    assert len(set(temporary_paths)) == 2
+    assert os.listdir(storage_prefix / "cw") == ["data.parquet"]
+    assert len(read_parquet(sink.path)) == 2
+
+
+def test_push_failure_keeps_previous_file(storage_prefix, monkeypatch):
+    sink = RawReverseBeaconDateDataSink(prefix=str(storage_prefix / "cw"))
+    sink.push(DataFrame({"dx": ["EF6T"]}))
+
+    def save_partially(data, file_format, path, **kwargs):
+        with open(path, "w") as f:
+            f.write("partial")
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(sink, "save", save_partially)
+    with pytest.raises(OSError):
+        sink.push(DataFrame({"dx": ["CN3A"]}))
+
+    assert os.listdir(storage_prefix / "cw") == ["data.parquet"]
+    assert read_parquet(sink.path)["dx"].tolist() == ["EF6T"]
@@ -0,0 +1,52 @@
+"""Test dashboard figure cache."""
+from plotly.graph_objects import Figure
+from plotly.graph_objects import Scatter
+
+from hamcontestanalysis.modules.dashboard.figures import FigureCache
+
+
+class _Plot:
+    def __init__(self, time_bin_size):
+        self.time_bin_size = time_bin_size
+        self._data = None
+
+
+def _figure(y):
+    return Figure(Scatter(x=[0, 1, 2], y=y))
+
+
+def test_figure_cache_key():
+    key = FigureCache.make_key(plot=_Plot(time_bin_size=60), data_key="a")
+    plot = _Plot(time_bin_size=60)
+    plot._data = "loaded"
+    assert FigureCache.make_key(plot=plot, data_key="a") == key
+    assert FigureCache.make_key(plot=plot, data_key="b") != key
+    assert FigureCache.make_key(plot=_Plot(time_bin_size=5), data_key="a") != key
+
+
+def test_figure_cache():
+    cache = FigureCache(max_bytes=10**6)
+    created = []
+
+    def create():
+        created.append(1)
+        return _figure(y=[1, 2, 3])
+
+    figure = cache.get_or_create(key="a", create=create)
+    assert cache.get_or_create(key="a", create=create) == figure
+    assert figure["data"][0]["y"] == [1, 2, 3]
+    assert len(created) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_figure_cache_eviction():
+    size = len(_figure(y=[1, 2, 3]).to_json())
+    cache = FigureCache(max_bytes=2 * size)
+    for key in ["a", "b", "c"]:
+        cache.get_or_create(key=key, create=lambda: _figure(y=[1, 2, 3]))
+    cache.get_or_create(key="a", create=lambda: _figure(y=[1, 2, 3]))
+    stats = cache.stats()
+    assert stats["misses"] == 4
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= 2 * size
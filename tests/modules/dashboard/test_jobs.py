@@ -0,0 +1,45 @@
+"""Test dashboard background download jobs."""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from hamcontestanalysis.modules.dashboard.jobs import DONE
+from hamcontestanalysis.modules.dashboard.jobs import FAILED
+from hamcontestanalysis.modules.dashboard.jobs import DownloadJobs
+from hamcontestanalysis.modules.dashboard.jobs import job_progress
+
+
+def test_download_jobs(tmp_path, monkeypatch):
+    downloaded = []
+
+    def download_contest_data(callsigns, years, contest, mode):
+        if callsigns == ["XX1X"]:
+            raise ValueError("Log not found")
+        downloaded.append((callsigns[0], years[0]))
+
+    download = SimpleNamespace(
+        download_contest_data=download_contest_data,
+        download_rbn_data=lambda **kwargs: None,
+        exists=lambda **kwargs: kwargs["year"] == 2021,
+        exists_rbn=lambda **kwargs: False,
+    )
+    monkeypatch.setitem(
+        sys.modules, "hamcontestanalysis.modules.download.main", download
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        download_jobs = DownloadJobs(folder=str(tmp_path), executor=executor)
+        job_id = download_jobs.submit(
+            contest="cqww",
+            mode="cw",
+            callsigns_years=[("EF6T", 2022), ("CN3A", 2021), ("XX1X", 2022)],
+        )
+    tasks = download_jobs.status(job_id=job_id)
+
+    assert downloaded == [("EF6T", 2022)]
+    assert [t["status"] for t in tasks] == [DONE, DONE, FAILED, DONE, DONE]
+    progress = job_progress(tasks=tasks)
+    assert progress["callsigns_years"] == [("EF6T", 2022), ("CN3A", 2021)]
+    assert progress["rbn_years"] == [2021, 2022]
+    assert progress["finished"] == progress["total"] == 5
+    assert progress["done"]
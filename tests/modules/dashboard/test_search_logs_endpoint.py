@@ -0,0 +1,45 @@
+"""Test endpoint to search the available logs of a contest."""
+import pytest
+from pandas import DataFrame
+
+from hamcontestanalysis.data.callsign_index import CallsignIndex
+from hamcontestanalysis.modules.dashboard import contest_analysis
+
+
+@pytest.fixture
+def client(monkeypatch):
+    index = CallsignIndex(
+        options=DataFrame({"callsign": ["ea3a", "ef6t"], "year": [2022, 2021]})
+    )
+    built = {("cqww", "cw"): index}
+    monkeypatch.setattr(
+        contest_analysis,
+        "get_built_callsign_index",
+        lambda contest, mode: built.get((contest, mode)),
+    )
+    return contest_analysis.create_app().server.test_client()
+
+
+def test_search_logs_endpoint(client):
+    response = client.get("/search-logs?contest=CQWW&mode=cw&q=e&year=2022")
+    assert response.status_code == 200
+    assert response.get_json() == [{"callsign": "ea3a", "year": 2022}]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "contest=nope&mode=cw",
+        "contest=cqww&mode=nope",
+        "contest=cqww&mode=cw&year=last",
+        "contest=cqww&mode=cw&limit=ten",
+        "contest=cqww&mode=cw&limit=-1",
+        "mode=cw",
+    ],
+)
+def test_search_logs_endpoint_bad_request(client, query):
+    assert client.get(f"/search-logs?{query}").status_code == 400
+
+
+def test_search_logs_endpoint_not_built(client):
+    assert client.get("/search-logs?contest=cqww&mode=ssb").status_code == 503
@@ -0,0 +1,50 @@
+"""Test dashboard session data cache."""
+import os
+
+from pandas import DataFrame
+
+from hamcontestanalysis.modules.dashboard.cache import SessionDataCache
+
+
+def test_session_data_cache(tmp_path):
+    data = DataFrame({"call": ["EA3A", "DL1B"], "points": [1, 3]})
+    cache = SessionDataCache(folder=str(tmp_path), max_bytes=10**6)
+    key = SessionDataCache.make_key(
+        contest="cqww", mode="cw", callsigns_years=[("ef6t", 2022), ("CN3A", "2021")]
+    )
+    assert key == SessionDataCache.make_key(
+        contest="cqww", mode="cw", callsigns_years=[("CN3A", 2021), ("EF6T", 2022)]
+    )
+    assert cache.get(key=key, name="contest") is None
+
+    cache.put(key=key, name="contest", data=data)
+    view = cache.get(key=key, name="contest")
+    assert view.equals(data)
+    assert not view["points"].to_numpy().flags.writeable
+    assert cache.get(key=key, name="contest") is view
+    assert (
+        SessionDataCache(folder=str(tmp_path), max_bytes=10**6)
+        .get(key=key, name="contest")
+        .equals(data)
+    )
+
+
+def test_session_data_cache_eviction(tmp_path):
+    data = DataFrame({"points": range(1000)})
+    cache = SessionDataCache(folder=str(tmp_path), max_bytes=12_000)
+    for key in ["a", "b", "c"]:
+        cache.put(key=key, name="contest", data=data)
+    assert cache.get(key="a", name="contest") is None
+    assert cache.get(key="c", name="contest") is not None
+
+
+def test_session_data_cache_recent_keys(tmp_path):
+    data = DataFrame({"points": range(10)})
+    cache = SessionDataCache(folder=str(tmp_path), max_bytes=10**6)
+    for modified, key in enumerate(["a", "b", "c"]):
+        cache.put(key=key, name="contest", data=data)
+        os.utime(tmp_path / key, (modified, modified))
+    assert cache.recent_keys(limit=2) == ["c", "b"]
+
+    cache.warm(key="a")
+    assert cache.recent_keys(limit=1) == ["a"]
@@ -0,0 +1,32 @@
+"""Test dashboard startup timing and prewarm."""
+from hamcontestanalysis.modules.dashboard.startup import StartupTimer
+from hamcontestanalysis.modules.dashboard.startup import prewarm
+
+
+def test_startup_timer():
+    timer = StartupTimer()
+    with timer.phase("layout"):
+        pass
+    report = timer.report()
+    assert list(report) == ["layout", "total"]
+    assert 0 <= report["layout"] <= report["total"]
+
+
+def test_prewarm():
+    warmed = []
+
+    def fail():
+        raise FileNotFoundError("available_callsigns.parquet")
+
+    timer = StartupTimer()
+    thread = prewarm(
+        steps=[("index", fail), ("session data", lambda: warmed.append("a"))],
+        timer=timer,
+    )
+    thread.join(timeout=10)
+    assert warmed == ["a"]
+    assert list(timer.report()) == [
+        "prewarm index",
+        "prewarm session data",
+        "total",
+    ]
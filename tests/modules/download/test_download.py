@@ -0,0 +1,34 @@
+"""Test RBN date range downloads."""
+from datetime import date
+
+import pytest
+
+from hamcontestanalysis.modules.download import main as download
+
+
+def test_download_rbn_dates_failed_days(monkeypatch, caplog):
+    downloaded = []
+
+    def download_rbn_date(rbn_date, modes, force):
+        if rbn_date == date(2022, 11, 27):
+            raise OSError("Connection reset by peer")
+        downloaded.append(rbn_date)
+
+    monkeypatch.setattr(download, "download_rbn_date", download_rbn_date)
+    download.download_rbn_dates(
+        start_date=date(2022, 11, 26), end_date=date(2022, 11, 28), modes=["cw"]
+    )
+
+    assert sorted(downloaded) == [date(2022, 11, 26), date(2022, 11, 28)]
+    assert "1 days failed, run the command again to resume: 2022-11-27" in caplog.text
+
+
+def test_download_rbn_dates_unexpected_error(monkeypatch):
+    def download_rbn_date(rbn_date, modes, force):
+        raise TypeError("Bug")
+
+    monkeypatch.setattr(download, "download_rbn_date", download_rbn_date)
+    with pytest.raises(TypeError):
+        download.download_rbn_dates(
+            start_date=date(2022, 11, 26), end_date=date(2022, 11, 26), modes=["cw"]
+        )
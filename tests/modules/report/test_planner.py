@@ -0,0 +1,65 @@
+"""Test report planner."""
+from concurrent.futures import ThreadPoolExecutor
+
+from pandas import read_parquet
+from plotly.graph_objects import Figure
+
+from hamcontestanalysis.modules.report.planner import Report
+
+
+CALLSIGNS_YEARS = [("EF6T", 2022), ("CR6K", 2022)]
+COMMON = "hamcontestanalysis.plots.common"
+
+
+def _report() -> Report:
+    logs = dict(contest="cqww", mode="cw", callsigns_years=CALLSIGNS_YEARS)
+    return (
+        Report(**logs)
+        .add("rate", "QSO rate", f"{COMMON}.plot_rate", "PlotRate", **logs)
+        .add(
+            "rolling_rate",
+            "QSO rolling rate",
+            f"{COMMON}.plot_rolling_rate",
+            "PlotRollingRate",
+            time_bin_size=60,
+            **logs,
+        )
+        .add(
+            "frequency",
+            "Frequency",
+            f"{COMMON}.plot_frequency",
+            "PlotFrequency",
+            **logs,
+        )
+        .add("missing", "Missing", f"{COMMON}.plot_rate", "PlotMissing", **logs)
+    )
+
+
+def test_plan():
+    assert _report().plan() == {
+        "contest": ["rolling_rate", "frequency"],
+        "aggregates": ["rate"],
+    }
+
+
+def test_load_and_render():
+    data = read_parquet(
+        "tests/resources/plots/common/"
+        "plot_base__get_inputs__ef6t_2022_cr6k_2022.parquet"
+    )
+    report = _report()
+    data_sets = report.load(contest=data)
+
+    assert {"callsign_year", "dummy_datetime", "qsos_rolling_60"} <= set(
+        data_sets["contest"].columns
+    )
+    assert data_sets["aggregates"]["qsos"].sum() == len(data)
+    assert set(report.timings) == {"contest", "aggregates"}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        figures = report.render(data_sets=data_sets, executor=executor)
+    assert list(figures) == ["rate", "rolling_rate", "frequency", "missing"]
+    assert all(isinstance(figures[n], Figure) for n in list(figures)[:3])
+    assert figures["missing"] is None
+    # The plots use the shared data sets, with the columns derived once
+    assert report.plots["rolling_rate"].data is data_sets["contest"]
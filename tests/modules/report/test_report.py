@@ -0,0 +1,53 @@
+"""Test static HTML report."""
+from concurrent.futures import ThreadPoolExecutor
+
+from pandas import read_parquet
+
+from hamcontestanalysis.modules.report.main import PLOTLYJS
+from hamcontestanalysis.modules.report.main import report_items
+from hamcontestanalysis.modules.report.main import write_report
+from hamcontestanalysis.plots.plot_base import add_plot_keys
+
+
+def test_report_items():
+    items = report_items(
+        contest="cqww", mode="cw", callsigns_years=[("EF6T", 2022)], rbn_years=[]
+    )
+    assert {i["data"] for i in items} == {"contest"}
+    items_rbn = report_items(
+        contest="cqww",
+        mode="cw",
+        callsigns_years=[("EF6T", 2022), ("EF6T", 2014)],
+        rbn_years=[2022],
+    )
+    assert len(items_rbn) == len(items) + 4
+    assert items_rbn[-4]["kwargs"]["callsigns_years"] == [("EF6T", 2022)]
+
+
+def test_write_report(storage_prefix):
+    data = add_plot_keys(
+        read_parquet(
+            "tests/resources/plots/common/"
+            "plot_base__get_inputs__ef6t_2022_cr6k_2022.parquet"
+        )
+    )
+    output = storage_prefix / "report"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pages = write_report(
+            contest="cqww",
+            mode="cw",
+            callsigns_years=[("EF6T", 2022), ("CR6K", 2022)],
+            data_contest=data,
+            data_rbn=None,
+            output=str(output),
+            executor=executor,
+        )
+
+    assert pages["rate"] == "rate.html"
+    page = (output / "rate.html").read_text()
+    assert f'src="{PLOTLYJS}"' in page
+    assert len(page) < 10**6
+    assert (output / PLOTLYJS).exists()
+    index = (output / "index.html").read_text()
+    assert '<iframe src="rate.html"' in index
+    assert "EF6T" in index and "Contest score" in index
@@ -3,6 +3,7 @@ import pytest
 from pandas import read_parquet
 from pandas.testing import assert_frame_equal
 
+from hamcontestanalysis.commons.pandas.aggregates import minute_aggregates
 from hamcontestanalysis.plots.common.plot_log_heatmap import PlotLogHeatmap
 from hamcontestanalysis.utils import CONTINENTS
 
@@ -42,13 +43,40 @@ def test_wrong_arguments():
 
 
 def test_prepare_dataframe(mocker, input_data, validation_data):
-    mocker_get_inputs = mocker.patch(
-        "hamcontestanalysis.plots.plot_base.PlotBase._get_inputs",
-        return_value=input_data,
+    mocker_get_aggregates = mocker.patch(
+        "hamcontestanalysis.plots.plot_base.PlotBase._get_aggregates",
+        return_value=minute_aggregates(input_data),
     )
     plot = PlotLogHeatmap(
         contest="cqww", mode="cw", callsigns_years=[("EF6T", 2022), ("CR6K", 2022)]
     )
     df_test = plot._prepare_dataframe()
-    assert mocker_get_inputs.call_count == 1
-    assert_frame_equal(df_test.astype({"calls": str}), validation_data)
+    assert mocker_get_aggregates.call_count == 1
+    assert_frame_equal(df_test, validation_data.drop(columns="calls"))
+
+
+def test_prepare_dataframe_from_data(input_data, validation_data):
+    plot = PlotLogHeatmap(
+        contest="cqww", mode="cw", callsigns_years=[("EF6T", 2022), ("CR6K", 2022)]
+    )
+    plot.data = input_data
+    assert_frame_equal(plot._prepare_dataframe(), validation_data.drop(columns="calls"))
+
+
+def test_calls_index(input_data, validation_data):
+    plot = PlotLogHeatmap(
+        contest="cqww", mode="cw", callsigns_years=[("EF6T", 2022), ("CR6K", 2022)]
+    )
+    plot.data = input_data
+    calls_index = plot.calls_index()
+    for cell in (
+        validation_data.query("qsos > 0").sample(50, random_state=0).itertuples()
+    ):
+        calls = calls_index.calls(
+            callsign_year=cell.callsign_year,
+            contest_hour=cell.contest_hour,
+            contest_minute=cell.contest_minute,
+        )
+        assert len(calls) == len(set(calls))
+        assert str(calls).replace(",", "") == cell.calls
+    assert calls_index.calls("EF6T(2022)", contest_hour=99, contest_minute=0) == []
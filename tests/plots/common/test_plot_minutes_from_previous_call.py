@@ -0,0 +1,31 @@
+"""Test minutes from previous call plot."""
+import os
+
+from pandas import read_parquet
+
+from hamcontestanalysis.data.processed_contest_source import ProcessedContestDataSource
+from hamcontestanalysis.plots.common.plot_minutes_from_previous_call import (
+    PlotMinutesPreviousCall,
+)
+
+
+def test_plot_from_stored_logs(storage_prefix):
+    data = read_parquet(
+        "tests/resources/plots/common/plot_base__get_inputs__ef6t_2022_cr6k_2022.parquet"
+    )
+    for callsign, log in data.drop(columns=["year", "contest"]).groupby("mycall"):
+        path_data = ProcessedContestDataSource(
+            callsign=callsign.lower(), contest="cqww", year=2022, mode="cw"
+        ).path_data
+        os.makedirs(os.path.dirname(path_data))
+        log.to_parquet(path_data)
+
+    plot = PlotMinutesPreviousCall(
+        mode="cw", callsigns_years=[("EF6T", 2022), ("CR6K", 2022)]
+    )
+    fig = plot.plot()
+    assert set(plot.data.columns) <= set(plot.input_columns) | {"contest"}
+    qsos = data.dropna(subset=["minutes_from_previous_call"])
+    assert {trace.name for trace in fig.data} == set(
+        qsos["band_transition_from_previous_call"].unique()
+    )
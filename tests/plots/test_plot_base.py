@@ -0,0 +1,28 @@
+"""Test plot base helpers."""
+import pytest
+from pandas import Timestamp
+from pandas import read_parquet
+from pandas import to_timedelta
+
+from hamcontestanalysis.plots.plot_base import PLOT_KEY_COLUMNS
+from hamcontestanalysis.plots.plot_base import add_plot_keys
+
+
+@pytest.fixture
+def input_data():
+    return read_parquet(
+        "tests/resources/plots/common/plot_base__get_inputs__ef6t_2022_cr6k_2022.parquet"
+    )
+
+
+def test_add_plot_keys(input_data):
+    data = add_plot_keys(data=input_data)
+    assert set(data["callsign_year"]) == {"EF6T(2022)", "CR6K(2022)"}
+    dummy_datetime = Timestamp("2000-01-01") + to_timedelta(data["hour"], "h")
+    assert (data["dummy_datetime"] == dummy_datetime).all()
+    assert not set(PLOT_KEY_COLUMNS) & set(input_data.columns)
+
+
+def test_add_plot_keys_precomputed(input_data):
+    data = add_plot_keys(data=input_data)
+    assert add_plot_keys(data=data) is data
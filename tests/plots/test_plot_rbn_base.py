@@ -0,0 +1,122 @@
+"""Test RBN plot base class."""
+import os
+
+import pytest
+from pandas import DataFrame
+from pandas import date_range
+
+from hamcontestanalysis.data.processed_rbn_source import (
+    ProcessedReverseBeaconCalibrationDataSource,
+)
+from hamcontestanalysis.data.processed_rbn_source import (
+    ProcessedReverseBeaconDataSource,
+)
+from hamcontestanalysis.plots.rbn.plot_number_rbn_spots import PlotNumberRbnSpots
+from hamcontestanalysis.plots.rbn.plot_snr import PlotSnr
+
+
+def _store_rbn(year, data):
+    path_data = ProcessedReverseBeaconDataSource(
+        contest="cqww", year=year, mode="cw"
+    ).path_data
+    os.makedirs(os.path.dirname(path_data))
+    data.to_parquet(path_data)
+
+
+@pytest.fixture
+def rbn_years(storage_prefix):
+    for year in [2021, 2022]:
+        datetimes = date_range(f"{year}-11-26", periods=48, freq="30Min")
+        _store_rbn(
+            year=year,
+            data=DataFrame(
+                {
+                    "callsign": "EA3A",
+                    "dx": ["EF6T", "CR6K"] * 24,
+                    "band": 20,
+                    "db": 20.0,
+                    "de_cont": "EU",
+                    "datetime": datetimes,
+                }
+            ),
+        )
+
+
+def test_out_of_core_matches_in_memory(rbn_years):
+    kwargs = {
+        "contest": "cqww",
+        "mode": "cw",
+        "callsigns_years": [("EF6T", 2022), ("CR6K", 2022), ("EF6T", 2021)],
+        "time_bin_size": 60,
+        "rx_continents": ["EU"],
+    }
+    in_memory = PlotNumberRbnSpots(**kwargs)
+    out_of_core = PlotNumberRbnSpots(**kwargs, out_of_core=True)
+
+    assert len(in_memory.data) == 96
+
+    def counts(plot):
+        return {trace.name: sum(trace.y) for trace in plot.plot().data}
+
+    assert counts(in_memory) == counts(out_of_core)
+    assert counts(in_memory) == {"EF6T(2022)": 24, "CR6K(2022)": 24, "EF6T(2021)": 24}
+
+
+def test_calibrated_snr_without_calibration(rbn_years, caplog):
+    path_data = ProcessedReverseBeaconCalibrationDataSource(
+        contest="cqww", year=2021, mode="cw"
+    ).path_data
+    os.makedirs(os.path.dirname(path_data))
+    DataFrame(
+        {"callsign": ["EA3A"], "band": [20], "offset": [5.0], "n_spots": [48]}
+    ).to_parquet(path_data)
+
+    plot = PlotSnr(
+        contest="cqww",
+        mode="cw",
+        callsigns_years=[("EF6T", 2022), ("EF6T", 2021)],
+        time_bin_size=60,
+        rx_continents=["EU"],
+        calibrated=True,
+    )
+    snr = {trace.name: set(trace.y) for trace in plot.plot().data}
+    assert snr == {"EF6T(2022)": {20.0}, "EF6T(2021)": {15.0}}
+    warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+    assert len(warnings) == 1
+    assert warnings[0].startswith("No RBN calibration for cqww - cw - 2022")
+
+
+def test_hour_of_contest_from_edition_start(storage_prefix, monkeypatch):
+    _store_rbn(
+        year=2022,
+        data=DataFrame(
+            {
+                "dx": "EF6T",
+                "datetime": date_range("2022-11-26", periods=10, freq="6H"),
+            }
+        ),
+    )
+    iter_batches = ProcessedReverseBeaconDataSource.iter_batches
+
+    def iter_small_batches(self, columns=None, filters=None):
+        return iter_batches(self, columns=columns, filters=filters, batch_size=2)
+
+    monkeypatch.setattr(
+        ProcessedReverseBeaconDataSource, "iter_batches", iter_small_batches
+    )
+    plot = PlotNumberRbnSpots(
+        contest="cqww",
+        mode="cw",
+        callsigns_years=[("EF6T", 2022)],
+        time_bin_size=60,
+        rx_continents=["EU"],
+        out_of_core=True,
+    )
+    hours = [plot._hour_of_contest(c)["hour"] for c in plot._iter_inputs()]
+    assert [h.tolist() for h in hours] == [
+        [0.0, 6.0],
+        [12.0, 18.0],
+        [24.0, 30.0],
+        [36.0, 42.0],
+        [48.0, 54.0],
+    ]
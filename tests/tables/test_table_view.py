@@ -0,0 +1,91 @@
+"""Test server-side table view."""
+import pytest
+from pandas import DataFrame
+from pandas import to_datetime
+
+from hamcontestanalysis.tables.table_view import TableView
+from hamcontestanalysis.tables.table_view import parse_filter_query
+
+
+@pytest.fixture
+def view():
+    return TableView(
+        data=DataFrame(
+            {
+                "call": ["EA3A", "DL1B", "EA5C", "K1D", "EA8E"],
+                "frequency": [14010.0, 7010.0, 21010.0, 14020.0, 3510.0],
+                "datetime": to_datetime(
+                    [
+                        "2022-11-26 00:01",
+                        "2022-11-26 00:02",
+                        "2022-11-27 10:00",
+                        "2022-11-27 11:00",
+                        "2022-11-27 12:00",
+                    ]
+                ),
+            }
+        )
+    )
+
+
+def test_parse_filter_query():
+    assert parse_filter_query(
+        '{call} contains "EA" && {frequency} >= 14000 && {band} foo 1'
+    ) == [("call", "contains", "EA"), ("frequency", "ge", "14000")]
+    assert parse_filter_query(None) == []
+
+
+def test_table_view_filter(view):
+    assert view.filter_mask('{call} contains "EA"').tolist() == [
+        True,
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert view.filter_mask("{frequency} > 7010 && {call} icontains ea").sum() == 2
+    assert view.filter_mask("{datetime} datestartswith 2022-11-27").sum() == 3
+    assert view.filter_mask("{frequency} = x").sum() == 0
+
+
+def test_table_view_page(view):
+    records, page_count = view.page(
+        page_current=0,
+        page_size=2,
+        sort_by=[{"column_id": "frequency", "direction": "desc"}],
+        filter_query='{call} contains "EA"',
+    )
+    assert page_count == 2
+    assert [r["call"] for r in records] == ["EA5C", "EA3A"]
+    records, _ = view.page(page_current=1, page_size=2)
+    assert [r["call"] for r in records] == ["EA5C", "K1D"]
+    records, page_count = view.page(
+        page_current=0,
+        page_size=5,
+        sort_by=[
+            {"column_id": "call", "direction": "asc"},
+            {"column_id": "frequency", "direction": "desc"},
+        ],
+    )
+    assert page_count == 1
+    assert [r["call"] for r in records] == ["DL1B", "EA3A", "EA5C", "EA8E", "K1D"]
+
+
+def test_table_view_sort_ties_and_nulls():
+    view = TableView(data=DataFrame({"a": [1, 1, 2, None], "b": list("xyzw"), "c": 0}))
+    for direction, expected in [("asc", "xyzw"), ("desc", "zxyw")]:
+        records, _ = view.page(
+            page_current=0,
+            page_size=4,
+            sort_by=[{"column_id": "a", "direction": direction}],
+        )
+        assert "".join(r["b"] for r in records) == expected
+        records, _ = view.page(
+            page_current=0,
+            page_size=4,
+            sort_by=[
+                {"column_id": "a", "direction": direction},
+                {"column_id": "c", "direction": "asc"},
+            ],
+        )
+        assert "".join(r["b"] for r in records) == expected